@@ -0,0 +1,21 @@
+from fastapi import Request
+from ..services.signup import SignupService
+from ..services.login import LoginService
+from ..services.user_import import UserImportService
+
+# -------------------------------------------------------------
+# Route dependencies
+#
+# Services are built once per worker (see ServiceContainer); these only
+# look them up. They are async so FastAPI calls them inline instead of
+# dispatching each one to its thread pool.
+# -------------------------------------------------------------
+
+async def get_signup_service(request: Request) -> SignupService:
+    return request.app.state.services.signup
+
+async def get_login_service(request: Request) -> LoginService:
+    return request.app.state.services.login
+
+async def get_user_import_service(request: Request) -> UserImportService:
+    return request.app.state.services.user_import
@@ -0,0 +1,123 @@
+import time
+import uuid
+from opentelemetry.trace import SpanKind, StatusCode
+from ..utils.log import log_context
+from ..utils.metrics import HTTP_REQUESTS, HTTP_IN_FLIGHT
+from ..utils.tracing import tracer, tracing_enabled, extract_context, current_trace_id
+
+
+class RequestContextMiddleware:
+    """
+    Pure ASGI middleware that tags every log record of a request with its
+    request_id (taken from X-Request-ID or generated) and echoes it back.
+    """
+
+    HEADER = b"x-request-id"
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            return await self.app(scope, receive, send)
+
+        request_id = None
+        for name, value in scope["headers"]:
+            if name == self.HEADER:
+                request_id = value.decode("latin-1")[:128]
+                break
+        if not request_id:
+            request_id = uuid.uuid4().hex
+
+        async def send_with_request_id(message):
+            if message["type"] == "http.response.start":
+                message.setdefault("headers", [])
+                message["headers"] = [*message["headers"], (self.HEADER, request_id.encode("latin-1"))]
+            await send(message)
+
+        with log_context(request_id=request_id):
+            await self.app(scope, receive, send_with_request_id)
+
+
+class MetricsMiddleware:
+    """
+    Pure ASGI middleware recording rate, latency, status and in-flight
+    count of every HTTP request, labelled by route template (not raw path)
+    to keep the series bounded.
+    """
+
+    # Scraping itself is not recorded
+    SKIP_PATHS = frozenset({"/metrics"})
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["path"] in self.SKIP_PATHS:
+            return await self.app(scope, receive, send)
+
+        status = 500
+        in_flight = HTTP_IN_FLIGHT.labels(scope["method"])
+        in_flight.inc()
+        started = time.perf_counter()
+
+        async def send_with_status(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            in_flight.dec()
+            # Set by the router once matched; unmatched paths share one series
+            route = scope.get("route")
+            HTTP_REQUESTS.labels(scope["method"], getattr(route, "path", "unmatched")).observe(
+                time.perf_counter() - started,
+                str(status)
+            )
+
+
+class TracingMiddleware:
+    """
+    Pure ASGI middleware opening a SERVER span per HTTP request, continuing
+    the caller's trace when it sends a traceparent header. Sampled requests
+    also get the trace_id on every log record.
+    """
+
+    SKIP_PATHS = frozenset({"/metrics"})
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["path"] in self.SKIP_PATHS or not tracing_enabled():
+            return await self.app(scope, receive, send)
+
+        method = scope["method"]
+        carrier = {name.decode("latin-1"): value.decode("latin-1") for name, value in scope["headers"]}
+
+        with tracer.start_as_current_span(
+            f"{method} {scope['path']}",
+            context=extract_context(carrier),
+            kind=SpanKind.SERVER,
+            attributes={"http.request.method": method, "url.path": scope["path"]},
+        ) as span:
+
+            async def send_with_status(message):
+                if message["type"] == "http.response.start":
+                    span.set_attribute("http.response.status_code", message["status"])
+                    if message["status"] >= 500:
+                        span.set_status(StatusCode.ERROR)
+                await send(message)
+
+            try:
+                with log_context(trace_id=current_trace_id()):
+                    await self.app(scope, receive, send_with_status)
+            finally:
+                # Name by route template once the router has matched it
+                route = scope.get("route")
+                if route is not None:
+                    span.update_name(f"{method} {route.path}")
+                    span.set_attribute("http.route", route.path)
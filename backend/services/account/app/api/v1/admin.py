@@ -0,0 +1,38 @@
+import hmac
+from fastapi import APIRouter, Request, Depends, Header, HTTPException, Query, status
+from ...services.user_import import UserImportService, IMPORT_FORMATS
+from ..dependencies import get_user_import_service
+from ...models.response.user_import import UserImportReport
+
+
+async def require_admin(request: Request, x_admin_token: str | None = Header(default=None)):
+    expected = request.app.state.config.admin.token
+    if not expected:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Not Found")
+    if not x_admin_token or not hmac.compare_digest(x_admin_token, expected):
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Invalid admin token")
+
+admin_router = APIRouter(
+    dependencies=[Depends(require_admin)]
+)
+
+@admin_router.post(
+    path="/users/import",
+    response_model=UserImportReport
+)
+async def import_users(
+    request: Request,
+    format: str = Query(default="csv", description=f"One of: {', '.join(IMPORT_FORMATS)}"),
+    user_import_service: UserImportService = Depends(get_user_import_service)
+):
+    """
+    Bulk-imports users from a raw CSV (with a header row) or NDJSON request body
+    with the fields mobile, national_code, birthday (Jalali), first_name, last_name.
+    """
+    if format not in IMPORT_FORMATS:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=f"Unsupported format: {format}")
+
+    try:
+        return await user_import_service.import_users(request.stream(), format)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
@@ -0,0 +1,79 @@
+import jwt
+from fastapi import APIRouter, Request, Depends, HTTPException, status
+from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
+from ...services.login import LoginService, InvalidCredentialsError, InactiveUserError
+from ...models.request.auth import LoginRequest
+from ...models.response.auth import LoginResponse
+from ...models.response.error import ErrorResponse
+from ..dependencies import get_login_service
+from .rate_limit import rate_limit
+
+bearer_scheme = HTTPBearer(auto_error=False)
+
+
+def _unauthorized(detail: str) -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        detail=detail,
+        headers={"WWW-Authenticate": "Bearer"},
+    )
+
+
+async def get_current_claims(
+    request: Request,
+    credentials: HTTPAuthorizationCredentials | None = Depends(bearer_scheme)
+) -> dict:
+    """
+    Authenticates the request's bearer access token and returns its claims.
+    Use as a dependency on any route that requires a signed-in user.
+    """
+    if credentials is None:
+        raise _unauthorized("Not authenticated")
+
+    try:
+        return request.app.state.jwt.verify_access_token(credentials.credentials)
+    except jwt.ExpiredSignatureError:
+        raise _unauthorized("Token expired")
+    except jwt.InvalidTokenError:
+        raise _unauthorized("Invalid token")
+
+
+async def get_current_user_id(claims: dict = Depends(get_current_claims)) -> int:
+    return claims["user_id"]
+
+
+# -------------------------------------------------------------
+# Login
+# -------------------------------------------------------------
+# Documented error bodies; every error shares the ErrorResponse shape
+ERROR_RESPONSES = {
+    status.HTTP_400_BAD_REQUEST: {"model": ErrorResponse},
+    status.HTTP_401_UNAUTHORIZED: {"model": ErrorResponse},
+    status.HTTP_403_FORBIDDEN: {"model": ErrorResponse},
+    status.HTTP_422_UNPROCESSABLE_ENTITY: {"model": ErrorResponse},
+    status.HTTP_429_TOO_MANY_REQUESTS: {"model": ErrorResponse},
+    status.HTTP_503_SERVICE_UNAVAILABLE: {"model": ErrorResponse},
+}
+
+auth_router = APIRouter(
+    responses=ERROR_RESPONSES
+)
+
+@auth_router.post(
+    path="/login",
+    response_model=LoginResponse,
+    dependencies=[Depends(rate_limit("login", per_ip="login_per_ip"))]
+)
+async def login(body: LoginRequest, login_service: LoginService = Depends(get_login_service)):
+    try:
+        return await login_service.login(
+            body.mobile,
+            body.password
+        )
+    except InvalidCredentialsError as e:
+        raise _unauthorized(str(e)) from e
+    except InactiveUserError as e:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=str(e)) from e
+    except ValueError as e:
+        # Malformed mobile number
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e)) from e
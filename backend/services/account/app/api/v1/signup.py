@@ -1,33 +1,64 @@
-from fastapi import APIRouter, Request, Depends
+from fastapi import APIRouter, Depends, HTTPException, status
 from ...services.signup import SignupService
+from ...crud.user import UserAlreadyRegisteredError
 from ...models.request.signup import SignupRequest, SignupVerifyOTP
+from ...models.response.signup import SignupResponse, SignupVerifyResponse
+from ...models.response.error import ErrorResponse
+from ..dependencies import get_signup_service
+from .rate_limit import rate_limit
 
-def get_signup_service(request: Request):
-    return SignupService(
-        request.app.state.db,
-        request.app.state.redis,
-        request.app.state.jwt,
-        request.app.state.identity_validator if hasattr(request.app.state, 'identity_validator') else None
-    )
+# Documented error bodies; every error shares the ErrorResponse shape
+ERROR_RESPONSES = {
+    status.HTTP_400_BAD_REQUEST: {"model": ErrorResponse},
+    status.HTTP_409_CONFLICT: {"model": ErrorResponse},
+    status.HTTP_422_UNPROCESSABLE_ENTITY: {"model": ErrorResponse},
+    status.HTTP_429_TOO_MANY_REQUESTS: {"model": ErrorResponse},
+    status.HTTP_503_SERVICE_UNAVAILABLE: {"model": ErrorResponse},
+}
 
-signup_router = APIRouter()
+def raise_http_error(e: ValueError):
+    if isinstance(e, UserAlreadyRegisteredError):
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e)) from e
+    raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e)) from e
+
+signup_router = APIRouter(
+    responses=ERROR_RESPONSES
+)
 
 @signup_router.post(
-    path="/"
+    path="/",
+    response_model=SignupResponse,
+    dependencies=[Depends(rate_limit(
+        "signup",
+        per_ip="signup_per_ip",
+        per_body={
+            "mobile": "signup_per_mobile",
+            "national_code": "signup_per_national_code",
+        },
+    ))]
 )
 async def signup_request(body: SignupRequest, singup_service: SignupService = Depends(get_signup_service)):
-    return await singup_service.signup_request(
-        body.mobile,
-        body.password,
-        body.national_code,
-        body.birthday,
-    )
+    try:
+        key = await singup_service.signup_request(
+            body.mobile,
+            body.password,
+            body.national_code,
+            body.birthday,
+        )
+    except ValueError as e:
+        raise_http_error(e)
+    return SignupResponse(key=key)
 
 @signup_router.post(
-    path="/verify"
+    path="/verify",
+    response_model=SignupVerifyResponse,
+    dependencies=[Depends(rate_limit("signup_verify", per_ip="verify_per_ip"))]
 )
 async def signup_verify_otp(body: SignupVerifyOTP, singup_service: SignupService = Depends(get_signup_service)):
-    return await singup_service.verify_otp(
-        body.key,
-        body.code
-    )
\ No newline at end of file
+    try:
+        return await singup_service.verify_otp(
+            body.key,
+            body.code
+        )
+    except ValueError as e:
+        raise_http_error(e)
\ No newline at end of file
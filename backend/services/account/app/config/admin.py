@@ -0,0 +1,11 @@
+from ..models.base import ForbidExtraModel
+from pydantic import Field
+
+# -------------------------------------------------------------
+# Admin API Config Schema (Pydantic)
+# -------------------------------------------------------------
+class AdminConfig(ForbidExtraModel):
+    # Sent as X-Admin-Token; admin endpoints are disabled while empty
+    token: str = Field(default="")
+    import_batch_size: int = Field(default=5000, gt=0)
+    import_max_reported: int = Field(default=1000, ge=0)
@@ -8,4 +8,19 @@ class ApiIrConfig(ForbidExtraModel):
     base_url: str = Field(default="https://s.api.ir")
     api_key: str
     timeout_seconds: int = Field(default=30)
+    validation_deadline_seconds: float = Field(default=20)
 
+    # Connection pool
+    http2: bool = Field(default=True)
+    max_connections: int = Field(default=100)
+    max_keepalive_connections: int = Field(default=20)
+    keepalive_expiry_seconds: float = Field(default=30)
+
+    # Retries (idempotent requests only)
+    max_retries: int = Field(default=2)
+    retry_backoff_seconds: float = Field(default=0.2)
+    retry_backoff_max_seconds: float = Field(default=2)
+
+    # Circuit breaker
+    breaker_failure_threshold: int = Field(default=5)
+    breaker_reset_seconds: float = Field(default=30)
@@ -1,4 +1,5 @@
 from ..models.base import ForbidExtraModel
+from pydantic import Field, field_validator
 
 # -------------------------------------------------------------
 # Database Config Schema (Pydantic)
@@ -6,3 +7,28 @@ from ..models.base import ForbidExtraModel
 class DatabaseConfig(ForbidExtraModel):
     url: str
 
+    # Read replicas (comma-separated in DATABASE_REPLICA_URLS); reads go to the
+    # primary when none are configured or all of them are down
+    replica_urls: list[str] = Field(default_factory=list)
+    replica_retry_seconds: float = Field(default=10)  # a replica that failed to connect is skipped this long
+    read_your_writes_seconds: float = Field(default=5)  # changed users are read from the primary this long
+
+    # Connection pool
+    pool_size: int = Field(default=10)
+    max_overflow: int = Field(default=10)
+    pool_timeout_seconds: float = Field(default=5)
+    pool_recycle_seconds: int = Field(default=1800)
+    pool_pre_ping: bool = Field(default=False)
+
+    # asyncpg (PostgreSQL only)
+    statement_cache_size: int = Field(default=256)  # prepared statements per connection; 0 behind pgbouncer
+    statement_timeout_ms: int = Field(default=10_000)  # server-side statement_timeout; 0 disables
+
+    @field_validator("replica_urls", mode="before")
+    @classmethod
+    def split_replica_urls(cls, value):
+        if value is None:
+            return []
+        if isinstance(value, str):
+            return [url.strip() for url in value.split(",") if url.strip()]
+        return value
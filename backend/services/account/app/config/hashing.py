@@ -0,0 +1,12 @@
+from ..models.base import ForbidExtraModel
+from pydantic import Field
+
+# -------------------------------------------------------------
+# Password Hashing Config Schema (Pydantic)
+# -------------------------------------------------------------
+class HashingConfig(ForbidExtraModel):
+    workers: int = Field(default=4, ge=1)
+    max_pending: int = Field(default=64, ge=1)
+
+    # bcrypt cost factor for new hashes; older, cheaper hashes are upgraded on login
+    rounds: int = Field(default=12, ge=4, le=31)
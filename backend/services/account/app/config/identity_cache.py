@@ -0,0 +1,12 @@
+from ..models.base import ForbidExtraModel
+from pydantic import Field
+
+# -------------------------------------------------------------
+# Identity Validation Cache Config Schema (Pydantic)
+# -------------------------------------------------------------
+class IdentityCacheConfig(ForbidExtraModel):
+    enabled: bool = Field(default=True)
+    positive_ttl_seconds: int = Field(default=24 * 60 * 60)
+    negative_ttl_seconds: int = Field(default=5 * 60)
+    local_max_size: int = Field(default=1024)
+    local_ttl_seconds: int = Field(default=60)
@@ -10,6 +10,10 @@ class JWTConfig(ForbidExtraModel):
     access_expires_minutes: int = Field(default=15)
     refresh_expires_days: int = Field(default=30)
 
+    # Per-worker cache of already-verified access tokens (0 disables it)
+    verified_cache_size: int = Field(default=4096)
+    verified_cache_ttl_seconds: int = Field(default=60)
+
     @property
     def algorithm(self):
         return "HS256"
\ No newline at end of file
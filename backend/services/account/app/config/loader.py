@@ -1,12 +1,23 @@
 import os
 import yaml
 from pathlib import Path
+from dotenv import load_dotenv
 from pydantic import BaseModel, ValidationError
 
 from .database import DatabaseConfig
 from .redis import RedisConfig
 from .jwt import JWTConfig
 from .api_ir import ApiIrConfig
+from .hashing import HashingConfig
+from .identity_cache import IdentityCacheConfig
+from .registration_filter import RegistrationFilterConfig
+from .user_cache import UserCacheConfig
+from .rate_limit import RateLimitConfig
+from .login import LoginConfig
+from .admin import AdminConfig
+from .tracing import TracingConfig
+from .outbox import OutboxConfig
+from .server import ServerConfig
 
 # ============================================================
 # Helper: ENV substitution
@@ -66,15 +77,44 @@ def _env_interpolate(value: any) -> any:
 
 class ServiceConfig(BaseModel):
     service: dict
+    server: ServerConfig
     database: DatabaseConfig
     redis: RedisConfig
     jwt: JWTConfig
     api_ir: ApiIrConfig
+    hashing: HashingConfig
+    identity_cache: IdentityCacheConfig
+    registration_filter: RegistrationFilterConfig
+    user_cache: UserCacheConfig
+    rate_limit: RateLimitConfig
+    login: LoginConfig
+    admin: AdminConfig
+    tracing: TracingConfig
+    outbox: OutboxConfig
     logging: dict
 
     class Config:
         validate_assignment = True
 
+# ============================================================
+# .env Loading
+# ============================================================
+def load_env():
+    """
+    Loads backend/services/.env, or the project root .env when that is
+    missing. Every entrypoint (app, serve, migrations) calls this, so they
+    all read the same file.
+    """
+    services_dir = Path(__file__).resolve().parent.parent.parent.parent
+    env_path = services_dir / ".env"
+    if env_path.exists():
+        load_dotenv(env_path)
+    else:
+        # Try loading from project root
+        root_env = services_dir.parent.parent / ".env"
+        if root_env.exists():
+            load_dotenv(root_env)
+
 # ============================================================
 # Loader Function
 # ============================================================
@@ -0,0 +1,11 @@
+from ..models.base import ForbidExtraModel
+from pydantic import Field
+
+# -------------------------------------------------------------
+# Login Lockout Config Schema (Pydantic)
+# -------------------------------------------------------------
+class LoginConfig(ForbidExtraModel):
+    # An account (by normalized mobile) is locked after this many failed
+    # logins, until lockout_seconds after the first of them; 0 disables
+    max_failed_attempts: int = Field(default=5, ge=0)
+    lockout_seconds: int = Field(default=15 * 60, gt=0)
@@ -0,0 +1,28 @@
+from ..models.base import ForbidExtraModel
+from pydantic import Field
+
+# -------------------------------------------------------------
+# Notification Outbox Config Schema (Pydantic)
+# -------------------------------------------------------------
+class OutboxConfig(ForbidExtraModel):
+    # Relay target: the notification service's RabbitMQ queue
+    relay_enabled: bool = Field(default=True)
+    rabbitmq_host: str = Field(default="localhost")
+    rabbitmq_port: int = Field(default=5672)
+    rabbitmq_username: str = Field(default="guest")
+    rabbitmq_password: str = Field(default="guest")
+    queue_name: str = Field(default="notifications")
+
+    # Relay loop
+    batch_size: int = Field(default=100, gt=0)
+    block_ms: int = Field(default=1000, gt=0)
+    claim_idle_seconds: int = Field(default=30, gt=0)
+    retry_backoff_seconds: float = Field(default=0.5, gt=0)
+    retry_backoff_max_seconds: float = Field(default=30, gt=0)
+
+    # Entries beyond this are trimmed (approximately) from the stream
+    stream_max_length: int = Field(default=100_000, gt=0)
+
+    # Message templates; an empty template disables that notification
+    otp_template: str = Field(default="Your verification code: {otp}")
+    welcome_template: str = Field(default="Welcome {first_name}, your account is ready.")
@@ -0,0 +1,28 @@
+from ..models.base import ForbidExtraModel
+from pydantic import Field
+
+# -------------------------------------------------------------
+# Rate Limit Config Schema (Pydantic)
+# -------------------------------------------------------------
+class RateLimitRule(ForbidExtraModel):
+    # 0 disables the rule
+    limit: int = Field(default=0, ge=0)
+    window_seconds: int = Field(default=60, gt=0)
+
+
+class RateLimitConfig(ForbidExtraModel):
+    enabled: bool = Field(default=True)
+
+    # Only enable behind a reverse proxy that sets X-Forwarded-For
+    trust_forwarded_for: bool = Field(default=False)
+
+    # POST /api/v1/signup
+    signup_per_ip: RateLimitRule = Field(default_factory=lambda: RateLimitRule(limit=10, window_seconds=60))
+    signup_per_mobile: RateLimitRule = Field(default_factory=lambda: RateLimitRule(limit=3, window_seconds=600))
+    signup_per_national_code: RateLimitRule = Field(default_factory=lambda: RateLimitRule(limit=3, window_seconds=600))
+
+    # POST /api/v1/signup/verify
+    verify_per_ip: RateLimitRule = Field(default_factory=lambda: RateLimitRule(limit=30, window_seconds=60))
+
+    # POST /api/v1/auth/login (per-account lockout is in LoginConfig)
+    login_per_ip: RateLimitRule = Field(default_factory=lambda: RateLimitRule(limit=60, window_seconds=60))
@@ -0,0 +1,16 @@
+from ..models.base import ForbidExtraModel
+from pydantic import Field
+
+# -------------------------------------------------------------
+# Registration Bloom Filter Config Schema (Pydantic)
+# -------------------------------------------------------------
+class RegistrationFilterConfig(ForbidExtraModel):
+    enabled: bool = Field(default=True)
+    capacity: int = Field(default=1_000_000, gt=0)  # users; each one is two filter items
+    error_rate: float = Field(default=0.001, gt=0, lt=1)
+    rebuild_batch_size: int = Field(default=5000, gt=0)
+
+    # Reject duplicate mobiles / national codes at signup, before identity
+    # validation and hashing. The unique indexes on users enforce uniqueness
+    # either way; without the pre-check a duplicate fails at verify instead.
+    precheck_uniqueness: bool = Field(default=True)
@@ -0,0 +1,24 @@
+import os
+from ..models.base import ForbidExtraModel
+from pydantic import Field
+
+# -------------------------------------------------------------
+# Server Config Schema (Pydantic), read by python -m app.serve
+# -------------------------------------------------------------
+class ServerConfig(ForbidExtraModel):
+    host: str = Field(default="0.0.0.0")
+    port: int = Field(default=8001)
+
+    # Worker processes behind one listening socket; 0 = one per CPU core
+    workers: int = Field(default=1, ge=0)
+    # Each pre-forked worker waits a random 0..N seconds before connecting
+    # to PostgreSQL, Redis and RabbitMQ, so they don't all connect at once
+    startup_jitter_seconds: float = Field(default=2, ge=0)
+
+    backlog: int = Field(default=2048, gt=0)
+    timeout_keep_alive_seconds: int = Field(default=5, gt=0)
+    # Requests are already covered by metrics, traces and request_id logs
+    access_log: bool = Field(default=False)
+
+    def worker_count(self) -> int:
+        return self.workers or os.cpu_count() or 1
@@ -0,0 +1,11 @@
+from ..models.base import ForbidExtraModel
+from pydantic import Field
+
+# -------------------------------------------------------------
+# User Lookup Cache Config Schema (Pydantic)
+# -------------------------------------------------------------
+class UserCacheConfig(ForbidExtraModel):
+    enabled: bool = Field(default=True)
+    ttl_seconds: int = Field(default=5 * 60)
+    local_max_size: int = Field(default=10_000)
+    local_ttl_seconds: int = Field(default=30)
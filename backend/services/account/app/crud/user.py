@@ -1,8 +1,40 @@
 from datetime import date
-from sqlalchemy import select, func
+from typing import TYPE_CHECKING
+from sqlalchemy import select, insert, update, func, or_
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm.attributes import set_committed_value
 from sqlalchemy.ext.asyncio import AsyncSession
 from ..models.db.user import User
 
+if TYPE_CHECKING:
+    from ..services.user_cache import UserCache
+
+
+class UserAlreadyRegisteredError(ValueError):
+    """
+    Raised when an insert hits one of the unique indexes on users.
+    `field` is "mobile" or "national_code".
+    """
+
+    MESSAGES = {
+        "mobile": "This mobile number is already registered",
+        "national_code": "This national code is already registered",
+    }
+
+    def __init__(self, field: str):
+        self.field = field
+        super().__init__(self.MESSAGES[field])
+
+    @classmethod
+    def from_integrity_error(cls, error: IntegrityError) -> "UserAlreadyRegisteredError | None":
+        # The index / column name appears in both the PostgreSQL and SQLite messages
+        message = str(error.orig)
+        if "national_code" in message:
+            return cls("national_code")
+        if "mobile" in message:
+            return cls("mobile")
+        return None
+
 
 class UserCRUD:
 
@@ -51,6 +83,38 @@ class UserCRUD:
         result = await session.execute(stmt)
         return result.scalar_one() > 0
     
+    # ---------------------------------------------------------
+    # Find which of mobile / national code is already registered
+    # ---------------------------------------------------------
+    @staticmethod
+    async def find_registered(
+        session: AsyncSession,
+        *,
+        mobile: str | None = None,
+        national_code: str | None = None
+    ) -> tuple[bool, bool]:
+        """
+        Checks both uniqueness constraints in one indexed query.
+        Pass None for a value that does not need to be checked.
+        Returns (mobile_registered, national_code_registered).
+        """
+        conditions = []
+        if mobile is not None:
+            conditions.append(User.mobile == mobile)
+        if national_code is not None:
+            conditions.append(User.national_code == national_code)
+        if not conditions:
+            return False, False
+
+        stmt = select(User.mobile, User.national_code).where(or_(*conditions)).limit(2)
+        result = await session.execute(stmt)
+        rows = result.all()
+
+        return (
+            mobile is not None and any(row.mobile == mobile for row in rows),
+            national_code is not None and any(row.national_code == national_code for row in rows),
+        )
+
     # ---------------------------------------------------------
     # Create a user
     # ---------------------------------------------------------
@@ -65,31 +129,67 @@ class UserCRUD:
         first_name: str,
         last_name: str
     ) -> User:
-        user = User(
+        """
+        Inserts the user with INSERT ... RETURNING, so generated columns
+        (id, timestamps) come back in the same round trip.
+        Raises UserAlreadyRegisteredError on a unique index violation.
+        """
+        stmt = insert(User).values(
             mobile=mobile,
             national_code=national_code,
             birthday_date=birthday_date,
             password_hash=password_hash,
             first_name=first_name,
             last_name=last_name,
-        )
-        session.add(user)
-        await session.commit()
-        await session.refresh(user)
+        ).returning(User)
+
+        try:
+            user = (await session.scalars(stmt)).one()
+            await session.commit()
+        except IntegrityError as e:
+            await session.rollback()
+            duplicate = UserAlreadyRegisteredError.from_integrity_error(e)
+            if duplicate is None:
+                raise
+            raise duplicate from e
+
         return user
 
     # ---------------------------------------------------------
     # Update user password
     # ---------------------------------------------------------
     @staticmethod
-    async def update_password(session: AsyncSession, user: User, new_hash: str) -> None:
-        user.password_hash = new_hash
+    async def update_password(
+        session: AsyncSession,
+        user: User,
+        new_hash: str,
+        cache: "UserCache | None" = None
+    ) -> None:
+        # UPDATE by id so this also works for detached (cached) users
+        await session.execute(
+            update(User).where(User.id == user.id).values(password_hash=new_hash)
+        )
         await session.commit()
+        set_committed_value(user, "password_hash", new_hash)
+
+        if cache is not None:
+            await cache.invalidate(user)
 
     # ---------------------------------------------------------
     # Activate/deactivate user
     # ---------------------------------------------------------
     @staticmethod
-    async def set_active_status(session: AsyncSession, user: User, is_active: bool) -> None:
-        user.is_active = is_active
+    async def set_active_status(
+        session: AsyncSession,
+        user: User,
+        is_active: bool,
+        cache: "UserCache | None" = None
+    ) -> None:
+        await session.execute(
+            update(User).where(User.id == user.id).values(is_active=is_active)
+        )
         await session.commit()
+        set_committed_value(user, "is_active", is_active)
+
+        if cache is not None:
+            await cache.invalidate(user)
@@ -1,30 +1,35 @@
 import os
+import math
+import random
 import asyncio
-from pathlib import Path
 from contextlib import asynccontextmanager
-from fastapi import FastAPI
-from dotenv import load_dotenv
+from fastapi import FastAPI, Request
+from fastapi.exceptions import RequestValidationError
+from fastapi.responses import ORJSONResponse, Response
+from starlette.exceptions import HTTPException as StarletteHTTPException
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
 
 from .resources.database import DatabaseResource
 from .resources.redis import RedisResource
 from .resources.jwt import JWTResource
 from .resources.api_ir import ApiIrResource
-from .services.identity_validator.api_ir import ApiIrIdentityValidator
+from .resources.hashing import HashingResource, HashingBusyError
+from .services.rate_limiter import RateLimitExceededError
+from .services.container import ServiceContainer
 
 from .api.v1.signup import signup_router
+from .api.v1.auth import auth_router
+from .api.v1.admin import admin_router
 
-from .config.loader import load_service_config
-from .utils.log import Log
+from .api.middleware import RequestContextMiddleware, MetricsMiddleware, TracingMiddleware
+
+from .config.loader import load_service_config, load_env
+from .utils.log import Log, configure_logging, shutdown_logging
+from .utils import metrics
+from .utils.tracing import configure_tracing, shutdown_tracing
 
 # Load environment variables from .env file
-env_path = Path(__file__).resolve().parent.parent.parent / ".env"
-if env_path.exists():
-    load_dotenv(env_path)
-else:
-    # Try loading from project root
-    root_env = Path(__file__).resolve().parent.parent.parent.parent.parent / ".env"
-    if root_env.exists():
-        load_dotenv(root_env)
+load_env()
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
@@ -34,6 +39,17 @@ async def lifespan(app: FastAPI):
     # Load configuration
     # -------------------------------
     config = load_service_config()
+    app.state.config = config
+
+    configure_logging(
+        level=config.logging.get("level", "INFO"),
+        fmt=config.logging.get("format", "json")
+    )
+    configure_tracing(config.tracing, service_version=str(config.service.get("version", "1.0.0")))
+
+    # Pre-forked workers boot together; spread out their connection attempts
+    if config.server.worker_count() > 1 and config.server.startup_jitter_seconds:
+        await asyncio.sleep(random.uniform(0, config.server.startup_jitter_seconds))
 
     # -------------------------------
     # Define Resources
@@ -50,12 +66,16 @@ async def lifespan(app: FastAPI):
     api_ir_resource = ApiIrResource(
         config.api_ir
     )
+    hashing_resource = HashingResource(
+        config.hashing
+    )
 
     resources = (
         db_resource,
         redis_resource,
         jwt_resource,
-        api_ir_resource
+        api_ir_resource,
+        hashing_resource
     )
 
     # Attach running resources to the app state
@@ -63,7 +83,7 @@ async def lifespan(app: FastAPI):
     app.state.redis = redis_resource
     app.state.jwt = jwt_resource
     app.state.api_ir = api_ir_resource
-    app.state.identity_validator = ApiIrIdentityValidator(api_ir_resource)
+    app.state.hashing = hashing_resource
 
     # -------------------------------
     # Initailize consumers safely
@@ -93,6 +113,21 @@ async def lifespan(app: FastAPI):
 
     Log.success("✅ Resources initialized successfully")
 
+    # -------------------------------
+    # Wire services (once per worker)
+    # -------------------------------
+    services = ServiceContainer(
+        config,
+        db_resource,
+        redis_resource,
+        jwt_resource,
+        api_ir_resource,
+        hashing_resource
+    )
+    app.state.services = services
+
+    await services.start()
+
     yield
 
     # -------------------------------
@@ -100,9 +135,14 @@ async def lifespan(app: FastAPI):
     # -------------------------------
     Log.info("🛑 Shutting down...")
 
+    await services.close()
+
     await asyncio.gather(*[r.close() for r in resources])
 
+    shutdown_tracing()
+    metrics.mark_worker_stopped()
     Log.success("👋 Account service shutdown complete.")
+    shutdown_logging()
 
 
 # ---------------------------------------------------------
@@ -113,9 +153,65 @@ app = FastAPI(
     title="Account Service",
     description="",
     version="1.0.0",
-    lifespan=lifespan
+    lifespan=lifespan,
+    # orjson serializes response-model output several times faster than json
+    default_response_class=ORJSONResponse
 )
 
+app.add_middleware(MetricsMiddleware)
+app.add_middleware(TracingMiddleware)
+app.add_middleware(RequestContextMiddleware)
+
+# Every error body is {"detail": ...} (see models/response/error.py)
+@app.exception_handler(StarletteHTTPException)
+async def http_exception_handler(request: Request, exc: StarletteHTTPException):
+    return ORJSONResponse(
+        status_code=exc.status_code,
+        content={"detail": exc.detail},
+        headers=exc.headers,
+    )
+
+@app.exception_handler(RequestValidationError)
+async def validation_exception_handler(request: Request, exc: RequestValidationError):
+    # Field and message only: FastAPI's default body also echoes the
+    # submitted input back, passwords included
+    return ORJSONResponse(
+        status_code=422,
+        content={
+            "detail": "Invalid request",
+            "errors": [
+                {"field": ".".join(str(part) for part in error["loc"]), "message": error["msg"]}
+                for error in exc.errors()
+            ],
+        },
+    )
+
+@app.exception_handler(HashingBusyError)
+async def hashing_busy_handler(request: Request, exc: HashingBusyError):
+    # Shed load instead of queueing more bcrypt work behind a full pool
+    return ORJSONResponse(
+        status_code=503,
+        content={"detail": str(exc)},
+        headers={"Retry-After": "1"},
+    )
+
+@app.exception_handler(RateLimitExceededError)
+async def rate_limit_handler(request: Request, exc: RateLimitExceededError):
+    return ORJSONResponse(
+        status_code=429,
+        content={"detail": str(exc)},
+        headers={"Retry-After": str(max(1, math.ceil(exc.retry_after)))},
+    )
+
+@app.exception_handler(PoolTimeoutError)
+async def db_pool_timeout_handler(request: Request, exc: PoolTimeoutError):
+    # Every pooled connection is busy; fail fast rather than pile up
+    return ORJSONResponse(
+        status_code=503,
+        content={"detail": "Database is busy, try again later"},
+        headers={"Retry-After": "1"},
+    )
+
 @app.get("/health", tags=["health"])
 async def health():
     return {
@@ -123,7 +219,51 @@ async def health():
         "service": "account",
     }
 
+@app.get("/health/database", tags=["health"])
+async def health_database(request: Request):
+    return request.app.state.db.stats()
+
+@app.get("/health/api-ir", tags=["health"])
+async def health_api_ir(request: Request):
+    return request.app.state.api_ir.stats()
+
+@app.get("/health/user-cache", tags=["health"])
+async def health_user_cache(request: Request):
+    return request.app.state.services.user_cache.stats()
+
+@app.get("/health/rate-limit", tags=["health"])
+async def health_rate_limit(request: Request):
+    return request.app.state.services.rate_limiter.stats()
+
+@app.get("/health/outbox", tags=["health"])
+async def health_outbox(request: Request):
+    return await request.app.state.services.outbox.stats()
+
+@app.get("/health/jwt", tags=["health"])
+async def health_jwt(request: Request):
+    return request.app.state.jwt.stats()
+
+@app.get("/health/registration-filter", tags=["health"])
+async def health_registration_filter(request: Request):
+    return await request.app.state.services.registration_filter.stats()
+
+@app.get("/metrics", tags=["health"], include_in_schema=False)
+async def prometheus_metrics():
+    body, content_type = metrics.render()
+    return Response(content=body, media_type=content_type)
+
 app.include_router(
     signup_router,
     prefix="/api/v1/signup"
-)
\ No newline at end of file
+)
+
+app.include_router(
+    auth_router,
+    prefix="/api/v1/auth"
+)
+
+app.include_router(
+    admin_router,
+    prefix="/api/v1/admin",
+    tags=["admin"]
+)
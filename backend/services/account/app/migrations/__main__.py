@@ -0,0 +1,42 @@
+"""
+Out-of-band schema migrations for the account service.
+
+Usage (from backend/services/account):
+    python -m app.migrations upgrade   # apply pending migrations
+    python -m app.migrations status    # print current / latest version
+"""
+import sys
+import asyncio
+import argparse
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from .runner import upgrade, current_version, LATEST_VERSION
+from ..config.loader import load_service_config, load_env
+
+# Load environment variables the same way the service does
+load_env()
+
+
+async def main(command: str) -> int:
+    config = load_service_config()
+    engine = create_async_engine(config.database.url)
+
+    try:
+        if command == "upgrade":
+            await upgrade(engine)
+            return 0
+
+        async with engine.connect() as conn:
+            version = await current_version(conn)
+        print(f"current: {version}, latest: {LATEST_VERSION}")
+        return 0 if version >= LATEST_VERSION else 1
+
+    finally:
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(prog="python -m app.migrations")
+    parser.add_argument("command", choices=("upgrade", "status"))
+    args = parser.parse_args()
+    sys.exit(asyncio.run(main(args.command)))
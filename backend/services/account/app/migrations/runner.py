@@ -0,0 +1,86 @@
+from sqlalchemy import text
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncConnection
+
+from .versions import v0001_initial, v0002_unique_national_code
+from ..utils.log import Log
+
+# -------------------------------------------------------------
+# Registered migrations, in order. Each module exposes
+# VERSION (int), DESCRIPTION (str) and STATEMENTS (tuple of SQL).
+# -------------------------------------------------------------
+MIGRATIONS = (
+    v0001_initial,
+    v0002_unique_national_code,
+)
+
+LATEST_VERSION = MIGRATIONS[-1].VERSION
+
+# Arbitrary constant shared by every process running migrations
+ADVISORY_LOCK_KEY = 0x61636374  # "acct"
+
+_CREATE_VERSION_TABLE = "CREATE TABLE IF NOT EXISTS schema_version (version INTEGER NOT NULL)"
+
+
+async def current_version(conn: AsyncConnection) -> int:
+    """
+    Reads the single schema-version row.
+    Returns 0 for a database that has never been migrated.
+    """
+    try:
+        result = await conn.execute(text("SELECT version FROM schema_version"))
+    except DBAPIError:
+        # schema_version does not exist yet
+        await conn.rollback()
+        return 0
+    return result.scalar_one_or_none() or 0
+
+
+async def upgrade(engine: AsyncEngine) -> int:
+    """
+    Applies every pending migration, each in its own transaction.
+    A PostgreSQL advisory lock makes concurrent runs wait instead of racing.
+    Returns the resulting schema version.
+    """
+    is_postgres = engine.dialect.name == "postgresql"
+
+    async with engine.connect() as conn:
+        if is_postgres:
+            await conn.execute(text("SELECT pg_advisory_lock(:key)"), {"key": ADVISORY_LOCK_KEY})
+            await conn.commit()
+
+        try:
+            await conn.execute(text(_CREATE_VERSION_TABLE))
+            await conn.commit()
+
+            version = await current_version(conn)
+            await conn.commit()
+
+            for migration in MIGRATIONS:
+                if migration.VERSION <= version:
+                    continue
+
+                Log.info(f"[Migrations] applying {migration.VERSION:04d}: {migration.DESCRIPTION}")
+                for statement in migration.STATEMENTS:
+                    await conn.execute(text(statement))
+
+                if version == 0:
+                    await conn.execute(
+                        text("INSERT INTO schema_version (version) VALUES (:version)"),
+                        {"version": migration.VERSION}
+                    )
+                else:
+                    await conn.execute(
+                        text("UPDATE schema_version SET version = :version"),
+                        {"version": migration.VERSION}
+                    )
+                await conn.commit()
+                version = migration.VERSION
+
+        finally:
+            if is_postgres:
+                await conn.execute(text("SELECT pg_advisory_unlock(:key)"), {"key": ADVISORY_LOCK_KEY})
+                await conn.commit()
+
+    Log.success(f"[Migrations] schema is at version {version}")
+    return version
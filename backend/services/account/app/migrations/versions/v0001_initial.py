@@ -0,0 +1,28 @@
+"""
+Initial schema: users table.
+
+Uses IF NOT EXISTS so databases previously created by
+Base.metadata.create_all are adopted as-is.
+"""
+
+VERSION = 1
+DESCRIPTION = "create users table"
+
+STATEMENTS = (
+    """
+    CREATE TABLE IF NOT EXISTS users (
+        id SERIAL PRIMARY KEY,
+        mobile VARCHAR(15) NOT NULL,
+        national_code VARCHAR(10) NOT NULL,
+        birthday_date DATE NOT NULL,
+        first_name VARCHAR(100) NOT NULL,
+        last_name VARCHAR(100) NOT NULL,
+        password_hash VARCHAR NOT NULL,
+        is_active BOOLEAN,
+        created_at TIMESTAMP WITHOUT TIME ZONE DEFAULT now(),
+        updated_at TIMESTAMP WITHOUT TIME ZONE DEFAULT now()
+    )
+    """,
+    "CREATE UNIQUE INDEX IF NOT EXISTS ix_users_mobile ON users (mobile)",
+    "CREATE INDEX IF NOT EXISTS ix_users_national_code ON users (national_code)",
+)
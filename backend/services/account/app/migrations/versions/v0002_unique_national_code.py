@@ -0,0 +1,14 @@
+"""
+Make national_code unique.
+
+Fails if duplicate national codes already exist; those rows have to be
+resolved by hand before upgrading.
+"""
+
+VERSION = 2
+DESCRIPTION = "unique index on users.national_code"
+
+STATEMENTS = (
+    "DROP INDEX IF EXISTS ix_users_national_code",
+    "CREATE UNIQUE INDEX ix_users_national_code ON users (national_code)",
+)
@@ -16,7 +16,7 @@ class User(Base):
     # -----------------------------------------
     # Identity info
     # -----------------------------------------
-    national_code: Mapped[str] = mapped_column(String(10), nullable=False)
+    national_code: Mapped[str] = mapped_column(String(10), nullable=False, unique=True, index=True)
     birthday_date: Mapped[date] = mapped_column(Date, nullable=False)
     first_name: Mapped[str] = mapped_column(String(100), nullable=False)
     last_name: Mapped[str] = mapped_column(String(100), nullable=False)
@@ -0,0 +1,5 @@
+from ..base import ForbidExtraModel
+
+class LoginRequest(ForbidExtraModel):
+    mobile: str
+    password: str
@@ -0,0 +1,7 @@
+from ..base import ForbidExtraModel
+from .signup import UserResponse
+
+class LoginResponse(ForbidExtraModel):
+    user: UserResponse
+    access_token: str
+    refresh_token: str
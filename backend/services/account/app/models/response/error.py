@@ -0,0 +1,10 @@
+from ..base import ForbidExtraModel
+
+class FieldError(ForbidExtraModel):
+    field: str  # dotted location, e.g. "body.mobile"
+    message: str
+
+class ErrorResponse(ForbidExtraModel):
+    detail: str
+    # Only for request validation errors (422)
+    errors: list[FieldError] | None = None
@@ -0,0 +1,24 @@
+from datetime import date, datetime
+from pydantic import ConfigDict
+from ..base import ForbidExtraModel
+
+class SignupResponse(ForbidExtraModel):
+    key: str  # OTP verification key
+
+class UserResponse(ForbidExtraModel):
+    # Read straight from the User row; password_hash is never exposed
+    model_config = ConfigDict(from_attributes=True)
+
+    id: int
+    mobile: str
+    national_code: str
+    birthday_date: date
+    first_name: str
+    last_name: str
+    is_active: bool | None = None
+    created_at: datetime | None = None
+
+class SignupVerifyResponse(ForbidExtraModel):
+    user: UserResponse
+    access_token: str
+    refresh_token: str
@@ -0,0 +1,17 @@
+from ..base import ForbidExtraModel
+
+class ImportRowIssue(ForbidExtraModel):
+    line: int
+    reason: str
+    mobile: str | None = None
+    national_code: str | None = None
+
+class UserImportReport(ForbidExtraModel):
+    received: int = 0
+    inserted: int = 0
+    duplicate_count: int = 0
+    invalid_count: int = 0
+    elapsed_seconds: float = 0
+    # Capped at admin.import_max_reported entries each
+    duplicates: list[ImportRowIssue] = []
+    invalid: list[ImportRowIssue] = []
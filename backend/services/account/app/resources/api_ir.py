@@ -1,8 +1,30 @@
+import time
+import random
+import asyncio
 import httpx
+from opentelemetry.trace import SpanKind, StatusCode
 from .base import ResourceInterface
 from ..config.api_ir import ApiIrConfig
+from ..utils.circuit_breaker import CircuitBreaker
+from ..utils.latency import LatencyStats
+from ..utils.metrics import API_IR_REQUESTS
+from ..utils.tracing import tracer
 from ..utils.log import Log
 
+# Upstream statuses worth retrying (gateway/overload errors)
+RETRYABLE_STATUS_CODES = frozenset({502, 503, 504})
+
+# Transport errors where the request most likely never reached the upstream
+# or the connection was reset under it
+RETRYABLE_EXCEPTIONS = (
+    httpx.ConnectError,
+    httpx.ConnectTimeout,
+    httpx.ReadError,
+    httpx.WriteError,
+    httpx.RemoteProtocolError,
+    httpx.PoolTimeout,
+)
+
 # -------------------------------------------------------------
 # API.IR Resource
 # -------------------------------------------------------------
@@ -11,6 +33,12 @@ class ApiIrResource(ResourceInterface[ApiIrConfig]):
     def __init__(self, settings):
         super().__init__(settings)
         self.client = None
+        self.breaker = CircuitBreaker(
+            name="api_ir",
+            failure_threshold=settings.breaker_failure_threshold,
+            reset_timeout=settings.breaker_reset_seconds,
+        )
+        self.latency: dict[str, LatencyStats] = {}
 
     async def initialize(self):
         # NOTE: Authentication header format may need adjustment based on s.api.ir requirements
@@ -22,6 +50,12 @@ class ApiIrResource(ResourceInterface[ApiIrConfig]):
                 "Content-Type": "application/json",
             },
             timeout=self.settings.timeout_seconds,
+            http2=self.settings.http2,
+            limits=httpx.Limits(
+                max_connections=self.settings.max_connections,
+                max_keepalive_connections=self.settings.max_keepalive_connections,
+                keepalive_expiry=self.settings.keepalive_expiry_seconds,
+            ),
         )
         Log.info("[ApiIrResource] API client initialized successfully.")
 
@@ -30,29 +64,111 @@ class ApiIrResource(ResourceInterface[ApiIrConfig]):
             await self.client.aclose()
             Log.info("[ApiIrResource] API client closed successfully.")
 
-    async def get(self, endpoint: str, params: dict = None):
-        """Make a GET request to the API"""
-        try:
-            response = await self.client.get(endpoint, params=params)
-            response.raise_for_status()
-            return response.json()
-        except httpx.HTTPStatusError as e:
-            Log.error(f"[ApiIrResource] API error: {e.response.status_code} - {e.response.text}")
-            raise
-        except httpx.RequestError as e:
-            Log.error(f"[ApiIrResource] Request error: {e}")
-            raise
-
-    async def post(self, endpoint: str, json: dict = None):
-        """Make a POST request to the API"""
+    # -------------------------------------------------------------
+    # Stats
+    # -------------------------------------------------------------
+    def stats(self) -> dict:
+        return {
+            "circuit_breaker": self.breaker.snapshot(),
+            "endpoints": {
+                endpoint: stats.snapshot() for endpoint, stats in self.latency.items()
+            },
+        }
+
+    def __record(self, endpoint: str, started: float, ok: bool):
+        stats = self.latency.get(endpoint)
+        if stats is None:
+            stats = self.latency[endpoint] = LatencyStats()
+        elapsed = time.perf_counter() - started
+        stats.record(elapsed, ok)
+        API_IR_REQUESTS.labels(endpoint).observe(elapsed, "ok" if ok else "error")
+
+    async def __send(self, method: str, endpoint: str, **kwargs) -> httpx.Response:
+        in_flight = API_IR_REQUESTS.labels(endpoint).in_flight
+        in_flight.inc()
         try:
-            response = await self.client.post(endpoint, json=json)
-            response.raise_for_status()
+            with tracer.start_as_current_span(
+                f"{method} {endpoint}",
+                kind=SpanKind.CLIENT,
+                attributes={"http.request.method": method, "url.path": endpoint, "server.address": "api.ir"},
+            ) as span:
+                response = await self.client.request(method, endpoint, **kwargs)
+                span.set_attribute("http.response.status_code", response.status_code)
+                if response.status_code >= 500:
+                    span.set_status(StatusCode.ERROR)
+                return response
+        finally:
+            in_flight.dec()
+
+    def __backoff(self, attempt: int) -> float:
+        # Exponential backoff with full jitter
+        ceiling = min(
+            self.settings.retry_backoff_max_seconds,
+            self.settings.retry_backoff_seconds * (2 ** attempt)
+        )
+        return random.uniform(0, ceiling)
+
+    # -------------------------------------------------------------
+    # Requests
+    # -------------------------------------------------------------
+    async def _request(self, method: str, endpoint: str, idempotent: bool, **kwargs):
+        attempts = 1 + (self.settings.max_retries if idempotent else 0)
+
+        for attempt in range(attempts):
+            last_attempt = attempt == attempts - 1
+
+            # Fails fast with CircuitOpenError while upstream is unhealthy
+            probe = await self.breaker.before_call()
+
+            started = time.perf_counter()
+            try:
+                response = await self.__send(method, endpoint, **kwargs)
+            except httpx.RequestError as e:
+                self.__record(endpoint, started, ok=False)
+                self.breaker.record_failure()
+
+                if not last_attempt and isinstance(e, RETRYABLE_EXCEPTIONS):
+                    Log.warn(f"[ApiIrResource] {method} {endpoint} failed ({e!r}), retrying")
+                    await asyncio.sleep(self.__backoff(attempt))
+                    continue
+
+                Log.error(f"[ApiIrResource] Request error: {e}")
+                raise
+            except BaseException:
+                # Cancelled (deadline or failed sibling check) or a bug on our side:
+                # no verdict on the upstream, so let another call probe it
+                if probe:
+                    self.breaker.release()
+                raise
+
+            upstream_failed = response.status_code >= 500
+            self.__record(endpoint, started, ok=not upstream_failed)
+
+            if upstream_failed:
+                self.breaker.record_failure()
+                if not last_attempt and response.status_code in RETRYABLE_STATUS_CODES:
+                    Log.warn(f"[ApiIrResource] {method} {endpoint} returned {response.status_code}, retrying")
+                    await asyncio.sleep(self.__backoff(attempt))
+                    continue
+            else:
+                # 4xx still means the upstream is alive and answering
+                self.breaker.record_success()
+
+            try:
+                response.raise_for_status()
+            except httpx.HTTPStatusError as e:
+                Log.error(f"[ApiIrResource] API error: {e.response.status_code} - {e.response.text}")
+                raise
+
             return response.json()
-        except httpx.HTTPStatusError as e:
-            Log.error(f"[ApiIrResource] API error: {e.response.status_code} - {e.response.text}")
-            raise
-        except httpx.RequestError as e:
-            Log.error(f"[ApiIrResource] Request error: {e}")
-            raise
 
+    async def get(self, endpoint: str, params: dict = None):
+        """Make a GET request to the API (retried on transient failures)"""
+        return await self._request("GET", endpoint, idempotent=True, params=params)
+
+    async def post(self, endpoint: str, json: dict = None, idempotent: bool = False):
+        """
+        Make a POST request to the API.
+        Pass idempotent=True for lookups that are safe to retry.
+        """
+        return await self._request("POST", endpoint, idempotent=idempotent, json=json)
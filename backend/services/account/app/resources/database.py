@@ -1,42 +1,313 @@
+import time
+import itertools
+from dataclasses import dataclass
 from contextlib import asynccontextmanager
-from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+from sqlalchemy import event
+from sqlalchemy.engine import make_url
+from sqlalchemy.exc import DBAPIError, TimeoutError as PoolTimeoutError
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine, async_sessionmaker
+from opentelemetry.trace import SpanKind, StatusCode
 from .base import ResourceInterface
 from ..config.database import DatabaseConfig
+from ..utils.latency import LatencyStats
+from ..utils.metrics import DB_QUERIES, DB_CHECKOUT, DB_POOL_CHECKED_OUT, DB_REPLICA_FAILOVERS
 from ..utils.log import Log
-from ..models.db.base import Base
+from ..utils.tracing import tracer
+from ..migrations.runner import current_version, LATEST_VERSION
+
+# Statement kinds reported as metric labels; anything else is "OTHER"
+_STATEMENT_KINDS = frozenset({"SELECT", "INSERT", "UPDATE", "DELETE", "WITH", "CREATE", "DROP", "ALTER"})
+
+
+def _statement_kind(statement: str) -> str:
+    words = statement[:32].split(None, 1)
+    kind = words[0].upper() if words else ""
+    return kind if kind in _STATEMENT_KINDS else "OTHER"
+
+
+# -------------------------------------------------------------
+# Query metrics and spans (SQLAlchemy engine events, on the sync engine)
+# -------------------------------------------------------------
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    kind = _statement_kind(statement)
+    operation = DB_QUERIES.labels(kind)
+    operation.in_flight.inc()
+
+    span = tracer.start_span(
+        kind,
+        kind=SpanKind.CLIENT,
+        attributes={"db.system": conn.dialect.name, "db.operation.name": kind},
+    )
+    if span.is_recording():
+        # Bound parameters are never recorded
+        span.set_attribute("db.query.text", statement[:1024])
+
+    context._instrumentation = (operation, time.perf_counter(), span)
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    operation, started, span = context._instrumentation
+    context._instrumentation = None
+    operation.in_flight.dec()
+    operation.observe(time.perf_counter() - started)
+    span.end()
+
+
+def _handle_error(exception_context):
+    context = exception_context.execution_context
+    tracked = getattr(context, "_instrumentation", None)
+    if tracked is not None:
+        # Errors while fetching results arrive after the statement was recorded
+        context._instrumentation = None
+        operation, started, span = tracked
+        operation.in_flight.dec()
+        operation.observe(time.perf_counter() - started, "error")
+        span.record_exception(exception_context.original_exception)
+        span.set_status(StatusCode.ERROR)
+        span.end()
+
+
+def _listen_pool(engine: AsyncEngine, name: str):
+    # Counted from pool events rather than read from the pool, so the
+    # gauge also works with multi-process metrics
+    checked_out = DB_POOL_CHECKED_OUT.labels(name)
+
+    def checkout(dbapi_connection, connection_record, connection_proxy):
+        checked_out.inc()
+
+    def checkin(dbapi_connection, connection_record):
+        checked_out.dec()
+
+    event.listen(engine.sync_engine.pool, "checkout", checkout)
+    event.listen(engine.sync_engine.pool, "checkin", checkin)
+
+
+@dataclass
+class _Database:
+    """One engine (the primary or a replica) and its session factory."""
+    name: str
+    engine: AsyncEngine
+    session_factory: async_sessionmaker
+    down_until: float = 0.0
+    failures: int = 0
+
 
 # -------------------------------------------------------------
 # Database Manager
+#
+# Writes, and reads that must see them, go to the primary (database.url)
+# through get_write_session(). Other reads use get_read_session(), which
+# picks the replicas round-robin. A replica that fails to connect is
+# skipped for replica_retry_seconds and the read moves on to the next
+# one, then to the primary. Replicas may lag: callers that read back what
+# they just wrote must use the write session, and UserService rereads
+# misses and recently changed users from the primary.
 # -------------------------------------------------------------
 class DatabaseResource(ResourceInterface[DatabaseConfig]):
 
     def __init__(self, settings):
         super().__init__(settings)
-        self.engine = None
-        self.session_factory = None
+        self.primary: _Database | None = None
+        self.replicas: list[_Database] = []
+        self.checkout_wait = LatencyStats()
+        self._next_replica = itertools.count()
 
-    async def initialize(self):
-        self.engine = create_async_engine(
-            self.settings.url,
+    @property
+    def engine(self) -> AsyncEngine | None:
+        return self.primary.engine if self.primary else None
+
+    @property
+    def has_replicas(self) -> bool:
+        return bool(self.replicas)
+
+    def _engine_options(self, url: str) -> dict:
+        url = make_url(url)
+        options = {}
+
+        # SQLite (tests/benchmarks) uses a static/single-thread pool without sizing
+        if url.get_backend_name() != "sqlite":
+            options.update(
+                pool_size=self.settings.pool_size,
+                max_overflow=self.settings.max_overflow,
+                pool_timeout=self.settings.pool_timeout_seconds,
+                pool_recycle=self.settings.pool_recycle_seconds,
+                pool_pre_ping=self.settings.pool_pre_ping,
+            )
+
+        if url.get_driver_name() == "asyncpg":
+            connect_args = {
+                # SQLAlchemy's own prepared statement cache and asyncpg's one
+                "prepared_statement_cache_size": self.settings.statement_cache_size,
+                "statement_cache_size": self.settings.statement_cache_size,
+            }
+            if self.settings.statement_timeout_ms > 0:
+                connect_args["server_settings"] = {
+                    "statement_timeout": str(self.settings.statement_timeout_ms),
+                }
+            options["connect_args"] = connect_args
+
+        return options
+
+    def _create_database(self, name: str, url: str) -> _Database:
+        engine = create_async_engine(
+            url,
             echo=False,
-            future=True
+            future=True,
+            **self._engine_options(url)
         )
-        self.session_factory = async_sessionmaker(
-            bind=self.engine,
+        session_factory = async_sessionmaker(
+            bind=engine,
             expire_on_commit=False,
             autoflush=True
         )
-        async with self.engine.begin() as conn:
-            await conn.run_sync(Base.metadata.create_all)
-            
-        Log.info("[DatabaseResource] initialized successfully.")
+
+        sync_engine = engine.sync_engine
+        event.listen(sync_engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(sync_engine, "after_cursor_execute", _after_cursor_execute)
+        event.listen(sync_engine, "handle_error", _handle_error)
+        _listen_pool(engine, name)
+
+        return _Database(name, engine, session_factory)
+
+    async def initialize(self):
+        self.primary = self._create_database("primary", self.settings.url)
+        self.replicas = [
+            self._create_database(f"replica-{index}", url)
+            for index, url in enumerate(self.settings.replica_urls)
+        ]
+
+        # Schema changes are applied out-of-band (python -m app.migrations upgrade);
+        # startup only reads the single schema-version row (replicas follow the primary)
+        async with self.engine.connect() as conn:
+            version = await current_version(conn)
+
+        if version < LATEST_VERSION:
+            raise RuntimeError(
+                f"Database schema is at version {version}, this build requires {LATEST_VERSION}. "
+                f"Run `python -m app.migrations upgrade` first."
+            )
+        if version > LATEST_VERSION:
+            Log.warn(f"[DatabaseResource] database schema version {version} is newer than this build ({LATEST_VERSION}).")
+
+        Log.info(f"[DatabaseResource] initialized successfully ({len(self.replicas)} read replicas).")
 
     async def close(self):
-        if self.engine:
-            await self.engine.dispose()
-            Log.info("[DatabaseResource] database engine disposed successfully.")
+        for database in self.replicas:
+            await database.engine.dispose()
+        if self.primary:
+            await self.primary.engine.dispose()
+            Log.info("[DatabaseResource] database engines disposed successfully.")
+
+    # -------------------------------------------------------------
+    # Sessions
+    # -------------------------------------------------------------
+    async def _checkout(self, session: AsyncSession, database: _Database):
+        # Check out the connection up front so pool wait time is measured
+        started = time.perf_counter()
+        checkout = DB_CHECKOUT.labels(database.name)
+        checkout.in_flight.inc()
+        try:
+            await session.connection()
+        except PoolTimeoutError:
+            elapsed = time.perf_counter() - started
+            self.checkout_wait.record(elapsed, ok=False)
+            checkout.observe(elapsed, "timeout")
+            raise
+        except Exception:
+            checkout.observe(time.perf_counter() - started, "error")
+            raise
+        finally:
+            checkout.in_flight.dec()
+        elapsed = time.perf_counter() - started
+        self.checkout_wait.record(elapsed)
+        checkout.observe(elapsed)
 
     @asynccontextmanager
-    async def get_session(self):
-        async with self.session_factory() as session:
+    async def get_write_session(self):
+        async with self.primary.session_factory() as session:
+            await self._checkout(session, self.primary)
             yield session
+
+    @asynccontextmanager
+    async def get_read_session(self, *, primary: bool = False):
+        """
+        A session on the next healthy replica, or on the primary when
+        `primary` is set or no replica can be connected to.
+        """
+        if not primary:
+            for replica in self._replica_order():
+                session = replica.session_factory()
+                try:
+                    await self._checkout(session, replica)
+                except PoolTimeoutError:
+                    # Busy, not broken: try the next one without marking it down
+                    await session.close()
+                    continue
+                except (DBAPIError, OSError) as e:
+                    await session.close()
+                    self._mark_down(replica, e)
+                    continue
+
+                async with session:
+                    yield session
+                return
+
+        async with self.get_write_session() as session:
+            yield session
+
+    def _replica_order(self) -> list[_Database]:
+        now = time.monotonic()
+        healthy = [replica for replica in self.replicas if replica.down_until <= now]
+        if not healthy:
+            return []
+        # Rotate over the healthy ones only, so a down replica's share is spread evenly
+        start = next(self._next_replica) % len(healthy)
+        return healthy[start:] + healthy[:start]
+
+    def _mark_down(self, replica: _Database, error: Exception):
+        replica.down_until = time.monotonic() + self.settings.replica_retry_seconds
+        replica.failures += 1
+        DB_REPLICA_FAILOVERS.labels(replica.name).inc()
+        Log.warn(
+            f"[DatabaseResource] {replica.name} unreachable, skipping it for "
+            f"{self.settings.replica_retry_seconds:g}s: {error}",
+            every=10
+        )
+
+    # -------------------------------------------------------------
+    # Stats
+    # -------------------------------------------------------------
+    def _pool_stats(self, database: _Database) -> dict:
+        pool = database.engine.pool
+
+        def read(name: str):
+            fn = getattr(pool, name, None)
+            return fn() if callable(fn) else None
+
+        return {
+            "class": type(pool).__name__,
+            "size": read("size"),
+            "checked_in": read("checkedin"),
+            "checked_out": read("checkedout"),
+            # QueuePool reports overflow as negative until the base pool is exhausted
+            "overflow": max(0, read("overflow")) if read("overflow") is not None else None,
+            "max_overflow": self.settings.max_overflow,
+            "timeout_seconds": self.settings.pool_timeout_seconds,
+        }
+
+    def stats(self) -> dict:
+        now = time.monotonic()
+        return {
+            "pool": self._pool_stats(self.primary) if self.primary else None,
+            "replicas": [
+                {
+                    "name": replica.name,
+                    "healthy": replica.down_until <= now,
+                    "failures": replica.failures,
+                    "pool": self._pool_stats(replica),
+                }
+                for replica in self.replicas
+            ],
+            # errors == checkouts that timed out waiting for a connection
+            "checkout_wait": self.checkout_wait.snapshot(),
+        }
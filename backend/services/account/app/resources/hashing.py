@@ -0,0 +1,81 @@
+import time
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from .base import ResourceInterface
+from ..config.hashing import HashingConfig
+from ..utils.hashing import hash_password, verify_password
+from ..utils.log import Log
+from ..utils.metrics import PASSWORD_HASHING, PASSWORD_HASH_QUEUE_WAIT, PASSWORD_HASH_REJECTED
+from ..utils.tracing import tracer
+
+
+class HashingBusyError(RuntimeError):
+    """
+    Raised when the hashing queue is full and the request should be shed.
+    """
+
+
+# -------------------------------------------------------------
+# Password Hashing Resource
+# -------------------------------------------------------------
+class HashingResource(ResourceInterface[HashingConfig]):
+    """
+    Runs bcrypt off the event loop on a bounded thread pool.
+
+    bcrypt releases the GIL while hashing, so worker threads hash in
+    parallel without the pickling/startup cost of a process pool.
+    At most `max_pending` jobs may be queued or running at once; any
+    call beyond that fails fast with HashingBusyError.
+    """
+
+    def __init__(self, settings):
+        super().__init__(settings)
+        self.executor = None
+        self._pending = 0
+
+    async def initialize(self):
+        self.executor = ThreadPoolExecutor(
+            max_workers=self.settings.workers,
+            thread_name_prefix="bcrypt",
+        )
+        Log.info(f"[HashingResource] executor started with {self.settings.workers} workers.")
+
+    async def close(self):
+        if self.executor:
+            await asyncio.to_thread(self.executor.shutdown, wait=True, cancel_futures=True)
+            Log.info("[HashingResource] executor shut down successfully.")
+
+    @property
+    def pending(self) -> int:
+        return self._pending
+
+    @staticmethod
+    def _timed(operation: str, fn, submitted: float, *args):
+        # Runs on the hashing thread: queue wait and bcrypt time are recorded apart
+        started = time.perf_counter()
+        PASSWORD_HASH_QUEUE_WAIT.observe(started - submitted)
+        with PASSWORD_HASHING.labels(operation).track():
+            return fn(*args)
+
+    async def _run(self, operation: str, fn, *args):
+        # The counter is only touched from the event loop thread, so no lock is needed
+        if self._pending >= self.settings.max_pending:
+            PASSWORD_HASH_REJECTED.inc()
+            raise HashingBusyError("Password hashing queue is full, try again later")
+
+        self._pending += 1
+        try:
+            # The span covers queue wait plus bcrypt, as the request sees it
+            with tracer.start_as_current_span(f"bcrypt {operation}"):
+                loop = asyncio.get_running_loop()
+                return await loop.run_in_executor(
+                    self.executor, self._timed, operation, fn, time.perf_counter(), *args
+                )
+        finally:
+            self._pending -= 1
+
+    async def hash_password(self, password: str) -> str:
+        return await self._run("hash", hash_password, password, self.settings.rounds)
+
+    async def verify_password(self, password: str, hashed: str) -> bool:
+        return await self._run("verify", verify_password, password, hashed)
@@ -1,11 +1,42 @@
+import time
+import hashlib
 from datetime import datetime, timedelta, timezone
 import jwt
 from .base import ResourceInterface
 from ..config.jwt import JWTConfig
+from ..utils.cache import TTLLRUCache
 from ..utils.log import Log
+from ..utils.metrics import JWT_OPERATIONS, JWT_VERIFY_CACHE
+from ..utils.tracing import tracer
+
+ACCESS_TOKEN_TYPE = "access"
+REFRESH_TOKEN_TYPE = "refresh"
+
 
 class JWTResource(ResourceInterface[JWTConfig]):
 
+    def __init__(self, settings):
+        super().__init__(settings)
+
+        # Resolve the algorithm and prepare the key once instead of on every call
+        self._algorithm = jwt.get_algorithm_by_name(settings.algorithm)
+        self._key = self._algorithm.prepare_key(settings.secret)
+        self._codec = jwt.PyJWT()
+
+        # token digest -> verified claims
+        self._verified = TTLLRUCache(
+            maxsize=settings.verified_cache_size,
+            ttl=settings.verified_cache_ttl_seconds
+        )
+        self.cache_hits = 0
+        self.cache_misses = 0
+
+        # Bound once: cache hits take ~2us, so recording must stay a bare inc()
+        self._encode_metrics = JWT_OPERATIONS.labels("encode")
+        self._decode_metrics = JWT_OPERATIONS.labels("decode")
+        self._cache_hit_counter = JWT_VERIFY_CACHE.labels("hit")
+        self._cache_miss_counter = JWT_VERIFY_CACHE.labels("miss")
+
     async def initialize(self):
         """
         no async init needed, but kept for symmetry
@@ -16,36 +47,83 @@ class JWTResource(ResourceInterface[JWTConfig]):
         """
         no async close needed, but kept for symmetry
         """
+        self._verified.clear()
         Log.info(f"[JWTResource] closed successfully.")
 
     def create_access_token(self, payload: dict):
         data = payload.copy()
+        data["type"] = ACCESS_TOKEN_TYPE
         data["exp"] = datetime.now(timezone.utc) + timedelta(
             minutes=self.settings.access_expires_minutes
         )
-        return jwt.encode(
-            data,
-            self.settings.secret,
-            self.settings.algorithm
-        )
+        return self.__encode(data)
 
     def create_refresh_token(self, payload: dict):
         data = payload.copy()
+        data["type"] = REFRESH_TOKEN_TYPE
         data["exp"] = datetime.now(timezone.utc) + timedelta(
             days=self.settings.refresh_expires_days
         )
-        return jwt.encode(
-            data, 
-            self.settings.secret, 
-            self.settings.algorithm
-        )
+        return self.__encode(data)
+
+    def __encode(self, data: dict) -> str:
+        with self._encode_metrics.track(), tracer.start_as_current_span("jwt encode"):
+            return self._codec.encode(
+                data,
+                self._key,
+                self.settings.algorithm
+            )
 
     # -------------------------------------------------------------
     # Decode Token
     # -------------------------------------------------------------
     def decode_token(self, token: str) -> dict:
-        return jwt.decode(
-            jwt=token,
-            key=self.settings.secret,
-            algorithms=["HS256"]
-        )
+        with self._decode_metrics.track(), tracer.start_as_current_span("jwt decode"):
+            return self._codec.decode(
+                jwt=token,
+                key=self._key,
+                algorithms=[self.settings.algorithm],
+                options={"require": ["exp"]}
+            )
+
+    def verify_access_token(self, token: str) -> dict:
+        """
+        Verifies an access token and returns its claims.
+
+        Tokens that were already verified are served from a bounded
+        per-worker LRU keyed by the token digest, for at most
+        verified_cache_ttl_seconds and never past the token's own `exp`.
+        The returned claims are shared between callers; do not mutate them.
+
+        Raises jwt.InvalidTokenError for invalid, expired or non-access tokens.
+        """
+        digest = hashlib.sha256(token.encode("utf-8")).digest()
+
+        claims = self._verified.get(digest)
+        if claims is not None and claims["exp"] > time.time():
+            self.cache_hits += 1
+            self._cache_hit_counter.inc()
+            return claims
+
+        self.cache_misses += 1
+        self._cache_miss_counter.inc()
+        claims = self.decode_token(token)
+
+        if claims.get("type") != ACCESS_TOKEN_TYPE:
+            raise jwt.InvalidTokenError("Not an access token")
+
+        self._verified.set(digest, claims, ttl=claims["exp"] - time.time())
+        return claims
+
+    # -------------------------------------------------------------
+    # Stats
+    # -------------------------------------------------------------
+    def stats(self) -> dict:
+        return {
+            "verified_cache": {
+                "size": len(self._verified),
+                "max_size": self.settings.verified_cache_size,
+                "hits": self.cache_hits,
+                "misses": self.cache_misses,
+            },
+        }
@@ -1,7 +1,55 @@
 import redis.asyncio as redis
+from redis.asyncio.client import Pipeline
+from opentelemetry.trace import SpanKind
 from .base import ResourceInterface
 from ..config.redis import RedisConfig
 from ..utils.log import Log
+from ..utils.metrics import REDIS_COMMANDS
+from ..utils.tracing import tracer
+
+
+class _InstrumentedPipeline(Pipeline):
+    """Pipeline recorded as a single PIPELINE round trip on execute()."""
+
+    async def execute(self, raise_on_error: bool = True):
+        with (
+            REDIS_COMMANDS.labels("PIPELINE").track(),
+            tracer.start_as_current_span(
+                "PIPELINE",
+                kind=SpanKind.CLIENT,
+                attributes={"db.system": "redis", "db.operation.batch.size": len(self.command_stack)},
+            ),
+        ):
+            return await super().execute(raise_on_error)
+
+
+class _InstrumentedRedis(redis.Redis):
+    """
+    Redis client recording latency, errors and in-flight count per command
+    (scripts show up as EVALSHA), with a CLIENT span per command. Pub/sub
+    connections are not recorded.
+    """
+
+    async def execute_command(self, *args, **options):
+        command = str(args[0]).upper()
+        with (
+            REDIS_COMMANDS.labels(command).track(),
+            tracer.start_as_current_span(
+                command,
+                kind=SpanKind.CLIENT,
+                attributes={"db.system": "redis"},
+            ),
+        ):
+            return await super().execute_command(*args, **options)
+
+    def pipeline(self, transaction: bool = True, shard_hint: str | None = None) -> Pipeline:
+        return _InstrumentedPipeline(
+            self.connection_pool,
+            self.response_callbacks,
+            transaction,
+            shard_hint
+        )
+
 
 class RedisResource(ResourceInterface[RedisConfig]):
 
@@ -10,7 +58,7 @@ class RedisResource(ResourceInterface[RedisConfig]):
         self.client = None
 
     async def initialize(self):
-        self.client = redis.from_url(
+        self.client = _InstrumentedRedis.from_url(
             self.settings.url,
             db=self.settings.db,
             decode_responses=True
@@ -0,0 +1,66 @@
+"""
+Production entrypoint for the account service.
+
+Runs the app under uvicorn with uvloop and httptools when they are
+installed (they come with uvicorn[standard]). With server.workers > 1 the
+master binds the port once and pre-forks that many workers sharing the
+socket. It restarts any worker that dies. Each worker runs its own
+lifespan, after a random startup delay (server.startup_jitter_seconds).
+
+Usage (from backend/services/account):
+    SERVER_WORKERS=16 python -m app.serve
+"""
+import os
+import glob
+import tempfile
+import importlib.util
+
+import uvicorn
+
+from .config.loader import load_service_config, load_env
+
+# Load environment variables the same way the service does
+load_env()
+
+
+def _installed(module: str) -> bool:
+    return importlib.util.find_spec(module) is not None
+
+
+def prepare_multiprocess_metrics():
+    """
+    Points prometheus_client at a shared directory, so GET /metrics on any
+    worker reports the sum over all of them. Must run before the workers
+    import prometheus_client; the directory is emptied of earlier runs.
+    """
+    directory = os.environ.get("PROMETHEUS_MULTIPROC_DIR")
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+        for path in glob.glob(os.path.join(directory, "*.db")):
+            os.remove(path)
+    else:
+        os.environ["PROMETHEUS_MULTIPROC_DIR"] = tempfile.mkdtemp(prefix="account-metrics-")
+
+
+def main():
+    settings = load_service_config().server
+    workers = settings.worker_count()
+
+    if workers > 1:
+        prepare_multiprocess_metrics()
+
+    uvicorn.run(
+        "app.main:app",
+        host=settings.host,
+        port=settings.port,
+        workers=workers,
+        loop="uvloop" if _installed("uvloop") else "asyncio",
+        http="httptools" if _installed("httptools") else "h11",
+        backlog=settings.backlog,
+        timeout_keep_alive=settings.timeout_keep_alive_seconds,
+        access_log=settings.access_log,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+from ..config.loader import ServiceConfig
+from ..resources.database import DatabaseResource
+from ..resources.redis import RedisResource
+from ..resources.jwt import JWTResource
+from ..resources.api_ir import ApiIrResource
+from ..resources.hashing import HashingResource
+from .identity_validator.base import IdentityValidatorInterface
+from .identity_validator.api_ir import ApiIrIdentityValidator
+from .identity_validator.cached import CachedIdentityValidator
+from .registration_filter import RegistrationFilter
+from .rate_limiter import RateLimiter
+from .user_cache import UserCache
+from .users import UserService
+from .user_import import UserImportService
+from .outbox import NotificationOutbox
+from .signup import SignupService
+from .login import LoginService
+
+
+class ServiceContainer:
+    """
+    Every service of a worker, wired once in the lifespan from the
+    initialized resources and shared by all requests.
+
+    Routes get them through the dependencies in api/dependencies.py, which
+    only read an attribute: nothing is constructed per request.
+    """
+
+    def __init__(
+        self,
+        config: ServiceConfig,
+        db: DatabaseResource,
+        redis: RedisResource,
+        jwt: JWTResource,
+        api_ir: ApiIrResource,
+        hashing: HashingResource
+    ):
+        # bcrypt runs on the hashing resource's thread pool
+        self.hashing = hashing
+
+        identity_validator: IdentityValidatorInterface = ApiIrIdentityValidator(api_ir)
+        if config.identity_cache.enabled:
+            identity_validator = CachedIdentityValidator(
+                identity_validator,
+                redis,
+                config.identity_cache
+            )
+        self.identity_validator = identity_validator
+
+        self.registration_filter = RegistrationFilter(
+            db,
+            redis,
+            config.registration_filter
+        )
+        self.user_cache = UserCache(
+            redis,
+            config.user_cache,
+            changed_ttl=config.database.read_your_writes_seconds if config.database.replica_urls else 0
+        )
+        self.users = UserService(db, self.user_cache)
+        self.outbox = NotificationOutbox(
+            redis,
+            config.outbox
+        )
+        self.rate_limiter = RateLimiter(
+            redis,
+            config.rate_limit
+        )
+
+        self.signup = SignupService(
+            db,
+            redis,
+            jwt,
+            hashing,
+            identity_validator,
+            self.registration_filter,
+            self.outbox,
+            precheck_uniqueness=config.registration_filter.precheck_uniqueness
+        )
+        self.login = LoginService(
+            self.users,
+            redis,
+            jwt,
+            hashing,
+            config.login
+        )
+        self.user_import = UserImportService(
+            db,
+            self.registration_filter,
+            config.admin
+        )
+
+    async def start(self):
+        # Warm the registration filter (rebuilds in the background if needed)
+        await self.registration_filter.start()
+
+        # Subscribe to cross-worker user cache invalidations
+        await self.user_cache.start()
+
+        # Relay queued notifications to RabbitMQ (connects in the background)
+        await self.outbox.start()
+
+        # Dummy hash for constant-time logins of unknown mobiles
+        await self.login.start()
+
+    async def close(self):
+        await self.registration_filter.close()
+        await self.user_cache.close()
+        await self.outbox.close()
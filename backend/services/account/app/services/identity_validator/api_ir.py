@@ -1,5 +1,6 @@
+import asyncio
 from datetime import date
-from .base import IdentityValidatorInterface
+from .base import IdentityValidatorInterface, IdentityRejectedError
 from ...models.identity_info import IdentityInfo
 from ...resources.api_ir import ApiIrResource
 from ...enum.gender import Gender
@@ -25,6 +26,64 @@ class ApiIrIdentityValidator(IdentityValidatorInterface):
             return f"0{mobile}"
         return mobile
 
+    async def __check_mobile_ownership(self, national_code: str, formatted_mobile: str) -> None:
+        """Checks that the mobile number belongs to this person (ShahkarLite)."""
+        mobile_check_response = await self.api.post(
+            "/api/sw1/ShahkarLite",
+            json={
+                "nationalCode": national_code,
+                "mobile": formatted_mobile,
+            },
+            idempotent=True
+        )
+
+        if not mobile_check_response.get("success", False):
+            raise IdentityRejectedError(
+                mobile_check_response.get("message", "Mobile number does not belong to this person")
+            )
+
+    async def __fetch_person_info(self, national_code: str, birthday_jalali: str) -> IdentityInfo:
+        """Validates national code and birthday and retrieves personal information (PersonInfo)."""
+        identity_response = await self.api.post(
+            "/api/sw1/PersonInfo",
+            json={
+                "nationalCode": national_code,
+                "birthDate": birthday_jalali,
+            },
+            idempotent=True
+        )
+
+        if not identity_response.get("success", False):
+            error_msg = identity_response.get("message", "Identity validation failed")
+            raise IdentityRejectedError(f"Identity validation failed: {error_msg}")
+
+        # Extract name and gender from response
+        personal_data = identity_response.get("data")
+        if not isinstance(personal_data, dict):
+            raise ValueError("Could not retrieve personal data from API")
+
+        if not personal_data.get("alive"):
+            raise IdentityRejectedError("Identity validation failed: Person is not alive")
+
+        first_name = personal_data.get("firstName")
+        last_name = personal_data.get("lastName")
+
+        # Map gender from API response
+        gender_int = personal_data.get("gender", 1)
+        if gender_int == 1:
+            gender = Gender.MALE
+        else:
+            gender = Gender.FEMALE
+
+        if not first_name or not last_name:
+            raise ValueError("Could not retrieve personal information from API")
+
+        return IdentityInfo(
+            first_name=first_name,
+            last_name=last_name,
+            gender=gender
+        )
+
     async def validate_identity(
         self,
         national_code: str,
@@ -34,9 +93,13 @@ class ApiIrIdentityValidator(IdentityValidatorInterface):
         """
         Validates identity using s.api.ir service.
         
-        This implementation:
+        This implementation runs both checks concurrently:
         1. Checks if mobile number belongs to the person
         2. Validates national code and birthday, and retrieves personal information
+
+        As soon as one check fails the other request is cancelled, and the
+        whole validation is bounded by `validation_deadline_seconds`
+        (independent of the per-request httpx timeout).
         
         Args:
             national_code: 10-digit Iranian national code
@@ -47,7 +110,8 @@ class ApiIrIdentityValidator(IdentityValidatorInterface):
             IdentityInfo with first_name, last_name, and gender
             
         Raises:
-            ValueError: If validation fails
+            IdentityRejectedError: If s.api.ir rejects the identity
+            ValueError: If validation fails for any other reason
         """
         try:
             # Convert birthday to Jalali format for API
@@ -57,65 +121,32 @@ class ApiIrIdentityValidator(IdentityValidatorInterface):
             # NOTE: Endpoint paths and request/response formats may need adjustment
             # based on the actual s.api.ir API documentation at https://s.api.ir/swagger/index.html
 
-            # Step 1: Check if mobile number belongs to this person
-            mobile_check_response = await self.api.post(
-                "/api/sw1/ShahkarLite",
-                json={
-                    "nationalCode": national_code,
-                    "mobile": formatted_mobile,
-                }
-            )
-
-            if not mobile_check_response.get("success", False):
-                raise ValueError(
-                    mobile_check_response.get("message", "Mobile number does not belong to this person")
-                )
-
-            # Step 2: Validate national code and birthday
-            identity_response = await self.api.post(
-                "/api/sw1/PersonInfo",
-                json={
-                    "nationalCode": national_code,
-                    "birthDate": birthday_jalali,
-                }
-            )
-
-            if not identity_response.get("success", False):
-                error_msg = identity_response.get("message", "Identity validation failed")
-                raise ValueError(f"Identity validation failed: {error_msg}")
+            async with asyncio.timeout(self.api.settings.validation_deadline_seconds):
+                # A failing task makes the TaskGroup cancel its sibling
+                async with asyncio.TaskGroup() as tg:
+                    tg.create_task(self.__check_mobile_ownership(national_code, formatted_mobile))
+                    person_task = tg.create_task(self.__fetch_person_info(national_code, birthday_jalali))
 
-            # Extract name and gender from response
-            personal_data = identity_response.get("data")
-            if not isinstance(personal_data, dict):
-                raise ValueError("Could not retrieve personal data from API")
+            identity_info = person_task.result()
 
-            if not personal_data.get("alive"):
-                raise ValueError("Identity validation failed: Person is not alive")
-
-            first_name = personal_data.get("firstName")
-            last_name = personal_data.get("lastName")
-           
-            # Map gender from API response
-            gender_int = personal_data.get("gender", 1)
-            if gender_int == 1:
-                gender = Gender.MALE
-            else:
-                gender = Gender.FEMALE
+            Log.info(f"[ApiIrIdentityValidator] Successfully validated identity for national_code: {national_code}")
 
-            if not first_name or not last_name:
-                raise ValueError("Could not retrieve personal information from API")
+            return identity_info
 
-            Log.info(f"[ApiIrIdentityValidator] Successfully validated identity for national_code: {national_code}")
+        except TimeoutError:
+            Log.error(f"[ApiIrIdentityValidator] Identity validation timed out for national_code: {national_code}")
+            raise ValueError("Identity validation failed: s.api.ir did not respond in time")
 
-            return IdentityInfo(
-                first_name=first_name,
-                last_name=last_name,
-                gender=gender
-            )
+        except ExceptionGroup as eg:
+            # The first failure is the one that triggered cancellation of the sibling check
+            e = eg.exceptions[0]
+            if isinstance(e, ValueError):
+                raise e from None
+            Log.error(f"[ApiIrIdentityValidator] Error validating identity: {e}")
+            raise ValueError(f"Identity validation failed: {str(e)}")
 
         except Exception as e:
             if isinstance(e, ValueError):
                 raise
             Log.error(f"[ApiIrIdentityValidator] Error validating identity: {e}")
             raise ValueError(f"Identity validation failed: {str(e)}")
-
@@ -2,6 +2,15 @@ from abc import ABC, abstractmethod
 from datetime import date
 from ...models.identity_info import IdentityInfo
 
+
+class IdentityRejectedError(ValueError):
+    """
+    Raised when the upstream service gave a definitive negative answer
+    (e.g. mobile does not belong to the person), as opposed to a
+    transient failure such as a timeout or a network error.
+    """
+
+
 class IdentityValidatorInterface(ABC):
     """
     Abstract interface for identity validation service.
@@ -30,7 +39,8 @@ class IdentityValidatorInterface(ABC):
             IdentityInfo with first_name, last_name, and is_valid=True if all checks pass
 
         Raises:
-            ValueError: If validation fails (invalid national code, wrong birthday, 
-                       mobile doesn't match, etc.)
+            IdentityRejectedError: If the identity was definitively rejected
+                       (invalid national code, wrong birthday, mobile doesn't match, etc.)
+            ValueError: If validation could not be completed
         """
         pass
\ No newline at end of file
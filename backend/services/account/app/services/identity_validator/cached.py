@@ -0,0 +1,112 @@
+import json
+import hashlib
+from datetime import date
+from redis.exceptions import RedisError
+
+from .base import IdentityValidatorInterface, IdentityRejectedError
+from ...config.identity_cache import IdentityCacheConfig
+from ...models.identity_info import IdentityInfo
+from ...resources.redis import RedisResource
+from ...utils.cache import TTLLRUCache
+from ...utils.singleflight import SingleFlight
+from ...utils.log import Log
+
+
+class CachedIdentityValidator(IdentityValidatorInterface):
+    """
+    Caching decorator for any IdentityValidatorInterface.
+
+    Lookup order:
+        1. In-process LRU (per worker, short TTL)
+        2. Redis (shared by all workers, separate TTLs for accepted/rejected identities)
+        3. The wrapped validator, with concurrent identical lookups collapsed into one call
+
+    Only definitive answers are cached; transient failures (timeouts,
+    network errors, ...) always propagate uncached.
+    """
+
+    CACHE_PREFIX = "identity:"
+
+    def __init__(
+        self,
+        inner: IdentityValidatorInterface,
+        redis: RedisResource,
+        settings: IdentityCacheConfig
+    ):
+        self.inner = inner
+        self.redis = redis
+        self.settings = settings
+        self._local = TTLLRUCache(
+            maxsize=settings.local_max_size,
+            ttl=settings.local_ttl_seconds
+        )
+        self._inflight = SingleFlight()
+
+    def __cache_key(self, national_code: str, birthday: date, mobile: str) -> str:
+        # Hash the tuple so raw national codes / mobiles never appear in key names
+        raw = f"{national_code}|{birthday.isoformat()}|{mobile}".encode("utf-8")
+        return hashlib.sha256(raw).hexdigest()
+
+    @staticmethod
+    def __resolve(entry: dict) -> IdentityInfo:
+        if entry["ok"]:
+            return IdentityInfo.model_validate(entry["info"])
+        raise IdentityRejectedError(entry["error"])
+
+    async def validate_identity(
+        self,
+        national_code: str,
+        birthday: date,
+        mobile: str
+    ) -> IdentityInfo:
+        key = self.__cache_key(national_code, birthday, mobile)
+
+        entry = self._local.get(key)
+        if entry is None:
+            entry = await self._inflight.do(
+                key,
+                lambda: self.__load(key, national_code, birthday, mobile)
+            )
+
+        return self.__resolve(entry)
+
+    async def __load(self, key: str, national_code: str, birthday: date, mobile: str) -> dict:
+        redis_key = f"{self.CACHE_PREFIX}{key}"
+
+        # Shared cache
+        try:
+            cached = await self.redis.client.get(redis_key)
+        except RedisError as e:
+            Log.warn(f"[CachedIdentityValidator] Redis read failed, bypassing cache: {e}", every=10)
+            cached = None
+
+        if cached:
+            entry = json.loads(cached)
+            self.__remember_local(key, entry)
+            return entry
+
+        # Upstream
+        try:
+            info = await self.inner.validate_identity(
+                national_code=national_code,
+                birthday=birthday,
+                mobile=mobile
+            )
+            entry = {"ok": True, "info": info.model_dump(mode="json")}
+            ttl = self.settings.positive_ttl_seconds
+        except IdentityRejectedError as e:
+            entry = {"ok": False, "error": str(e)}
+            ttl = self.settings.negative_ttl_seconds
+
+        self.__remember_local(key, entry)
+
+        try:
+            await self.redis.client.setex(redis_key, ttl, json.dumps(entry))
+        except RedisError as e:
+            Log.warn(f"[CachedIdentityValidator] Redis write failed: {e}", every=10)
+
+        return entry
+
+    def __remember_local(self, key: str, entry: dict) -> None:
+        ttl = None if entry["ok"] else self.settings.negative_ttl_seconds
+        self._local.set(key, entry, ttl=ttl)
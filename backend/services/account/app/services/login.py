@@ -0,0 +1,160 @@
+import uuid
+import hashlib
+from redis.exceptions import RedisError
+from sqlalchemy.exc import SQLAlchemyError
+
+from .users import UserService
+from .rate_limiter import RateLimitExceededError
+
+from ..config.login import LoginConfig
+from ..models.db.user import User
+from ..utils.normalizer import normalize_mobile
+from ..utils.hashing import UNUSABLE_PASSWORD, needs_rehash
+from ..utils.metrics import LOGIN_ATTEMPTS
+from ..utils.log import Log
+
+from ..resources.redis import RedisResource
+from ..resources.jwt import JWTResource
+from ..resources.hashing import HashingResource, HashingBusyError
+
+
+class InvalidCredentialsError(ValueError):
+    """Unknown mobile or wrong password; deliberately not told apart."""
+
+    def __init__(self):
+        super().__init__("Invalid mobile or password")
+
+
+class InactiveUserError(ValueError):
+
+    def __init__(self):
+        super().__init__("This account is disabled")
+
+
+class LoginService:
+    """
+    Mobile + password login.
+
+    Per attempt:
+        1. One Redis transaction counts the attempt against the mobile and
+           reads the count back; past max_failed_attempts the attempt is
+           rejected before any lookup or bcrypt work. Counting up front keeps
+           concurrent guesses from overshooting the limit. A successful
+           login deletes the counter.
+        2. The user row is read from the database, bypassing the user cache
+           (a replica, or the primary for recently changed users).
+        3. bcrypt runs on the hashing pool. Unknown mobiles and accounts
+           without a password are checked against a dummy hash of the same
+           cost, so response time does not reveal whether a mobile is
+           registered.
+        4. A hash made with fewer rounds than hashing.rounds is replaced
+           with a new one while the plain password is at hand.
+    """
+
+    ATTEMPTS_PREFIX = "login:attempts:"
+
+    def __init__(
+        self,
+        users: UserService,
+        redis: RedisResource,
+        jwt: JWTResource,
+        hashing: HashingResource,
+        settings: LoginConfig
+    ):
+        self.users = users
+        self.redis = redis.client
+        self.jwt = jwt
+        self.hashing = hashing
+        self.settings = settings
+        self._dummy_hash: str | None = None
+
+    async def start(self):
+        # Same cost as real hashes, so verifying against it takes as long
+        self._dummy_hash = await self.hashing.hash_password(uuid.uuid4().hex)
+
+    def __key(self, mobile: str) -> str:
+        # Hashed so raw mobiles never appear in key names
+        return f"{self.ATTEMPTS_PREFIX}{hashlib.sha1(mobile.encode('utf-8')).hexdigest()}"
+
+    # ---------------------------------------------------------
+    # LOGIN
+    # ---------------------------------------------------------
+    async def login(self, mobile: str, password: str) -> dict:
+
+        normalized_mobile = normalize_mobile(mobile)
+        attempts_key = self.__key(normalized_mobile)
+
+        await self.__count_attempt(attempts_key)
+
+        # From the database, not the user cache: password hash and status must be current
+        user = await self.users.get_credentials_by_mobile(normalized_mobile)
+
+        usable = user is not None and user.password_hash != UNUSABLE_PASSWORD
+        valid = await self.hashing.verify_password(
+            password,
+            user.password_hash if usable else self._dummy_hash
+        )
+
+        if not (usable and valid):
+            LOGIN_ATTEMPTS.labels("invalid").inc()
+            raise InvalidCredentialsError()
+
+        await self.__clear_attempts(attempts_key)
+
+        if not user.is_active:
+            LOGIN_ATTEMPTS.labels("inactive").inc()
+            raise InactiveUserError()
+
+        if needs_rehash(user.password_hash, self.hashing.settings.rounds):
+            await self.__upgrade_hash(user, password)
+
+        LOGIN_ATTEMPTS.labels("ok").inc()
+
+        return {
+            "user": user,
+            "access_token": self.jwt.create_access_token({"user_id": user.id}),
+            "refresh_token": self.jwt.create_refresh_token({"user_id": user.id}),
+        }
+
+    # ---------------------------------------------------------
+    # Failed-attempt lockout
+    # ---------------------------------------------------------
+    async def __count_attempt(self, key: str):
+        if self.settings.max_failed_attempts <= 0:
+            return
+
+        # SET NX starts the lockout window on the first attempt; INCR keeps its TTL
+        pipe = self.redis.pipeline(transaction=True)
+        pipe.set(key, 0, ex=self.settings.lockout_seconds, nx=True)
+        pipe.incr(key)
+        pipe.pttl(key)
+        try:
+            _, attempts, ttl_ms = await pipe.execute()
+        except RedisError as e:
+            # Fail open like the rate limiter; the per-IP limit still applies
+            Log.warn(f"[LoginService] attempt counter unavailable, not enforcing lockout: {e}", every=10)
+            return
+
+        # This attempt is counted too, so the limit is reached after max failures
+        if attempts > self.settings.max_failed_attempts:
+            LOGIN_ATTEMPTS.labels("locked").inc()
+            raise RateLimitExceededError(max(ttl_ms, 0) / 1000)
+
+    async def __clear_attempts(self, key: str):
+        if self.settings.max_failed_attempts <= 0:
+            return
+        try:
+            await self.redis.delete(key)
+        except RedisError as e:
+            Log.warn(f"[LoginService] attempt counter not reset: {e}", every=10)
+
+    # ---------------------------------------------------------
+    # Transparent rehash
+    # ---------------------------------------------------------
+    async def __upgrade_hash(self, user: User, password: str):
+        # Best effort: the login succeeds either way, and the next one retries
+        try:
+            new_hash = await self.hashing.hash_password(password)
+            await self.users.update_password(user, new_hash)
+        except (HashingBusyError, SQLAlchemyError, RedisError) as e:
+            Log.warn(f"[LoginService] password hash of user {user.id} not upgraded: {e}", every=10)
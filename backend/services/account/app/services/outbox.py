@@ -0,0 +1,299 @@
+import os
+import json
+import time
+import uuid
+import random
+import socket
+import asyncio
+from datetime import datetime, timezone
+import aio_pika
+from opentelemetry.trace import SpanKind
+from redis.exceptions import ResponseError
+
+from ..config.outbox import OutboxConfig
+from ..resources.redis import RedisResource
+from ..utils.log import Log
+from ..utils.metrics import OUTBOX_PUBLISH, OUTBOX_DELIVERY_LAG
+from ..utils.tracing import tracer, extract_context, inject_context
+
+
+class NotificationOutbox:
+    """
+    Transactional outbox for notifications, kept in a Redis stream.
+
+    Producers add entries to the pipeline of the write they belong to
+    (e.g. the signup session's MULTI/EXEC), so a notification is recorded
+    exactly when that write is, and the request path never waits on
+    RabbitMQ or the notification service.
+
+    A relay task in every worker reads the stream through a shared
+    consumer group and publishes batches to the notification service's
+    queue with publisher confirms. Only confirmed entries are acknowledged
+    and deleted; failed entries, or those held by a worker that died, stay
+    pending and are re-claimed after claim_idle_seconds. Delivery is
+    therefore at least once.
+    """
+
+    STREAM_KEY = "outbox:notifications"
+    GROUP = "relay"
+
+    def __init__(self, redis: RedisResource, settings: OutboxConfig):
+        self.redis = redis
+        self.settings = settings
+        self.consumer = f"{socket.gethostname()}-{os.getpid()}"
+
+        self._relay: asyncio.Task | None = None
+        self._connection: aio_pika.abc.AbstractRobustConnection | None = None
+        self._channel: aio_pika.abc.AbstractChannel | None = None
+        self._claim_cursor = "0-0"
+        self._next_claim = 0.0
+
+        # Counters (per worker)
+        self.published = 0
+        self.failed = 0
+        self.reclaimed = 0
+        self.last_error: str | None = None
+
+    # ---------------------------------------------------------
+    # Producing
+    # ---------------------------------------------------------
+    def add(self, pipe, notification: dict):
+        """
+        Queues a notification ({"type": ..., "data": ...}, as the notification
+        service accepts it) on the caller's pipeline; it is written when the
+        pipeline executes. The current trace context travels with it.
+        """
+        pipe.xadd(
+            self.STREAM_KEY,
+            {
+                "id": uuid.uuid4().hex,
+                "body": json.dumps(notification, ensure_ascii=False),
+                "headers": json.dumps(inject_context({})),
+                "created": repr(time.time()),
+            },
+            maxlen=self.settings.stream_max_length,
+            approximate=True,
+        )
+
+    def add_sms(self, pipe, mobile: str, message: str):
+        self.add(pipe, {
+            "type": "sms",
+            "data": {"phone": f"0{mobile}", "message": message},
+        })
+
+    async def send_sms(self, mobile: str, message: str):
+        """Queues an SMS on its own, outside any other write."""
+        pipe = self.redis.client.pipeline(transaction=False)
+        self.add_sms(pipe, mobile, message)
+        await pipe.execute()
+
+    # ---------------------------------------------------------
+    # Lifecycle
+    # ---------------------------------------------------------
+    async def start(self):
+        if not self.settings.relay_enabled:
+            Log.info("[NotificationOutbox] relay disabled via config, entries stay in the stream.")
+            return
+        self._relay = asyncio.create_task(self.__relay(), name="NotificationOutboxRelay")
+
+    async def close(self):
+        if self._relay and not self._relay.done():
+            self._relay.cancel()
+            try:
+                await self._relay
+            except asyncio.CancelledError:
+                pass
+        if self._connection:
+            await self._connection.close()
+            self._connection = None
+            self._channel = None
+
+    async def __create_group(self):
+        try:
+            await self.redis.client.xgroup_create(self.STREAM_KEY, self.GROUP, id="0", mkstream=True)
+        except ResponseError as e:
+            if "BUSYGROUP" not in str(e):
+                raise
+
+    async def __connect(self):
+        await self.__create_group()
+
+        # Robust connection: reconnects (and reopens the channel) by itself later on
+        connection = await aio_pika.connect_robust(
+            host=self.settings.rabbitmq_host,
+            port=self.settings.rabbitmq_port,
+            login=self.settings.rabbitmq_username,
+            password=self.settings.rabbitmq_password,
+        )
+        try:
+            channel = await connection.channel(publisher_confirms=True)
+
+            # Same declaration as the notification consumer, so publishing works
+            # even before that service has started
+            await channel.declare_queue(self.settings.queue_name, durable=True)
+        except BaseException:
+            # The relay retries __connect; do not leave this connection behind
+            await connection.close()
+            raise
+
+        self._connection = connection
+        self._channel = channel
+
+        Log.info(f"[NotificationOutbox] relaying to queue {self.settings.queue_name} as {self.consumer}.")
+
+    def __backoff(self, failures: int) -> float:
+        # Exponential backoff with full jitter
+        ceiling = min(
+            self.settings.retry_backoff_max_seconds,
+            self.settings.retry_backoff_seconds * (2 ** min(failures, 16))
+        )
+        return random.uniform(0, ceiling)
+
+    # ---------------------------------------------------------
+    # Relay
+    # ---------------------------------------------------------
+    async def __relay(self):
+        failures = 0
+        group_missing = False
+        while True:
+            try:
+                if self._channel is None:
+                    await self.__connect()
+                elif group_missing:
+                    await self.__create_group()
+                group_missing = False
+                await self.__relay_batch()
+                failures = 0
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                # Stream or consumer group lost (Redis flush, failover): recreate
+                # it next round, whatever the state of the RabbitMQ channel
+                group_missing = isinstance(e, ResponseError) and str(e).startswith("NOGROUP")
+                failures += 1
+                self.last_error = str(e)
+                Log.warn(f"[NotificationOutbox] relay failed, retrying: {e}", every=30)
+                await asyncio.sleep(self.__backoff(failures))
+
+    async def __relay_batch(self):
+        entries = await self.__claim_stale()
+        if not entries:
+            response = await self.redis.client.xreadgroup(
+                self.GROUP,
+                self.consumer,
+                {self.STREAM_KEY: ">"},
+                count=self.settings.batch_size,
+                block=self.settings.block_ms,
+            )
+            entries = response[0][1] if response else []
+        if not entries:
+            return
+
+        # With publisher confirms each publish resolves on the broker's ack;
+        # running them together pipelines the whole batch over one channel
+        results = await asyncio.gather(
+            *(self.__publish(fields) for _, fields in entries),
+            return_exceptions=True
+        )
+
+        confirmed = []
+        errors = []
+        for (entry_id, _), result in zip(entries, results):
+            if isinstance(result, BaseException):
+                errors.append(result)
+            else:
+                confirmed.append(entry_id)
+
+        if confirmed:
+            pipe = self.redis.client.pipeline(transaction=False)
+            pipe.xack(self.STREAM_KEY, self.GROUP, *confirmed)
+            pipe.xdel(self.STREAM_KEY, *confirmed)
+            await pipe.execute()
+            self.published += len(confirmed)
+
+        if errors:
+            # Unconfirmed entries stay pending and are re-claimed later
+            self.failed += len(errors)
+            raise RuntimeError(f"{len(errors)}/{len(entries)} notifications not confirmed: {errors[0]!r}")
+
+    async def __claim_stale(self) -> list:
+        """Takes over entries left unconfirmed for claim_idle_seconds (failed or orphaned)."""
+        now = time.monotonic()
+        if now < self._next_claim:
+            return []
+
+        next_cursor, entries, *_ = await self.redis.client.xautoclaim(
+            self.STREAM_KEY,
+            self.GROUP,
+            self.consumer,
+            min_idle_time=self.settings.claim_idle_seconds * 1000,
+            start_id=self._claim_cursor,
+            count=self.settings.batch_size,
+        )
+        self._claim_cursor = next_cursor
+        # Scan again right away while a backlog remains, else wait a while
+        if next_cursor == "0-0":
+            self._next_claim = now + self.settings.claim_idle_seconds / 2
+
+        # Entries trimmed from the stream come back without fields
+        stale = [entry for entry in entries if entry[1]]
+        dropped = [entry_id for entry_id, fields in entries if not fields]
+        if dropped:
+            await self.redis.client.xack(self.STREAM_KEY, self.GROUP, *dropped)
+
+        self.reclaimed += len(stale)
+        return stale
+
+    async def __publish(self, fields: dict):
+        created = float(fields["created"])
+        with (
+            OUTBOX_PUBLISH.labels().track(),
+            # Child of the request that queued it; the consumer continues from here
+            tracer.start_as_current_span(
+                f"{self.settings.queue_name} publish",
+                context=extract_context(json.loads(fields.get("headers") or "{}")),
+                kind=SpanKind.PRODUCER,
+                attributes={
+                    "messaging.system": "rabbitmq",
+                    "messaging.destination.name": self.settings.queue_name,
+                    "messaging.message.id": fields["id"],
+                },
+            ),
+        ):
+            await self._channel.default_exchange.publish(
+                aio_pika.Message(
+                    body=fields["body"].encode("utf-8"),
+                    content_type="application/json",
+                    delivery_mode=aio_pika.DeliveryMode.PERSISTENT,
+                    message_id=fields["id"],
+                    timestamp=datetime.fromtimestamp(created, timezone.utc),
+                    headers=inject_context({}),
+                ),
+                routing_key=self.settings.queue_name,
+            )
+        OUTBOX_DELIVERY_LAG.observe(time.time() - created)
+
+    # ---------------------------------------------------------
+    # Stats
+    # ---------------------------------------------------------
+    async def stats(self) -> dict:
+        pipe = self.redis.client.pipeline(transaction=False)
+        pipe.xlen(self.STREAM_KEY)
+        pipe.xpending(self.STREAM_KEY, self.GROUP)
+        try:
+            length, pending = await pipe.execute()
+        except ResponseError:
+            # Stream or group not created yet
+            length, pending = 0, {"pending": 0}
+
+        return {
+            "relay_enabled": self.settings.relay_enabled,
+            "connected": self._connection is not None and not self._connection.is_closed,
+            "consumer": self.consumer,
+            "stream_length": length,
+            "pending": pending["pending"],
+            "published": self.published,
+            "failed": self.failed,
+            "reclaimed": self.reclaimed,
+            "last_error": self.last_error,
+        }
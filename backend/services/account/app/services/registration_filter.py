@@ -0,0 +1,317 @@
+import time
+import asyncio
+from redis.exceptions import RedisError
+from sqlalchemy import select
+
+from ..config.registration_filter import RegistrationFilterConfig
+from ..models.db.user import User
+from ..resources.database import DatabaseResource
+from ..resources.redis import RedisResource
+from ..utils.bloom import BloomHasher
+from ..utils.log import Log
+
+# Sets the bits in the live filter and, while a rebuild is running, in the
+# filter being built, so users registered mid-rebuild are never lost.
+# ARGV holds the offsets of one user's two items (mobile and national code).
+_ADD_LUA = """
+local building = redis.call('EXISTS', KEYS[2]) == 1
+for i = 1, #ARGV do
+    redis.call('SETBIT', KEYS[1], ARGV[i], 1)
+    if building then
+        redis.call('SETBIT', KEYS[2], ARGV[i], 1)
+    end
+end
+redis.call('HINCRBY', KEYS[3], 'items', 2)
+return 1
+"""
+
+
+class RegistrationFilter:
+    """
+    Redis-backed Bloom filter of registered mobiles and national codes.
+
+    Shared by every worker, so a user registered through one worker is
+    immediately visible to all others. A negative answer means the value
+    is definitely not registered and the database can be skipped; a
+    positive answer only means "maybe" and must be confirmed by a query.
+
+    Whenever the filter is disabled, missing or still being built, checks
+    return None so callers fall back to the database.
+
+    Each user is stored as two items (mobile and national code), so the
+    filter is sized for 2 * capacity items; `items` in the metadata counts
+    items, not users.
+    """
+
+    FILTER_KEY = "registered:bloom"
+    BUILD_KEY = "registered:bloom:building"
+    META_KEY = "registered:bloom:meta"
+    LOCK_KEY = "registered:bloom:lock"
+    LOCK_TTL = 10 * 60  # 10 minutes
+
+    def __init__(
+        self,
+        db: DatabaseResource,
+        redis: RedisResource,
+        settings: RegistrationFilterConfig
+    ):
+        self.db = db
+        self.redis = redis
+        self.settings = settings
+        self.hasher = BloomHasher(2 * settings.capacity, settings.error_rate)
+
+        self._rebuild_task: asyncio.Task | None = None
+        self._add_script = None
+
+        # Counters (per worker); checks count lookups, the rest count items
+        self.checks = 0
+        self.definite_negatives = 0
+        self.confirmed_positives = 0
+        self.false_positives = 0
+        self.last_rebuild_seconds: float | None = None
+
+    @staticmethod
+    def __mobile_item(mobile: str) -> str:
+        return f"m:{mobile}"
+
+    @staticmethod
+    def __national_code_item(national_code: str) -> str:
+        return f"n:{national_code}"
+
+    # ---------------------------------------------------------
+    # Lifecycle
+    # ---------------------------------------------------------
+    async def start(self):
+        """
+        Warms the filter in the background if it is missing or was built
+        with a different size. Startup is never blocked on the rebuild.
+        """
+        if not self.settings.enabled:
+            Log.info("[RegistrationFilter] disabled via config.")
+            return
+
+        self._add_script = self.redis.client.register_script(_ADD_LUA)
+
+        try:
+            meta = await self.redis.client.hgetall(self.META_KEY)
+            exists = await self.redis.client.exists(self.FILTER_KEY)
+        except RedisError as e:
+            Log.warn(f"[RegistrationFilter] could not read filter state, falling back to DB checks: {e}")
+            return
+
+        if exists and self.__matches(meta):
+            Log.info(f"[RegistrationFilter] reusing existing filter ({meta.get('items', 0)} items).")
+            return
+
+        self._rebuild_task = asyncio.create_task(self.rebuild(), name="RegistrationFilterRebuild")
+
+    async def close(self):
+        if self._rebuild_task and not self._rebuild_task.done():
+            self._rebuild_task.cancel()
+            try:
+                await self._rebuild_task
+            except asyncio.CancelledError:
+                pass
+
+    def __matches(self, meta: dict) -> bool:
+        return (
+            meta.get("ready") == "1"
+            and meta.get("bits") == str(self.hasher.bits)
+            and meta.get("hashes") == str(self.hasher.hashes)
+        )
+
+    # ---------------------------------------------------------
+    # Rebuild from the database
+    # ---------------------------------------------------------
+    async def rebuild(self):
+        client = self.redis.client
+
+        # Only one worker rebuilds; the others keep falling back to the DB meanwhile
+        try:
+            locked = await client.set(self.LOCK_KEY, "1", nx=True, ex=self.LOCK_TTL)
+        except RedisError as e:
+            Log.error(f"[RegistrationFilter] could not take the rebuild lock, falling back to DB checks: {e}")
+            return
+
+        if not locked:
+            Log.info("[RegistrationFilter] rebuild already running in another worker.")
+            return
+
+        started = time.perf_counter()
+        users = 0
+        try:
+            # Create the build key *before* reading the DB so concurrent add() calls
+            # also land in it (see _ADD_LUA)
+            await client.delete(self.BUILD_KEY)
+            await client.setbit(self.BUILD_KEY, 0, 0)
+
+            stmt = select(User.mobile, User.national_code).execution_options(
+                yield_per=self.settings.rebuild_batch_size
+            )
+
+            # From the primary: users missing on a lagging replica would become
+            # false negatives, which skip the DB pre-check
+            async with self.db.get_write_session() as session:
+                result = await session.stream(stmt)
+                async for rows in result.partitions():
+                    pipe = client.pipeline(transaction=False)
+                    for mobile, national_code in rows:
+                        for offset in self.hasher.offsets(self.__mobile_item(mobile)):
+                            pipe.setbit(self.BUILD_KEY, offset, 1)
+                        for offset in self.hasher.offsets(self.__national_code_item(national_code)):
+                            pipe.setbit(self.BUILD_KEY, offset, 1)
+                    await pipe.execute()
+                    users += len(rows)
+
+            elapsed = time.perf_counter() - started
+
+            pipe = client.pipeline(transaction=True)
+            pipe.rename(self.BUILD_KEY, self.FILTER_KEY)
+            pipe.delete(self.META_KEY)
+            pipe.hset(self.META_KEY, mapping={
+                "ready": "1",
+                "bits": self.hasher.bits,
+                "hashes": self.hasher.hashes,
+                "items": 2 * users,
+                "rebuild_seconds": round(elapsed, 3),
+                "built_at": int(time.time()),
+            })
+            await pipe.execute()
+
+            self.last_rebuild_seconds = elapsed
+            Log.success(f"[RegistrationFilter] rebuilt with {users} users in {elapsed:.2f}s.")
+
+        except asyncio.CancelledError:
+            await client.delete(self.BUILD_KEY)
+            raise
+        except Exception as e:
+            Log.error(f"[RegistrationFilter] rebuild failed, falling back to DB checks: {e}")
+            await client.delete(self.BUILD_KEY)
+        finally:
+            await client.delete(self.LOCK_KEY)
+
+    # ---------------------------------------------------------
+    # Queries
+    # ---------------------------------------------------------
+    async def might_contain(self, mobile: str, national_code: str) -> tuple[bool, bool] | None:
+        """
+        Returns (maybe_mobile_registered, maybe_national_code_registered)
+        in a single Redis round trip, or None when the filter cannot answer
+        (disabled, not built yet, Redis unavailable) and both values must
+        be checked against the database.
+        """
+        if not self.settings.enabled:
+            return None
+
+        mobile_offsets = self.hasher.offsets(self.__mobile_item(mobile))
+        national_code_offsets = self.hasher.offsets(self.__national_code_item(national_code))
+
+        try:
+            pipe = self.redis.client.pipeline(transaction=False)
+            pipe.hget(self.META_KEY, "ready")
+            pipe.exists(self.FILTER_KEY)
+            for offset in mobile_offsets + national_code_offsets:
+                pipe.getbit(self.FILTER_KEY, offset)
+            ready, exists, *bits = await pipe.execute()
+        except RedisError as e:
+            Log.warn(f"[RegistrationFilter] check failed, falling back to DB: {e}", every=10)
+            return None
+
+        if ready != "1" or not exists:
+            return None
+
+        self.checks += 1
+
+        k = self.hasher.hashes
+        maybe_mobile = all(bits[:k])
+        maybe_national_code = all(bits[k:])
+
+        # Per item, like false_positives, so the observed rate compares to the estimate
+        self.definite_negatives += (not maybe_mobile) + (not maybe_national_code)
+
+        return maybe_mobile, maybe_national_code
+
+    def record_outcome(self, registered: bool):
+        """Records whether a positive answer for one item was confirmed by the database."""
+        if registered:
+            self.confirmed_positives += 1
+        else:
+            self.false_positives += 1
+
+    async def add(self, mobile: str, national_code: str):
+        if not self.settings.enabled or self._add_script is None:
+            return
+
+        offsets = (
+            self.hasher.offsets(self.__mobile_item(mobile))
+            + self.hasher.offsets(self.__national_code_item(national_code))
+        )
+        try:
+            await self._add_script(
+                keys=[self.FILTER_KEY, self.BUILD_KEY, self.META_KEY],
+                args=offsets
+            )
+        except RedisError as e:
+            # The unique indexes on users still reject duplicates
+            Log.warn(f"[RegistrationFilter] could not add user to filter: {e}", every=10)
+
+    async def add_many(self, users: list[tuple[str, str]]):
+        """Adds (mobile, national_code) pairs in one pipelined round trip."""
+        if not self.settings.enabled or self._add_script is None or not users:
+            return
+
+        pipe = self.redis.client.pipeline(transaction=False)
+        for mobile, national_code in users:
+            offsets = (
+                self.hasher.offsets(self.__mobile_item(mobile))
+                + self.hasher.offsets(self.__national_code_item(national_code))
+            )
+            self._add_script(
+                keys=[self.FILTER_KEY, self.BUILD_KEY, self.META_KEY],
+                args=offsets,
+                client=pipe
+            )
+
+        try:
+            await pipe.execute()
+        except RedisError as e:
+            Log.warn(f"[RegistrationFilter] could not add {len(users)} users to filter: {e}")
+
+    # ---------------------------------------------------------
+    # Metrics
+    # ---------------------------------------------------------
+    async def stats(self) -> dict:
+        stats = {
+            "enabled": self.settings.enabled,
+            "bits": self.hasher.bits,
+            "hashes": self.hasher.hashes,
+            "configured_error_rate": self.settings.error_rate,
+            "checks": self.checks,
+            "definite_negatives": self.definite_negatives,
+            "confirmed_positives": self.confirmed_positives,
+            "false_positives": self.false_positives,
+            "observed_false_positive_rate": (
+                self.false_positives / (self.false_positives + self.definite_negatives)
+                if self.false_positives + self.definite_negatives else None
+            ),
+        }
+
+        if not self.settings.enabled:
+            return stats
+
+        try:
+            meta = await self.redis.client.hgetall(self.META_KEY)
+            bits_set = await self.redis.client.bitcount(self.FILTER_KEY)
+        except RedisError as e:
+            stats["error"] = str(e)
+            return stats
+
+        stats.update({
+            "ready": meta.get("ready") == "1",
+            "items": int(meta.get("items", 0)),
+            "bits_set": bits_set,
+            "estimated_false_positive_rate": self.hasher.estimated_false_positive_rate(bits_set),
+            "rebuild_seconds": float(meta["rebuild_seconds"]) if "rebuild_seconds" in meta else None,
+            "built_at": int(meta["built_at"]) if "built_at" in meta else None,
+        })
+        return stats
@@ -1,39 +1,89 @@
-import json
 import time
 import uuid
 from datetime import date
 
-from .base import SingletonClass
 from .identity_validator.base import IdentityValidatorInterface
+from .registration_filter import RegistrationFilter
+from .outbox import NotificationOutbox
 
 from ..utils.normalizer import normalize_mobile
 from ..utils.date_converter import jalali_to_gregorian
-from ..utils.hashing import hash_password
 from ..utils.otp import generate_otp
+from ..utils.log import Log
 
-from ..crud.user import UserCRUD
+from ..crud.user import UserCRUD, UserAlreadyRegisteredError
 
 from ..resources.database import DatabaseResource
 from ..resources.redis import RedisResource
 from ..resources.jwt import JWTResource
+from ..resources.hashing import HashingResource
+from redis.exceptions import RedisError
 
+# Checks and consumes an OTP in a single round trip.
+#   KEYS[1] = signup session hash
+#   ARGV    = otp input, current unix time, max attempts
+# Returns {'ok', remaining_ttl_ms, field, value, ...} on success,
+# otherwise a single status: 'missing', 'expired', 'invalid' or 'locked'.
+_VERIFY_OTP_LUA = """
+local otp = redis.call('HMGET', KEYS[1], 'otp', 'otp_expiry')
+if not otp[1] then
+    return {'missing'}
+end
+if tonumber(ARGV[2]) > tonumber(otp[2]) then
+    redis.call('DEL', KEYS[1])
+    return {'expired'}
+end
+if otp[1] ~= ARGV[1] then
+    local attempts = redis.call('HINCRBY', KEYS[1], 'attempts', 1)
+    if attempts >= tonumber(ARGV[3]) then
+        redis.call('DEL', KEYS[1])
+        return {'locked'}
+    end
+    return {'invalid'}
+end
+local ttl = redis.call('PTTL', KEYS[1])
+local fields = redis.call('HGETALL', KEYS[1])
+redis.call('DEL', KEYS[1])
+return {'ok', ttl, unpack(fields)}
+"""
 
-class SignupService(SingletonClass):
+_VERIFY_OTP_ERRORS = {
+    "missing": "Signup session expired or invalid",
+    "expired": "OTP expired",
+    "invalid": "Invalid OTP",
+    "locked": "Too many invalid attempts, please request a new code",
+}
+
+
+class SignupService:
 
     SIGNUP_PREFIX = "signup:"
     SIGNUP_TTL = 15 * 60  # 15 minutes
+    OTP_TTL = 2 * 60  # 2 minutes
+    OTP_MAX_ATTEMPTS = 5
 
     def __init__(
         self, 
         db: DatabaseResource, 
         redis: RedisResource, 
         jwt: JWTResource,
-        identity_validator: IdentityValidatorInterface
+        hashing: HashingResource,
+        identity_validator: IdentityValidatorInterface,
+        registration_filter: RegistrationFilter,
+        outbox: NotificationOutbox,
+        precheck_uniqueness: bool = True
     ):
         self.db = db
         self.redis = redis.client
         self.jwt = jwt
+        self.hashing = hashing
         self.identity_validator = identity_validator
+        self.registration_filter = registration_filter
+        self.outbox = outbox
+        # Uniqueness is enforced by the unique indexes on users; the pre-check only
+        # rejects duplicates early, before paying for identity validation and hashing
+        self.precheck_uniqueness = precheck_uniqueness
+        self._verify_otp_script = self.redis.register_script(_VERIFY_OTP_LUA)
 
     # ---------------------------------------------------------
     # 1️⃣ REQUEST SIGNUP OTP
@@ -51,15 +101,8 @@ class SignupService(SingletonClass):
         # Convert Jalali → Gregorian birthday date
         birthday_date: date = jalali_to_gregorian(birthday_jalali)
 
-        # DB checks
-        async with self.db.get_session() as session:
-            # Constraint 1: Check if national code is already registered
-            if await UserCRUD.exists_by_national_code(session, national_code):
-                raise ValueError("This national code is already registered")
-            
-            # Check if mobile is already registered
-            if await UserCRUD.exists_by_mobile(session, normalized_mobile):
-                raise ValueError("This mobile number is already registered")
+        if self.precheck_uniqueness:
+            await self.__ensure_not_registered(normalized_mobile, national_code)
 
         # Constraints 2 & 3: Validate identity (national_code, birthday, mobile relationship)
         # This will also retrieve the person's name
@@ -69,13 +112,14 @@ class SignupService(SingletonClass):
             mobile=normalized_mobile
         )
 
-        # Hash password to store in the database
-        password_hash = hash_password(password)
+        # Hash password to store in the database (runs on the hashing pool)
+        password_hash = await self.hashing.hash_password(password)
 
         # Generate OTP to send to the user
         otp = generate_otp()
 
-        # Temporary signup session to store in the Redis
+        # Temporary signup session to store in the Redis (as a hash, so the
+        # OTP can be checked without fetching the whole session)
         data = {
             "mobile": normalized_mobile,
             "password_hash": password_hash,
@@ -84,58 +128,108 @@ class SignupService(SingletonClass):
             "first_name": identity_info.first_name,
             "last_name": identity_info.last_name,
             "otp": otp,
-            "otp_expiry": int(time.time()) + 120,
+            "otp_expiry": int(time.time()) + self.OTP_TTL,
+            "attempts": 0,
         }
 
         # Unique key to identify the signup session
         unique_key = uuid.uuid4().hex
         redis_key = f"{self.SIGNUP_PREFIX}{unique_key}"
 
-        # Store the signup session in the Redis
-        await self.redis.setex(redis_key, self.SIGNUP_TTL, json.dumps(data))
+        # Store the signup session in the Redis, queuing the OTP SMS in the
+        # same transaction; the outbox relay delivers it in the background
+        pipe = self.redis.pipeline(transaction=True)
+        pipe.hset(redis_key, mapping=data)
+        pipe.expire(redis_key, self.SIGNUP_TTL)
+        if self.outbox.settings.otp_template:
+            self.outbox.add_sms(
+                pipe,
+                normalized_mobile,
+                self.outbox.settings.otp_template.format(otp=otp)
+            )
+        await pipe.execute()
 
-        # TODO: send OTP through notification service
-        print(f"OTP ({otp}) sent to {normalized_mobile}")
         return unique_key
 
+    # ---------------------------------------------------------
+    # Uniqueness pre-check
+    # ---------------------------------------------------------
+    async def __ensure_not_registered(self, mobile: str, national_code: str):
+        # Bloom filter fast path: definite negatives skip the database entirely
+        filter_answer = await self.registration_filter.might_contain(mobile, national_code)
+        maybe_mobile, maybe_national_code = filter_answer or (True, True)
+
+        # DB checks (single indexed query, only for possible positives)
+        if not (maybe_mobile or maybe_national_code):
+            return
+
+        # A replica is fine here: a user it has not seen yet is still
+        # rejected by the unique indexes when verify_otp inserts
+        async with self.db.get_read_session() as session:
+            mobile_registered, national_code_registered = await UserCRUD.find_registered(
+                session,
+                mobile=mobile if maybe_mobile else None,
+                national_code=national_code if maybe_national_code else None,
+            )
+
+        if filter_answer is not None:
+            if maybe_mobile:
+                self.registration_filter.record_outcome(mobile_registered)
+            if maybe_national_code:
+                self.registration_filter.record_outcome(national_code_registered)
+
+        # Constraint 1: Check if national code is already registered
+        if national_code_registered:
+            raise UserAlreadyRegisteredError("national_code")
+
+        # Check if mobile is already registered
+        if mobile_registered:
+            raise UserAlreadyRegisteredError("mobile")
+
     # ---------------------------------------------------------
     # 2️⃣ VERIFY OTP AND CREATE USER
     # ---------------------------------------------------------
     async def verify_otp(self, key: str, otp_input: str):
 
-        # Get the signup session from the Redis
+        # Check expiry, compare the OTP, count the attempt and consume the
+        # session atomically, so only one concurrent verify can ever succeed
         redis_key = f"{self.SIGNUP_PREFIX}{key}"
-        data_str = await self.redis.get(redis_key)
-
-        if not data_str:
-            raise ValueError("Signup session expired or invalid")
-
-        data = json.loads(data_str)
+        status, *result = await self._verify_otp_script(
+            keys=[redis_key],
+            args=[otp_input, int(time.time()), self.OTP_MAX_ATTEMPTS]
+        )
 
-        # OTP expired?
-        if int(time.time()) > data["otp_expiry"]:
-            raise ValueError("OTP expired")
+        if status != "ok":
+            raise ValueError(_VERIFY_OTP_ERRORS[status])
 
-        # Wrong OTP?
-        if otp_input != data["otp"]:
-            raise ValueError("Invalid OTP")
+        ttl_ms, fields = result[0], result[1:]
+        data = dict(zip(fields[::2], fields[1::2]))
 
         birthday_date = date.fromisoformat(data["birthday_date"])
 
-        # CREATE USER
-        async with self.db.get_session() as session:
-            user = await UserCRUD.create(
-                session,
-                mobile=data["mobile"],
-                national_code=data["national_code"],
-                birthday_date=birthday_date,
-                password_hash=data["password_hash"],
-                first_name=data["first_name"],
-                last_name=data["last_name"],
-            )
+        # CREATE USER (the unique indexes reject duplicates that raced the pre-check).
+        # On the primary; the row comes back from INSERT ... RETURNING, so nothing
+        # below reads it from a replica that may not have it yet
+        try:
+            async with self.db.get_write_session() as session:
+                user = await UserCRUD.create(
+                    session,
+                    mobile=data["mobile"],
+                    national_code=data["national_code"],
+                    birthday_date=birthday_date,
+                    password_hash=data["password_hash"],
+                    first_name=data["first_name"],
+                    last_name=data["last_name"],
+                )
+        except UserAlreadyRegisteredError:
+            raise
+        except Exception:
+            # Put the consumed session back so the user can retry with the same code
+            await self.__restore_session(redis_key, data, ttl_ms)
+            raise
 
-        # Remove session
-        await self.redis.delete(redis_key)
+        await self.registration_filter.add(user.mobile, user.national_code)
+        await self.__send_welcome(user)
 
         # JWT
         access = self.jwt.create_access_token({"user_id": user.id})
@@ -146,3 +240,25 @@ class SignupService(SingletonClass):
             "access_token": access,
             "refresh_token": refresh,
         }
+
+    async def __send_welcome(self, user):
+        template = self.outbox.settings.welcome_template
+        if not template:
+            return
+        # Queued after the user is committed to PostgreSQL, so unlike the OTP it
+        # is not atomic with its write: best effort, never fails the signup
+        try:
+            await self.outbox.send_sms(
+                user.mobile,
+                template.format(first_name=user.first_name, last_name=user.last_name)
+            )
+        except RedisError as e:
+            Log.warn(f"[SignupService] welcome notification not queued: {e}")
+
+    async def __restore_session(self, redis_key: str, data: dict, ttl_ms: int):
+        if ttl_ms <= 0:
+            return
+        pipe = self.redis.pipeline(transaction=True)
+        pipe.hset(redis_key, mapping=data)
+        pipe.pexpire(redis_key, ttl_ms)
+        await pipe.execute()
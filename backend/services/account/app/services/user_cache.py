@@ -0,0 +1,274 @@
+import json
+import asyncio
+from datetime import date, datetime
+from typing import Awaitable, Callable
+from redis.exceptions import RedisError
+from sqlalchemy import Date, DateTime
+
+from ..config.user_cache import UserCacheConfig
+from ..models.db.user import User
+from ..resources.redis import RedisResource
+from ..utils.cache import TTLLRUCache
+from ..utils.log import Log
+
+# The password hash is never cached; authentication reads the row from the database
+_COLUMNS = tuple(column for column in User.__table__.columns if column.key != "password_hash")
+
+# Caches one user under all of its keys, unless any of them was invalidated
+# in the last TOMBSTONE_TTL seconds: the row may have been loaded before that
+# invalidation. KEYS holds the tombstone keys, then the cache keys.
+_STORE_LUA = """
+local n = #KEYS / 2
+for i = 1, n do
+    if redis.call('EXISTS', KEYS[i]) == 1 then
+        return 0
+    end
+end
+for i = n + 1, #KEYS do
+    redis.call('SET', KEYS[i], ARGV[2], 'EX', ARGV[1])
+end
+return 1
+"""
+
+
+def _serialize(user: User) -> dict:
+    row = {}
+    for column in _COLUMNS:
+        value = getattr(user, column.key)
+        if isinstance(value, (date, datetime)):
+            value = value.isoformat()
+        row[column.key] = value
+    return row
+
+
+def _deserialize(row: dict) -> User:
+    values = {}
+    for column in _COLUMNS:
+        value = row.get(column.key)
+        if value is not None:
+            if isinstance(column.type, DateTime):
+                value = datetime.fromisoformat(value)
+            elif isinstance(column.type, Date):
+                value = date.fromisoformat(value)
+        values[column.key] = value
+    # Detached instance: reads only, writes go through UserCRUD by id.
+    # password_hash is None, so cached users cannot be used to authenticate.
+    return User(**values)
+
+
+class UserCache:
+    """
+    Two-tier read-through cache of user rows.
+
+    Lookup order:
+        1. In-process LRU (per worker, short TTL)
+        2. Redis (shared by all workers)
+        3. The database loader passed by the caller
+
+    A user is cached under its id, mobile and national code. Only found
+    users are cached, without their password hash. invalidate() drops all
+    three keys from Redis and publishes the user on a pub/sub channel, so
+    every worker evicts its local copies as well.
+
+    invalidate() also leaves a tombstone per key, in Redis and locally,
+    for TOMBSTONE_TTL seconds. A load that started before the invalidation
+    may return the old row; storing it is skipped while a tombstone exists,
+    so it cannot outlive the invalidation in either tier.
+
+    Invalidated keys are also remembered for `changed_ttl` seconds
+    (database.read_your_writes_seconds); recently_changed() tells loaders
+    to read them from the primary, so a lagging replica cannot put the
+    old row back in the cache.
+    """
+
+    CACHE_PREFIX = "user:"
+    INVALIDATION_CHANNEL = "user-cache:invalidate"
+    TOMBSTONE_PREFIX = "user:tomb:"
+    TOMBSTONE_TTL = 5
+    RESUBSCRIBE_DELAY = 1
+
+    def __init__(self, redis: RedisResource, settings: UserCacheConfig, changed_ttl: float = 0):
+        self.redis = redis
+        self.settings = settings
+        self._local = TTLLRUCache(
+            maxsize=settings.local_max_size,
+            ttl=settings.local_ttl_seconds
+        )
+        self._changed = TTLLRUCache(
+            maxsize=settings.local_max_size,
+            ttl=changed_ttl
+        )
+        self._tombstones = TTLLRUCache(
+            maxsize=settings.local_max_size,
+            ttl=self.TOMBSTONE_TTL
+        )
+        self._store_script = None
+        self._listener: asyncio.Task | None = None
+
+        # Counters (per worker)
+        self.local_hits = 0
+        self.redis_hits = 0
+        self.misses = 0
+        self.invalidations = 0
+        self.evictions_received = 0
+
+    @staticmethod
+    def __keys(user_id, mobile, national_code) -> list[str]:
+        return [
+            key for key in (
+                f"id:{user_id}" if user_id is not None else None,
+                f"mobile:{mobile}" if mobile else None,
+                f"nc:{national_code}" if national_code else None,
+            ) if key
+        ]
+
+    # ---------------------------------------------------------
+    # Lifecycle
+    # ---------------------------------------------------------
+    async def start(self):
+        if not self.settings.enabled:
+            Log.info("[UserCache] disabled via config.")
+            return
+        self._store_script = self.redis.client.register_script(_STORE_LUA)
+        self._listener = asyncio.create_task(self.__listen(), name="UserCacheInvalidation")
+
+    async def close(self):
+        if self._listener and not self._listener.done():
+            self._listener.cancel()
+            try:
+                await self._listener
+            except asyncio.CancelledError:
+                pass
+        self._local.clear()
+
+    async def __listen(self):
+        while True:
+            pubsub = self.redis.client.pubsub(ignore_subscribe_messages=True)
+            try:
+                await pubsub.subscribe(self.INVALIDATION_CHANNEL)
+                async for message in pubsub.listen():
+                    keys = json.loads(message["data"])
+                    for key in keys:
+                        self._local.pop(key)
+                        self._changed.set(key, True)
+                        self._tombstones.set(key, True)
+                    self.evictions_received += 1
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                # Local entries still expire after local_ttl_seconds meanwhile
+                Log.warn(f"[UserCache] invalidation listener failed, resubscribing: {e}", every=30)
+                await asyncio.sleep(self.RESUBSCRIBE_DELAY)
+            finally:
+                try:
+                    await pubsub.aclose()
+                except Exception:
+                    pass
+
+    # ---------------------------------------------------------
+    # Lookup
+    # ---------------------------------------------------------
+    async def get(self, key: str, loader: Callable[[], Awaitable[User | None]]) -> User | None:
+        """
+        Returns the user cached under `key` ("id:1", "mobile:912...", "nc:..."),
+        calling `loader` on a miss and caching what it returns.
+        """
+        if not self.settings.enabled:
+            return await loader()
+
+        row = self._local.get(key)
+        if row is not None:
+            self.local_hits += 1
+            return _deserialize(row)
+
+        try:
+            cached = await self.redis.client.get(f"{self.CACHE_PREFIX}{key}")
+        except RedisError as e:
+            Log.warn(f"[UserCache] Redis read failed, bypassing cache: {e}", every=10)
+            cached = None
+
+        if cached:
+            self.redis_hits += 1
+            row = json.loads(cached)
+            self._local.set(key, row)
+            return _deserialize(row)
+
+        self.misses += 1
+        user = await loader()
+        if user is not None:
+            await self.__store(user)
+        return user
+
+    def __tombstoned(self, keys: list[str]) -> bool:
+        return any(self._tombstones.get(key, False) for key in keys)
+
+    async def __store(self, user: User):
+        row = _serialize(user)
+        keys = self.__keys(user.id, user.mobile, user.national_code)
+
+        # Invalidated while it was loading: the row may be the old one
+        if self.__tombstoned(keys):
+            return
+
+        try:
+            stored = await self._store_script(
+                keys=[f"{self.TOMBSTONE_PREFIX}{key}" for key in keys]
+                + [f"{self.CACHE_PREFIX}{key}" for key in keys],
+                args=[self.settings.ttl_seconds, json.dumps(row)]
+            )
+        except RedisError as e:
+            Log.warn(f"[UserCache] Redis write failed: {e}", every=10)
+            stored = True
+
+        # Checked again: an eviction may have arrived during the write
+        if stored and not self.__tombstoned(keys):
+            for key in keys:
+                self._local.set(key, row)
+
+    def recently_changed(self, key: str) -> bool:
+        """True while a change to the user under `key` may not have reached the replicas."""
+        return self._changed.get(key, False)
+
+    # ---------------------------------------------------------
+    # Invalidation
+    # ---------------------------------------------------------
+    async def invalidate(self, user: User):
+        """Evicts the user from this worker, Redis and every other worker."""
+        keys = self.__keys(user.id, user.mobile, user.national_code)
+        for key in keys:
+            self._changed.set(key, True)
+
+        if not self.settings.enabled:
+            return
+
+        for key in keys:
+            self._local.pop(key)
+            self._tombstones.set(key, True)
+        self.invalidations += 1
+
+        try:
+            pipe = self.redis.client.pipeline(transaction=False)
+            for key in keys:
+                pipe.set(f"{self.TOMBSTONE_PREFIX}{key}", 1, ex=self.TOMBSTONE_TTL)
+            pipe.delete(*[f"{self.CACHE_PREFIX}{key}" for key in keys])
+            pipe.publish(self.INVALIDATION_CHANNEL, json.dumps(keys))
+            await pipe.execute()
+        except RedisError as e:
+            Log.warn(f"[UserCache] invalidation failed, entries expire in {self.settings.ttl_seconds}s: {e}")
+
+    # ---------------------------------------------------------
+    # Metrics
+    # ---------------------------------------------------------
+    def stats(self) -> dict:
+        lookups = self.local_hits + self.redis_hits + self.misses
+        return {
+            "enabled": self.settings.enabled,
+            "local_size": len(self._local),
+            "local_max_size": self.settings.local_max_size,
+            "local_hits": self.local_hits,
+            "redis_hits": self.redis_hits,
+            "misses": self.misses,
+            "hit_rate": (self.local_hits + self.redis_hits) / lookups if lookups else None,
+            "invalidations": self.invalidations,
+            "evictions_received": self.evictions_received,
+        }
@@ -0,0 +1,337 @@
+import csv
+import json
+import time
+import codecs
+from collections import deque
+from datetime import date
+from typing import AsyncIterator
+from sqlalchemy import text
+
+from .registration_filter import RegistrationFilter
+from ..config.admin import AdminConfig
+from ..models.response.user_import import UserImportReport, ImportRowIssue
+from ..resources.database import DatabaseResource
+from ..utils.normalizer import normalize_many
+from ..utils.date_converter import jalali_to_gregorian_many
+from ..utils.hashing import UNUSABLE_PASSWORD
+from ..utils.log import Log
+
+IMPORT_FORMATS = ("csv", "ndjson")
+
+STAGING_TABLE = "users_import"
+STAGING_COLUMNS = ("line", "mobile", "national_code", "birthday_date", "first_name", "last_name")
+
+_CREATE_STAGING = f"""
+CREATE TEMP TABLE IF NOT EXISTS {STAGING_TABLE} (
+    line INTEGER NOT NULL,
+    mobile VARCHAR(15) NOT NULL,
+    national_code VARCHAR(10) NOT NULL,
+    birthday_date DATE NOT NULL,
+    first_name VARCHAR(100) NOT NULL,
+    last_name VARCHAR(100) NOT NULL
+) ON COMMIT DELETE ROWS
+"""
+
+# Set-based merge of one staged batch. Rows repeating a mobile / national code
+# of an earlier line in the batch, or of an existing user, are skipped;
+# ON CONFLICT DO NOTHING covers users registered concurrently. Returns the
+# staged lines that were actually inserted; every other line is a duplicate.
+_MERGE = f"""
+WITH ranked AS (
+    SELECT s.*,
+           row_number() OVER (PARTITION BY s.mobile ORDER BY s.line) AS mobile_rank,
+           row_number() OVER (PARTITION BY s.national_code ORDER BY s.line) AS national_code_rank
+    FROM {STAGING_TABLE} s
+),
+candidates AS (
+    SELECT r.* FROM ranked r
+    WHERE r.mobile_rank = 1
+      AND r.national_code_rank = 1
+      AND NOT EXISTS (
+          SELECT 1 FROM users u
+          WHERE u.mobile = r.mobile OR u.national_code = r.national_code
+      )
+),
+inserted AS (
+    INSERT INTO users (mobile, national_code, birthday_date, first_name, last_name, password_hash, is_active)
+    SELECT mobile, national_code, birthday_date, first_name, last_name, :password_hash, TRUE
+    FROM candidates
+    ON CONFLICT DO NOTHING
+    RETURNING mobile
+)
+SELECT c.line FROM candidates c JOIN inserted i ON i.mobile = c.mobile
+"""
+
+
+class _PendingLines:
+    """
+    Line source of the import's csv.reader, filled as chunks arrive.
+    Lines are only added once a whole record is buffered, so the reader
+    never runs dry in the middle of one.
+    """
+
+    def __init__(self):
+        self.lines = deque()
+
+    def __iter__(self):
+        return self
+
+    def __next__(self) -> str:
+        if not self.lines:
+            raise StopIteration
+        return self.lines.popleft()
+
+
+def _ends_in_quoted_field(line: str, in_quotes: bool) -> bool:
+    """
+    Whether a quoted field is still open at the end of `line`, following
+    csv's default dialect: quotes only open a field at its start, and
+    "" inside one is an escaped quote.
+    """
+    at_field_start = not in_quotes
+    after_quote = False
+    for char in line:
+        if in_quotes:
+            if after_quote:
+                after_quote = False
+                if char != '"':
+                    in_quotes = False
+                    at_field_start = char == ","
+            elif char == '"':
+                after_quote = True
+        elif char == '"' and at_field_start:
+            in_quotes = True
+            at_field_start = False
+        else:
+            at_field_start = char == ","
+    return in_quotes and not after_quote
+
+
+def _split_jalali(value: str) -> tuple[int, int, int]:
+    # (0, 0, 0) is rejected by jalali_to_gregorian_many like any invalid date
+    parts = value.replace("/", "-").split("-")
+    if len(parts) != 3:
+        return 0, 0, 0
+    try:
+        return int(parts[0]), int(parts[1]), int(parts[2])
+    except ValueError:
+        return 0, 0, 0
+
+
+class UserImportService:
+    """
+    Bulk user import for onboarding whole sites at once.
+
+    The upload is streamed and processed in batches: each batch is
+    validated in Python, loaded into a temporary staging table with
+    COPY and merged into users with a single INSERT ... SELECT, then
+    committed. Duplicates and invalid rows are reported, never fatal.
+
+    Imported users get an unusable password and have to set one
+    through the password reset flow.
+    """
+
+    def __init__(
+        self,
+        db: DatabaseResource,
+        registration_filter: RegistrationFilter,
+        settings: AdminConfig
+    ):
+        self.db = db
+        self.registration_filter = registration_filter
+        self.settings = settings
+
+    # ---------------------------------------------------------
+    # Parsing
+    # ---------------------------------------------------------
+    @staticmethod
+    async def __iter_lines(chunks: AsyncIterator[bytes]) -> AsyncIterator[str]:
+        # utf-8-sig drops a leading byte order mark, even when split across chunks
+        decoder = codecs.getincrementaldecoder("utf-8-sig")()
+        buffer = ""
+        async for chunk in chunks:
+            buffer += decoder.decode(chunk)
+            *lines, buffer = buffer.split("\n")
+            for line in lines:
+                yield line.rstrip("\r")
+        buffer += decoder.decode(b"", final=True)
+        if buffer:
+            yield buffer.rstrip("\r")
+
+    @classmethod
+    async def __iter_records(cls, chunks: AsyncIterator[bytes], fmt: str) -> AsyncIterator[tuple[int, str | list[str]]]:
+        """
+        Yields (first line number, record): the raw line for NDJSON, the
+        parsed fields for CSV. One csv.reader reads the whole upload, so a
+        quoted field may span lines.
+        """
+        pending = _PendingLines()
+        reader = csv.reader(pending)
+        record_lines = 0
+        in_quotes = False
+        start = 0
+
+        line_no = 0
+        async for line in cls.__iter_lines(chunks):
+            line_no += 1
+            if fmt != "csv":
+                if line.strip():
+                    yield line_no, line
+                continue
+
+            if not record_lines:
+                if not line.strip():
+                    continue
+                start = line_no
+
+            pending.lines.append(line + "\n")
+            record_lines += 1
+            in_quotes = _ends_in_quoted_field(line, in_quotes)
+
+            if not in_quotes:
+                record_lines = 0
+                yield start, next(reader)
+
+        if record_lines:
+            # Unterminated quoted field at the end of the upload
+            try:
+                yield start, next(reader)
+            except csv.Error:
+                yield start, []
+
+    async def __iter_batches(self, chunks: AsyncIterator[bytes], fmt: str) -> AsyncIterator[list[tuple[int, dict | None]]]:
+        """Yields batches of (line number, raw row or None when unparsable)."""
+        header = None
+        batch = []
+
+        async for line_no, record in self.__iter_records(chunks, fmt):
+            if fmt == "csv":
+                if header is None:
+                    header = [h.strip().lstrip("\ufeff") for h in record]
+                    continue
+                row = dict(zip(header, record)) if record else None
+            else:
+                try:
+                    row = json.loads(record)
+                except json.JSONDecodeError:
+                    row = None
+                if not isinstance(row, dict):
+                    row = None
+
+            batch.append((line_no, row))
+            if len(batch) >= self.settings.import_batch_size:
+                yield batch
+                batch = []
+
+        if batch:
+            yield batch
+
+    @staticmethod
+    def __birthdays(batch: list[tuple[int, dict | None]]) -> list[date | None]:
+        """Converts the batch's birthday column in one vectorized call; None where invalid."""
+        years, months, days = [], [], []
+        for _, row in batch:
+            jy, jm, jd = _split_jalali(str(row.get("birthday") or "").strip() if row else "")
+            years.append(jy)
+            months.append(jm)
+            days.append(jd)
+        return jalali_to_gregorian_many(years, months, days).astype(object).tolist()
+
+    @staticmethod
+    def __validate(row: dict | None, mobile: str | None, birthday_date: date | None) -> tuple:
+        if row is None:
+            raise ValueError("Malformed row")
+
+        if mobile is None:
+            raise ValueError("Invalid mobile number")
+
+        national_code = str(row.get("national_code") or "").strip()
+        if len(national_code) != 10 or not national_code.isdigit():
+            raise ValueError("Invalid national code")
+
+        if birthday_date is None:
+            raise ValueError("Invalid Jalali birthday")
+
+        first_name = str(row.get("first_name") or "").strip()
+        last_name = str(row.get("last_name") or "").strip()
+        if not first_name or not last_name:
+            raise ValueError("Missing first or last name")
+        if len(first_name) > 100 or len(last_name) > 100:
+            raise ValueError("Name too long")
+
+        return mobile, national_code, birthday_date, first_name, last_name
+
+    # ---------------------------------------------------------
+    # Import
+    # ---------------------------------------------------------
+    async def import_users(self, chunks: AsyncIterator[bytes], fmt: str) -> UserImportReport:
+        if fmt not in IMPORT_FORMATS:
+            raise ValueError(f"Unsupported import format: {fmt}")
+
+        report = UserImportReport()
+        started = time.perf_counter()
+
+        # A single connection for the whole import: the staging table is a
+        # per-connection temp table, emptied by every per-batch commit
+        async with self.db.engine.connect() as conn:
+            raw = await conn.get_raw_connection()
+            driver = raw.driver_connection
+            if not hasattr(driver, "copy_records_to_table"):
+                raise ValueError("Bulk import requires PostgreSQL with the asyncpg driver")
+
+            async for batch in self.__iter_batches(chunks, fmt):
+                report.received += len(batch)
+
+                mobiles = normalize_many(
+                    str(row.get("mobile") or "") if row else "" for _, row in batch
+                )
+
+                birthdays = self.__birthdays(batch)
+
+                records = []
+                for (line, row), mobile, birthday_date in zip(batch, mobiles, birthdays):
+                    try:
+                        records.append((line, *self.__validate(row, mobile, birthday_date)))
+                    except (ValueError, TypeError) as e:
+                        report.invalid_count += 1
+                        if len(report.invalid) < self.settings.import_max_reported:
+                            report.invalid.append(ImportRowIssue(line=line, reason=str(e)))
+
+                if not records:
+                    continue
+
+                # Opens the batch transaction; COPY below runs inside it
+                await conn.execute(text(_CREATE_STAGING))
+                await driver.copy_records_to_table(
+                    STAGING_TABLE,
+                    records=records,
+                    columns=STAGING_COLUMNS
+                )
+                result = await conn.execute(text(_MERGE), {"password_hash": UNUSABLE_PASSWORD})
+                inserted_lines = set(result.scalars().all())
+                await conn.commit()
+
+                inserted = []
+                for record in records:
+                    if record[0] in inserted_lines:
+                        inserted.append((record[1], record[2]))
+                        continue
+                    report.duplicate_count += 1
+                    if len(report.duplicates) < self.settings.import_max_reported:
+                        report.duplicates.append(ImportRowIssue(
+                            line=record[0],
+                            reason="Mobile or national code already registered",
+                            mobile=record[1],
+                            national_code=record[2],
+                        ))
+
+                report.inserted += len(inserted)
+                await self.registration_filter.add_many(inserted)
+
+        report.elapsed_seconds = round(time.perf_counter() - started, 3)
+        Log.success(
+            f"[UserImportService] imported {report.inserted}/{report.received} users "
+            f"({report.duplicate_count} duplicates, {report.invalid_count} invalid) "
+            f"in {report.elapsed_seconds}s."
+        )
+        return report
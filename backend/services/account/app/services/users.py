@@ -1,48 +1,104 @@
+from typing import Awaitable, Callable
 from sqlalchemy.ext.asyncio import AsyncSession
 from ..crud.user import UserCRUD
 from ..models.db.user import User
+from ..resources.database import DatabaseResource
+from .user_cache import UserCache
 
 
 class UserService:
+    """
+    User lookups served through the two-tier UserCache; the database
+    is only hit on a cache miss. Users returned from the cache are
+    detached from any session and should be treated as read-only;
+    status changes go through the methods below, which invalidate them.
+
+    Cache misses are read from a replica. Replicas lag, so a user the
+    replica does not have yet (e.g. created by verify_otp a moment ago)
+    is looked up again on the primary, and so is a user changed within
+    database.read_your_writes_seconds (see UserCache.recently_changed).
+    """
+
+    def __init__(self, db: DatabaseResource, cache: UserCache):
+        self.db = db
+        self.cache = cache
+
+    async def __query(self, key: str, query: Callable[[AsyncSession], Awaitable[User | None]]) -> User | None:
+        on_primary = not self.db.has_replicas or self.cache.recently_changed(key)
+        async with self.db.get_read_session(primary=on_primary) as session:
+            user = await query(session)
+        if user is None and not on_primary:
+            async with self.db.get_write_session() as session:
+                user = await query(session)
+        return user
+
+    async def __load(self, key: str, query: Callable[[AsyncSession], Awaitable[User | None]]) -> User | None:
+        return await self.cache.get(key, lambda: self.__query(key, query))
 
     # ---------------------------------------------------------
     # Get user by ID
     # ---------------------------------------------------------
-    @staticmethod
-    async def get_user_by_id(db: AsyncSession, user_id: int) -> User | None:
-        return await UserCRUD.get_by_id(db, user_id)
+    async def get_user_by_id(self, user_id: int) -> User | None:
+        return await self.__load(
+            f"id:{user_id}",
+            lambda session: UserCRUD.get_by_id(session, user_id)
+        )
 
     # ---------------------------------------------------------
     # Get user by mobile
     # ---------------------------------------------------------
-    @staticmethod
-    async def get_user_by_mobile(db: AsyncSession, mobile: str) -> User | None:
-        return await UserCRUD.get_by_mobile(db, mobile)
+    async def get_user_by_mobile(self, mobile: str) -> User | None:
+        return await self.__load(
+            f"mobile:{mobile}",
+            lambda session: UserCRUD.get_by_mobile(session, mobile)
+        )
+
+    # ---------------------------------------------------------
+    # Get user by mobile, for authentication
+    # ---------------------------------------------------------
+    async def get_credentials_by_mobile(self, mobile: str) -> User | None:
+        """
+        The user row straight from the database, never from the cache:
+        cached users carry no password hash, and a cached row may predate
+        a password change or deactivation.
+        """
+        return await self.__query(
+            f"mobile:{mobile}",
+            lambda session: UserCRUD.get_by_mobile(session, mobile)
+        )
 
     # ---------------------------------------------------------
     # Get user by national code
     # ---------------------------------------------------------
-    @staticmethod
-    async def get_user_by_national_code(db: AsyncSession, national_code: str) -> User | None:
-        return await UserCRUD.get_by_national_code(db, national_code)
+    async def get_user_by_national_code(self, national_code: str) -> User | None:
+        return await self.__load(
+            f"nc:{national_code}",
+            lambda session: UserCRUD.get_by_national_code(session, national_code)
+        )
 
     # ---------------------------------------------------------
     # Exist user by national code
     # ---------------------------------------------------------
-    @staticmethod
-    async def exists_by_national_code(db: AsyncSession, national_code: str) -> bool:
-        return await UserCRUD.exists_by_national_code(db, national_code)
+    async def exists_by_national_code(self, national_code: str) -> bool:
+        return await self.get_user_by_national_code(national_code) is not None
 
     # ---------------------------------------------------------
     # Deactivate user
     # ---------------------------------------------------------
-    @staticmethod
-    async def deactivate_user(session: AsyncSession, user: User) -> None:
-        await UserCRUD.set_active_status(session, user, False)
+    async def deactivate_user(self, user: User) -> None:
+        async with self.db.get_write_session() as session:
+            await UserCRUD.set_active_status(session, user, False, cache=self.cache)
 
     # ---------------------------------------------------------
     # Activate user
     # ---------------------------------------------------------
-    @staticmethod
-    async def activate_user(session: AsyncSession, user: User) -> None:
-        await UserCRUD.set_active_status(session, user, True)
+    async def activate_user(self, user: User) -> None:
+        async with self.db.get_write_session() as session:
+            await UserCRUD.set_active_status(session, user, True, cache=self.cache)
+
+    # ---------------------------------------------------------
+    # Update password
+    # ---------------------------------------------------------
+    async def update_password(self, user: User, new_hash: str) -> None:
+        async with self.db.get_write_session() as session:
+            await UserCRUD.update_password(session, user, new_hash, cache=self.cache)
@@ -0,0 +1,29 @@
+import math
+import hashlib
+
+
+class BloomHasher:
+    """
+    Sizing and bit-offset computation for a Bloom filter, independent of
+    where the bits are stored.
+
+    Offsets use Kirsch-Mitzenmacher double hashing over a single
+    128-bit BLAKE2b digest, so each item costs one hash call.
+    """
+
+    def __init__(self, capacity: int, error_rate: float):
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.bits = max(8, math.ceil(-capacity * math.log(error_rate) / (math.log(2) ** 2)))
+        self.hashes = max(1, round(self.bits / capacity * math.log(2)))
+
+    def offsets(self, item: str) -> list[int]:
+        digest = hashlib.blake2b(item.encode("utf-8"), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        m = self.bits
+        return [(h1 + i * h2) % m for i in range(self.hashes)]
+
+    def estimated_false_positive_rate(self, bits_set: int) -> float:
+        """False-positive probability given the number of bits currently set."""
+        return (bits_set / self.bits) ** self.hashes
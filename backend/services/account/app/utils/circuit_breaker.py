@@ -0,0 +1,96 @@
+import time
+import asyncio
+
+
+class CircuitOpenError(RuntimeError):
+    """
+    Raised when a call is rejected because the circuit is open.
+    """
+
+
+class CircuitBreaker:
+    """
+    Consecutive-failure circuit breaker.
+
+    closed     → calls pass through; `failure_threshold` consecutive failures open the circuit
+    open       → calls fail fast with CircuitOpenError for `reset_timeout` seconds
+    half_open  → a single probe call is let through; success closes, failure re-opens.
+                 Calls arriving meanwhile wait for the probe's verdict instead of
+                 failing, so concurrent calls of one request (e.g. the identity
+                 checks of a signup) do not reject, and thereby cancel, the probe.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, name: str, failure_threshold: int, reset_timeout: float):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+
+        self._state = self.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+        self._verdict = asyncio.Event()
+        self._rejected = 0
+
+    @property
+    def state(self) -> str:
+        if self._state == self.OPEN and time.monotonic() - self._opened_at >= self.reset_timeout:
+            self._state = self.HALF_OPEN
+            self._probe_in_flight = False
+        return self._state
+
+    async def before_call(self) -> bool:
+        """
+        Admits a call or raises CircuitOpenError.
+        Returns True if the call is the half-open probe; the caller must then
+        report its outcome, or call release() if it ends without one.
+        """
+        while True:
+            state = self.state
+
+            if state == self.CLOSED:
+                return False
+
+            if state == self.OPEN:
+                self._rejected += 1
+                raise CircuitOpenError(f"Circuit '{self.name}' is open, upstream considered unhealthy")
+
+            if not self._probe_in_flight:
+                self._probe_in_flight = True
+                self._verdict = asyncio.Event()
+                return True
+
+            # Half-open with a probe in flight: re-check once it has finished
+            await self._verdict.wait()
+
+    def __end_probe(self) -> None:
+        self._probe_in_flight = False
+        self._verdict.set()
+
+    def record_success(self) -> None:
+        self._state = self.CLOSED
+        self._failures = 0
+        self.__end_probe()
+
+    def record_failure(self) -> None:
+        self._failures += 1
+
+        if self._state == self.HALF_OPEN or self._failures >= self.failure_threshold:
+            self._state = self.OPEN
+            self._opened_at = time.monotonic()
+        self.__end_probe()
+
+    def release(self) -> None:
+        """Forget the probe when it finished without a verdict (e.g. cancelled); a waiting call takes over."""
+        self.__end_probe()
+
+    def snapshot(self) -> dict:
+        return {
+            "state": self.state,
+            "consecutive_failures": self._failures,
+            "rejected_calls": self._rejected,
+        }
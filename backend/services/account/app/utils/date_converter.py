@@ -1,6 +1,71 @@
-import jdatetime
 from datetime import date
 
+# -------------------------------------------------------------
+# Pure-arithmetic Jalali calendar (same rules as jdatetime)
+#
+# Leap years follow the 33-year cycle: year % 33 in {1, 5, 9, 13, 17, 22, 26, 30}.
+# Dates are converted through proleptic Gregorian ordinals (date.toordinal),
+# so no intermediate objects are built per call.
+# -------------------------------------------------------------
+MIN_YEAR = 1
+MAX_YEAR = 9377
+
+CYCLE_YEARS = 33
+CYCLE_DAYS = CYCLE_YEARS * 365 + 8
+
+# 1/1/1 Jalali, as jdatetime places it
+EPOCH_ORDINAL = date(622, 3, 21).toordinal()
+
+# Days before each month
+MONTH_OFFSETS = (0, 31, 62, 93, 124, 155, 186, 216, 246, 276, 306, 336)
+
+_LEAP_REMAINDERS = frozenset((1, 5, 9, 13, 17, 22, 26, 30))
+
+# Days from the start of a 33-year cycle (years 33k+1 .. 33k+33) to each of its years
+_YEAR_OFFSETS = [0]
+for _i in range(CYCLE_YEARS - 1):
+    _YEAR_OFFSETS.append(_YEAR_OFFSETS[-1] + 365 + ((_i + 1) % CYCLE_YEARS in _LEAP_REMAINDERS))
+_YEAR_OFFSETS = tuple(_YEAR_OFFSETS)
+
+# Start of each year's day range inside a cycle, reversed for the linear scan
+_YEAR_OFFSETS_DESC = tuple(enumerate(_YEAR_OFFSETS))[::-1]
+
+_GREGORIAN_EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+
+
+def is_jalali_leap(year: int) -> bool:
+    return year % CYCLE_YEARS in _LEAP_REMAINDERS
+
+
+def _jalali_to_ordinal(jy: int, jm: int, jd: int) -> int:
+    if not MIN_YEAR <= jy <= MAX_YEAR:
+        raise ValueError("year is out of range")
+    if not 1 <= jm <= 12:
+        raise ValueError("month must be in 1..12")
+    days_in_month = 31 if jm <= 6 else 30 if jm <= 11 else 30 if is_jalali_leap(jy) else 29
+    if not 1 <= jd <= days_in_month:
+        raise ValueError("day is out of range for month")
+
+    cycle, index = divmod(jy - 1, CYCLE_YEARS)
+    return EPOCH_ORDINAL + cycle * CYCLE_DAYS + _YEAR_OFFSETS[index] + MONTH_OFFSETS[jm - 1] + jd - 1
+
+
+def _ordinal_to_jalali(ordinal: int) -> tuple[int, int, int]:
+    cycle, rem = divmod(ordinal - EPOCH_ORDINAL, CYCLE_DAYS)
+    for index, offset in _YEAR_OFFSETS_DESC:
+        if rem >= offset:
+            break
+    jy = cycle * CYCLE_YEARS + index + 1
+    if not MIN_YEAR <= jy <= MAX_YEAR:
+        raise ValueError("year is out of range")
+
+    day_of_year = rem - offset
+    if day_of_year < 186:
+        return jy, day_of_year // 31 + 1, day_of_year % 31 + 1
+    day_of_year -= 186
+    return jy, day_of_year // 30 + 7, day_of_year % 30 + 1
+
+
 def jalali_to_gregorian(jalali_str: str) -> date:
     """
     Converts Jalali date string (YYYY-MM-DD or YYYY/MM/DD) into Gregorian date.
@@ -13,12 +78,73 @@ def jalali_to_gregorian(jalali_str: str) -> date:
 
     jy, jm, jd = map(int, parts)
 
-    j = jdatetime.date(jy, jm, jd)
-    return j.togregorian()
+    return date.fromordinal(_jalali_to_ordinal(jy, jm, jd))
 
 def gregorian_to_jalali(gregorian_date: date) -> str:
     """
     Converts Gregorian date to Jalali date string (YYYY/MM/DD).
     """
-    j_date = jdatetime.date.fromgregorian(date=gregorian_date)
-    return f"{j_date.year}/{j_date.month}/{j_date.day}"
\ No newline at end of file
+    jy, jm, jd = _ordinal_to_jalali(gregorian_date.toordinal())
+    return f"{jy}/{jm}/{jd}"
+
+# -------------------------------------------------------------
+# Vectorized batch API (NumPy, imported lazily)
+# -------------------------------------------------------------
+def jalali_to_gregorian_many(years, months, days):
+    """
+    Converts arrays of Jalali year / month / day into a datetime64[D] array.
+    Invalid dates come back as NaT instead of raising.
+    """
+    import numpy as np
+
+    jy = np.asarray(years, dtype=np.int64)
+    jm = np.asarray(months, dtype=np.int64)
+    jd = np.asarray(days, dtype=np.int64)
+
+    leap = np.isin(jy % CYCLE_YEARS, tuple(_LEAP_REMAINDERS))
+    days_in_month = np.where(jm <= 6, 31, np.where(jm <= 11, 30, np.where(leap, 30, 29)))
+    valid = (
+        (jy >= MIN_YEAR) & (jy <= MAX_YEAR)
+        & (jm >= 1) & (jm <= 12)
+        & (jd >= 1) & (jd <= days_in_month)
+    )
+
+    cycle, index = np.divmod(jy - 1, CYCLE_YEARS)
+    ordinal = (
+        EPOCH_ORDINAL + cycle * CYCLE_DAYS
+        + np.asarray(_YEAR_OFFSETS)[np.clip(index, 0, CYCLE_YEARS - 1)]
+        + np.asarray(MONTH_OFFSETS)[np.clip(jm - 1, 0, 11)]
+        + jd - 1
+    )
+
+    result = (ordinal - _GREGORIAN_EPOCH_ORDINAL).astype("datetime64[D]")
+    result[~valid] = np.datetime64("NaT")
+    return result
+
+
+def gregorian_to_jalali_many(dates):
+    """
+    Converts an array of Gregorian dates (datetime64 or datetime.date) into
+    (years, months, days) integer arrays.
+    Raises ValueError for NaT or dates outside the supported Jalali range.
+    """
+    import numpy as np
+
+    values = np.asarray(dates, dtype="datetime64[D]")
+    if np.isnat(values).any():
+        raise ValueError("NaT in dates")
+
+    ordinal = values.astype(np.int64) + _GREGORIAN_EPOCH_ORDINAL
+    cycle, rem = np.divmod(ordinal - EPOCH_ORDINAL, CYCLE_DAYS)
+    index = np.searchsorted(np.asarray(_YEAR_OFFSETS), rem, side="right") - 1
+
+    jy = cycle * CYCLE_YEARS + index + 1
+    if ((jy < MIN_YEAR) | (jy > MAX_YEAR)).any():
+        raise ValueError("year is out of range")
+
+    day_of_year = rem - np.asarray(_YEAR_OFFSETS)[index]
+    second_half = np.maximum(day_of_year - 186, 0)
+    first = day_of_year < 186
+    jm = np.where(first, day_of_year // 31 + 1, second_half // 30 + 7)
+    jd = np.where(first, day_of_year % 31 + 1, second_half % 30 + 1)
+    return jy, jm, jd
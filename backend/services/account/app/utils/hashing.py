@@ -1,6 +1,13 @@
 import bcrypt
 
-def hash_password(password: str) -> str:
+# Stored for accounts created without a password (e.g. bulk imports).
+# Never produced by bcrypt, so no password can ever match it.
+UNUSABLE_PASSWORD = "!"
+
+# bcrypt's own default cost factor
+DEFAULT_ROUNDS = 12
+
+def hash_password(password: str, rounds: int = DEFAULT_ROUNDS) -> str:
     """
     Hash a password using bcrypt library directly.
     Returned hash is UTF-8 encoded string.
@@ -8,7 +15,7 @@ def hash_password(password: str) -> str:
     if isinstance(password, str):
         password = password.encode("utf-8")
 
-    salt = bcrypt.gensalt()
+    salt = bcrypt.gensalt(rounds)
     hashed = bcrypt.hashpw(password, salt)
 
     return hashed.decode("utf-8")  # store as string
@@ -18,6 +25,9 @@ def verify_password(password: str, hashed: str) -> bool:
     """
     Verify a password against a bcrypt hash.
     """
+    if hashed == UNUSABLE_PASSWORD:
+        return False
+
     if isinstance(password, str):
         password = password.encode("utf-8")
 
@@ -25,3 +35,15 @@ def verify_password(password: str, hashed: str) -> bool:
         hashed = hashed.encode("utf-8")
 
     return bcrypt.checkpw(password, hashed)
+
+
+def needs_rehash(hashed: str, rounds: int = DEFAULT_ROUNDS) -> bool:
+    """
+    True for a bcrypt hash made with a lower cost factor than `rounds`.
+    The cost is read from the hash itself ("$2b$<cost>$..."), no bcrypt work.
+    """
+    parts = hashed.split("$", 3)
+    if len(parts) < 4 or not parts[2].isdigit():
+        # Not a bcrypt hash (e.g. UNUSABLE_PASSWORD): nothing to upgrade
+        return False
+    return int(parts[2]) < rounds
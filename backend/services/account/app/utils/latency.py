@@ -0,0 +1,44 @@
+from collections import deque
+
+
+class LatencyStats:
+    """
+    Cheap latency bookkeeping for a single operation.
+
+    Recording is O(1); percentiles are computed on demand from a bounded
+    window of the most recent samples.
+    """
+
+    def __init__(self, window: int = 1024):
+        self.count = 0
+        self.errors = 0
+        self.total_seconds = 0.0
+        self.max_seconds = 0.0
+        self._samples: deque[float] = deque(maxlen=window)
+
+    def record(self, seconds: float, ok: bool = True) -> None:
+        self.count += 1
+        if not ok:
+            self.errors += 1
+        self.total_seconds += seconds
+        if seconds > self.max_seconds:
+            self.max_seconds = seconds
+        self._samples.append(seconds)
+
+    def snapshot(self) -> dict:
+        samples = sorted(self._samples)
+
+        def percentile(p: float) -> float | None:
+            if not samples:
+                return None
+            return round(samples[min(len(samples) - 1, int(p * len(samples)))] * 1000, 2)
+
+        return {
+            "count": self.count,
+            "errors": self.errors,
+            "avg_ms": round(self.total_seconds / self.count * 1000, 2) if self.count else None,
+            "max_ms": round(self.max_seconds * 1000, 2),
+            "p50_ms": percentile(0.50),
+            "p95_ms": percentile(0.95),
+            "p99_ms": percentile(0.99),
+        }
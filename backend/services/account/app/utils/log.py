@@ -1,25 +1,194 @@
-# Simple ANSI color utilities for styled prints
-class Log:
+import os
+import sys
+import json
+import time
+import queue
+import atexit
+import random
+import logging
+import contextvars
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener
+
+SERVICE_NAME = "account"
+SERVICE_LABEL = "AccountService"
+
+SUCCESS = 25
+logging.addLevelName(SUCCESS, "SUCCESS")
+
+# Fields attached to every record logged in the current context (request_id, ...)
+_context: contextvars.ContextVar[dict] = contextvars.ContextVar("log_context", default={})
+
+_logger = logging.getLogger(SERVICE_NAME)
+_logger.propagate = False
+_listener: QueueListener | None = None
+
+# call site -> [next allowed time, suppressed count], for Log.*(every=...)
+_throttled: dict[tuple, list] = {}
+
+
+# -------------------------------------------------------------
+# Formatters (run on the listener thread)
+# -------------------------------------------------------------
+class JsonFormatter(logging.Formatter):
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "ts": datetime.fromtimestamp(record.created, timezone.utc).isoformat(timespec="milliseconds"),
+            "level": record.levelname.lower(),
+            "service": SERVICE_NAME,
+            "msg": record.getMessage(),
+        }
+        entry.update(getattr(record, "fields", None) or {})
+        if record.exc_text:
+            entry["exc"] = record.exc_text
+        return json.dumps(entry, ensure_ascii=False, default=str)
+
+
+class TextFormatter(logging.Formatter):
+    # Simple ANSI color utilities for styled prints
     RESET = "\033[0m"
     BOLD = "\033[1m"
 
-    CYAN = "\033[96m"
-    GREEN = "\033[92m"
-    YELLOW = "\033[93m"
-    RED = "\033[91m"
+    STYLES = {
+        logging.DEBUG: ("\033[90m", "·"),
+        logging.INFO: ("\033[96m", "ℹ"),
+        SUCCESS: ("\033[92m", "✔"),
+        logging.WARNING: ("\033[93m", "⚠"),
+        logging.ERROR: ("\033[91m", "✘"),
+    }
+
+    def format(self, record: logging.LogRecord) -> str:
+        color, icon = self.STYLES.get(record.levelno, ("", "-"))
+        fields = getattr(record, "fields", None)
+        suffix = " " + " ".join(f"{k}={v}" for k, v in fields.items()) if fields else ""
+        text = f"{color}{self.BOLD}{icon} [{SERVICE_LABEL}] {record.getMessage()}{suffix}{self.RESET}"
+        if record.exc_text:
+            text += "\n" + record.exc_text
+        return text
+
+
+class _QueueHandler(QueueHandler):
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # Only resolve what cannot safely cross threads; the formatting and the
+        # write itself happen on the listener thread
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+
+# -------------------------------------------------------------
+# Setup
+# -------------------------------------------------------------
+def configure_logging(level: str = "INFO", fmt: str = "json"):
+    """
+    Routes Log through a QueueHandler; a QueueListener thread formats the
+    records and writes them to stdout, so the event loop never blocks on I/O.
+    fmt is "json" (one object per line) or "text" (colored, for local runs).
+    """
+    global _listener
+    shutdown_logging()
+
+    handler = logging.StreamHandler(sys.stdout)
+    handler.setFormatter(TextFormatter() if fmt == "text" else JsonFormatter())
+
+    records = queue.SimpleQueue()
+    _listener = QueueListener(records, handler)
+    _listener.start()
+
+    _logger.handlers[:] = [_QueueHandler(records)]
+    _logger.setLevel(str(level).upper())
+
+
+def shutdown_logging():
+    """Flushes pending records and stops the listener thread."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+
+atexit.register(shutdown_logging)
+
+
+@contextmanager
+def log_context(**fields):
+    """
+    Adds fields (e.g. request_id) to every record logged inside the block.
+    Fields passed as None are left out.
+    """
+    token = _context.set({**_context.get(), **{k: v for k, v in fields.items() if v is not None}})
+    try:
+        yield
+    finally:
+        _context.reset(token)
+
+
+# -------------------------------------------------------------
+# Facade
+# -------------------------------------------------------------
+def _emit(level: int, msg: str, every: float | None, sample: float | None, fields: dict):
+    if _listener is None:
+        # Not configured by the service (CLI tools, scripts): use env defaults
+        configure_logging(os.getenv("LOG_LEVEL", "INFO"), os.getenv("LOG_FORMAT", "json"))
+
+    if not _logger.isEnabledFor(level):
+        return
+
+    if sample is not None and random.random() >= sample:
+        return
+
+    if every is not None:
+        caller = sys._getframe(2)
+        key = (caller.f_code.co_filename, caller.f_lineno)
+        now = time.monotonic()
+        state = _throttled.get(key)
+        if state is not None and now < state[0]:
+            state[1] += 1
+            return
+        if state is not None and state[1]:
+            fields = {**fields, "suppressed": state[1]}
+        _throttled[key] = [now + every, 0]
+
+    context = _context.get()
+    if context:
+        fields = {**context, **fields}
+
+    _logger.log(level, msg, extra={"fields": fields})
+
+
+class Log:
+    """
+    Logging facade used across the service.
+
+    Optional keyword arguments:
+        every:  log this call site at most once per `every` seconds; the
+                number of skipped records is reported as `suppressed`
+        sample: log only this fraction (0..1) of calls
+        **fields: extra structured fields for the JSON record
+    """
+
+    @staticmethod
+    def debug(msg: str, *, every: float | None = None, sample: float | None = None, **fields):
+        _emit(logging.DEBUG, msg, every, sample, fields)
 
     @staticmethod
-    def info(msg: str):
-        print(f"{Log.CYAN}{Log.BOLD}ℹ [AccountService] {msg}{Log.RESET}")
+    def info(msg: str, *, every: float | None = None, sample: float | None = None, **fields):
+        _emit(logging.INFO, msg, every, sample, fields)
 
     @staticmethod
-    def success(msg: str):
-        print(f"{Log.GREEN}{Log.BOLD}✔ [AccountService] {msg}{Log.RESET}")
+    def success(msg: str, *, every: float | None = None, sample: float | None = None, **fields):
+        _emit(SUCCESS, msg, every, sample, fields)
 
     @staticmethod
-    def warn(msg: str):
-        print(f"{Log.YELLOW}{Log.BOLD}⚠ [AccountService] {msg}{Log.RESET}")
+    def warn(msg: str, *, every: float | None = None, sample: float | None = None, **fields):
+        _emit(logging.WARNING, msg, every, sample, fields)
 
     @staticmethod
-    def error(msg: str):
-        print(f"{Log.RED}{Log.BOLD}✘ [AccountService] {msg}{Log.RESET}")
+    def error(msg: str, *, every: float | None = None, sample: float | None = None, **fields):
+        _emit(logging.ERROR, msg, every, sample, fields)
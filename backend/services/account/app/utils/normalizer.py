@@ -1,4 +1,51 @@
-import phonenumbers
+import re
+from typing import Iterable
+
+# Persian (U+06F0..) and Arabic-Indic (U+0660..) digits → ASCII
+_DIGITS = str.maketrans(
+    "۰۱۲۳۴۵۶۷۸۹٠١٢٣٤٥٦٧٨٩",
+    "01234567890123456789",
+)
+
+# 9XXXXXXXXX with an optional 0 / 98 / 0098 prefix (digits only)
+_IR_MOBILE = re.compile(r"(?:0098|98|0)?(9[0-9]{9})")
+
+# Operator prefixes whose whole 9XX range is valid per libphonenumber's IR
+# mobile pattern. Anything else (partially allocated 99X ranges, landlines,
+# foreign numbers) is left to phonenumbers.
+_IR_MOBILE_PREFIXES = frozenset(
+    [f"90{d}" for d in "012345"]
+    + [f"91{d}" for d in "0123456789"]
+    + [f"92{d}" for d in "0123"]
+    + [f"93{d}" for d in "0123456789"]
+    + [f"99{d}" for d in "012346"]
+)
+
+
+def _fast_normalize(digits: str) -> str | None:
+    match = _IR_MOBILE.fullmatch(digits)
+    if match is None:
+        return None
+    national = match.group(1)
+    return national if national[:3] in _IR_MOBILE_PREFIXES else None
+
+
+def _phonenumbers_normalize(digits: str) -> str:
+    # Imported lazily: loading libphonenumber's metadata costs several MB per
+    # worker and is only needed for input outside the fast path
+    import phonenumbers
+
+    try:
+        parsed = phonenumbers.parse(digits, "IR")
+    except phonenumbers.phonenumberutil.NumberParseException:
+        raise ValueError("Invalid mobile number format")
+
+    if not phonenumbers.is_valid_number(parsed):
+        raise ValueError("Invalid Iranian mobile number")
+
+    # Return NATIONAL number like "9191234567"
+    return str(parsed.national_number)
+
 
 def normalize_mobile(mobile: str) -> str:
     """
@@ -12,16 +59,25 @@ def normalize_mobile(mobile: str) -> str:
     """
 
     # Remove all non-digit chars
-    digits = ''.join(filter(str.isdigit, mobile))
-    
-    # Now parse using phonenumbers
-    try:
-        parsed = phonenumbers.parse(digits, "IR")
-    except phonenumbers.phonenumberutil.NumberParseException:
-        raise ValueError("Invalid mobile number format")
+    digits = ''.join(filter(str.isdigit, mobile)).translate(_DIGITS)
 
-    if not phonenumbers.is_valid_number(parsed):
-        raise ValueError("Invalid Iranian mobile number")
+    # Fast path: Iranian mobile on a known operator prefix
+    national = _fast_normalize(digits)
+    if national is not None:
+        return national
 
-    # Return NATIONAL number like "9191234567"
-    return str(parsed.national_number)
+    return _phonenumbers_normalize(digits)
+
+
+def normalize_many(mobiles: Iterable[str]) -> list[str | None]:
+    """
+    Normalizes a batch of mobiles (e.g. for bulk imports).
+    Invalid entries come back as None instead of raising.
+    """
+    result = []
+    for mobile in mobiles:
+        try:
+            result.append(normalize_mobile(mobile))
+        except ValueError:
+            result.append(None)
+    return result
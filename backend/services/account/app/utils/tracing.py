@@ -0,0 +1,98 @@
+from opentelemetry import trace, propagate
+
+from ..config.tracing import TracingConfig
+from .log import Log
+
+# -------------------------------------------------------------
+# OpenTelemetry tracing for the account service
+#
+# Spans are created through the OpenTelemetry API. Until configure_tracing()
+# installs the SDK (tracing.enabled), every span is a no-op, so instrumented
+# code pays almost nothing with tracing off.
+# -------------------------------------------------------------
+SERVICE_NAME = "account"
+
+tracer = trace.get_tracer(SERVICE_NAME)
+
+_provider = None
+
+
+def configure_tracing(settings: TracingConfig, service_version: str = "1.0.0"):
+    """
+    Installs the OpenTelemetry SDK: spans are sampled with
+    ParentBased(TraceIdRatioBased(sample_ratio)) and exported in batches to
+    the OTLP collector, or kept in memory for tests.
+
+    Returns the span exporter (an InMemorySpanExporter for exporter="memory",
+    whose get_finished_spans() tests can read), or None when disabled.
+    """
+    global _provider
+    if not settings.enabled:
+        return None
+
+    # SDK and exporters are only needed (and imported) with tracing on
+    from opentelemetry.sdk.resources import Resource
+    from opentelemetry.sdk.trace import TracerProvider
+    from opentelemetry.sdk.trace.export import BatchSpanProcessor, SimpleSpanProcessor
+    from opentelemetry.sdk.trace.sampling import ParentBased, TraceIdRatioBased
+
+    provider = TracerProvider(
+        resource=Resource.create({
+            "service.name": SERVICE_NAME,
+            "service.version": service_version,
+        }),
+        sampler=ParentBased(TraceIdRatioBased(settings.sample_ratio)),
+    )
+
+    if settings.exporter == "memory":
+        from opentelemetry.sdk.trace.export.in_memory_span_exporter import InMemorySpanExporter
+        exporter = InMemorySpanExporter()
+        provider.add_span_processor(SimpleSpanProcessor(exporter))
+    else:
+        from opentelemetry.exporter.otlp.proto.grpc.trace_exporter import OTLPSpanExporter
+        exporter = OTLPSpanExporter(endpoint=settings.otlp_endpoint, insecure=True)
+        provider.add_span_processor(BatchSpanProcessor(exporter))
+
+    # The global provider can only be set once per process; `tracer` is a
+    # proxy and picks it up from here on
+    trace.set_tracer_provider(provider)
+    _provider = provider
+
+    Log.info(
+        f"[Tracing] exporting to {settings.exporter} "
+        f"({settings.otlp_endpoint if settings.exporter == 'otlp' else 'in-process'}), "
+        f"sample ratio {settings.sample_ratio}."
+    )
+    return exporter
+
+
+def shutdown_tracing():
+    """Flushes buffered spans to the exporter."""
+    global _provider
+    if _provider is not None:
+        _provider.shutdown()
+        _provider = None
+
+
+def tracing_enabled() -> bool:
+    return _provider is not None
+
+
+# -------------------------------------------------------------
+# Propagation (W3C traceparent / tracestate)
+# -------------------------------------------------------------
+def extract_context(carrier: dict):
+    """Returns the trace context carried by headers / metadata (str values)."""
+    return propagate.extract(carrier)
+
+
+def inject_context(carrier: dict) -> dict:
+    """Adds the current trace context to outgoing headers / metadata."""
+    propagate.inject(carrier)
+    return carrier
+
+
+def current_trace_id() -> str | None:
+    """Hex trace id of the current span when it is being recorded."""
+    context = trace.get_current_span().get_span_context()
+    return format(context.trace_id, "032x") if context.trace_flags.sampled else None
@@ -0,0 +1,126 @@
+"""
+Benchmark: Jalali/Gregorian conversion, arithmetic vs. jdatetime.
+
+With --verify, every day of the supported Jalali range (years 1..9377,
+~3.4M dates) is converted both ways with the scalar and vectorized
+functions and compared against jdatetime; the process exits non-zero on
+any mismatch. This takes a minute or two.
+
+Usage (from backend/services/account):
+    python -m benchmarks.date_converter [--calls 200000] [--verify]
+"""
+import sys
+import time
+import argparse
+from datetime import date
+
+import jdatetime
+import numpy as np
+
+from app.utils.date_converter import (
+    MIN_YEAR,
+    MAX_YEAR,
+    jalali_to_gregorian,
+    gregorian_to_jalali,
+    jalali_to_gregorian_many,
+    gregorian_to_jalali_many,
+)
+
+JALALI_SAMPLES = ("1370/01/01", "1375-06-31", "1399/12/30", "1402-11-15")
+GREGORIAN_SAMPLES = (date(1991, 3, 21), date(1996, 9, 21), date(2021, 3, 20), date(2024, 2, 4))
+
+
+def legacy_jalali_to_gregorian(jalali_str: str) -> date:
+    jy, jm, jd = map(int, jalali_str.replace("/", "-").split("-"))
+    return jdatetime.date(jy, jm, jd).togregorian()
+
+
+def legacy_gregorian_to_jalali(gregorian_date: date) -> str:
+    j = jdatetime.date.fromgregorian(date=gregorian_date)
+    return f"{j.year}/{j.month}/{j.day}"
+
+
+def per_call_us(fn, samples, calls: int) -> float:
+    started = time.perf_counter()
+    for i in range(calls):
+        fn(samples[i & 3])
+    return (time.perf_counter() - started) / calls * 1e6
+
+
+def verify() -> int:
+    mismatches = 0
+    years, months, days, expected = [], [], [], []
+
+    for jy in range(MIN_YEAR, MAX_YEAR + 1):
+        for jm in range(1, 13):
+            length = 31 if jm <= 6 else 30 if jm <= 11 else 30 if jdatetime.date(jy, 1, 1).isleap() else 29
+            for jd in range(1, length + 1):
+                g = jdatetime.date(jy, jm, jd).togregorian()
+
+                if jalali_to_gregorian(f"{jy}/{jm}/{jd}") != g:
+                    mismatches += 1
+                if gregorian_to_jalali(g) != f"{jy}/{jm}/{jd}":
+                    mismatches += 1
+
+                years.append(jy)
+                months.append(jm)
+                days.append(jd)
+                expected.append(g)
+
+        # Day 30 of Esfand must be rejected in common years, like jdatetime does
+        if not jdatetime.date(jy, 1, 1).isleap():
+            try:
+                jalali_to_gregorian(f"{jy}/12/30")
+                mismatches += 1
+            except ValueError:
+                pass
+
+    expected = np.array(expected, dtype="datetime64[D]")
+    converted = jalali_to_gregorian_many(years, months, days)
+    mismatches += int((converted != expected).sum())
+
+    jy, jm, jd = gregorian_to_jalali_many(expected)
+    mismatches += int(((jy != years) | (jm != months) | (jd != days)).sum())
+
+    print(f"verified {len(years)} dates against jdatetime: {mismatches} mismatches")
+    return mismatches
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--calls", type=int, default=200_000)
+    parser.add_argument("--verify", action="store_true")
+    args = parser.parse_args()
+
+    if args.verify and verify():
+        sys.exit(1)
+
+    rows = [
+        ("jalali_to_gregorian", legacy_jalali_to_gregorian, jalali_to_gregorian, JALALI_SAMPLES),
+        ("gregorian_to_jalali", legacy_gregorian_to_jalali, gregorian_to_jalali, GREGORIAN_SAMPLES),
+    ]
+    for name, legacy, fast, samples in rows:
+        before = per_call_us(legacy, samples, args.calls)
+        after = per_call_us(fast, samples, args.calls)
+        print(f"{name:22} jdatetime {before:6.2f} us   arithmetic {after:6.2f} us  ({before / after:.1f}x)")
+
+    n = args.calls
+    rng = np.random.default_rng(0)
+    years = rng.integers(1300, 1420, n)
+    months = rng.integers(1, 13, n)
+    days = rng.integers(1, 30, n)
+
+    started = time.perf_counter()
+    gregorian = jalali_to_gregorian_many(years, months, days)
+    many_to_g = (time.perf_counter() - started) / n * 1e9
+
+    started = time.perf_counter()
+    gregorian_to_jalali_many(gregorian)
+    many_to_j = (time.perf_counter() - started) / n * 1e9
+
+    print(f"jalali_to_gregorian_many  {many_to_g:6.1f} ns/date")
+    print(f"gregorian_to_jalali_many  {many_to_j:6.1f} ns/date")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+"""
+Micro-benchmark: per-request cost of resolving the signup service.
+
+    legacy     SignupService constructed in the dependency on every request
+               (with the old SingletonClass base, which re-ran __init__ on
+               one shared instance)
+    container  the service built once in the lifespan, looked up by the
+               dependency in api/dependencies.py
+
+Reports the dependency call alone and a full request through FastAPI
+(called directly over ASGI) whose handler does nothing else.
+
+Usage (from backend/services/account):
+    python -m benchmarks.dependencies [--calls 50000]
+"""
+import time
+import asyncio
+import argparse
+from types import SimpleNamespace
+from typing import Callable
+
+import redis.asyncio as redis
+from fastapi import FastAPI, Request, Depends
+
+from app.api.dependencies import get_signup_service
+from app.services.signup import SignupService
+from benchmarks.responses import call
+
+
+class LegacySignupService(SignupService):
+    # The removed SingletonClass base
+    def __new__(cls, *args, **kwargs):
+        if not hasattr(cls, 'instance'):
+            cls.instance = super().__new__(cls)
+        return cls.instance
+
+
+def build_app() -> tuple[FastAPI, Callable]:
+    app = FastAPI()
+
+    # Only the Redis client is touched while wiring (script registration);
+    # it never connects here
+    app.state.db = None
+    app.state.redis = SimpleNamespace(client=redis.Redis())
+    app.state.jwt = None
+    app.state.hashing = None
+    app.state.identity_validator = None
+    app.state.registration_filter = None
+    app.state.outbox = None
+    app.state.services = SimpleNamespace(signup=SignupService(
+        app.state.db, app.state.redis, app.state.jwt, app.state.hashing,
+        app.state.identity_validator, app.state.registration_filter, app.state.outbox
+    ))
+
+    def get_legacy_signup_service(request: Request):
+        return LegacySignupService(
+            request.app.state.db,
+            request.app.state.redis,
+            request.app.state.jwt,
+            request.app.state.hashing,
+            request.app.state.identity_validator if hasattr(request.app.state, 'identity_validator') else None,
+            request.app.state.registration_filter,
+            request.app.state.outbox
+        )
+
+    @app.post("/legacy")
+    async def legacy(service: SignupService = Depends(get_legacy_signup_service)):
+        return None
+
+    @app.post("/container")
+    async def container(service: SignupService = Depends(get_signup_service)):
+        return None
+
+    return app, get_legacy_signup_service
+
+
+async def per_call_us(fn, request, calls: int) -> float:
+    started = time.perf_counter()
+    for _ in range(calls):
+        result = fn(request)
+        if asyncio.iscoroutine(result):
+            await result
+    return (time.perf_counter() - started) / calls * 1e6
+
+
+async def per_request_us(app, path: str, calls: int) -> float:
+    for _ in range(calls // 10):
+        await call(app, path)
+    started = time.perf_counter()
+    for _ in range(calls):
+        await call(app, path)
+    return (time.perf_counter() - started) / calls * 1e6
+
+
+async def run(calls: int):
+    app, get_legacy_signup_service = build_app()
+    request = SimpleNamespace(app=app)
+
+    legacy = await per_call_us(get_legacy_signup_service, request, calls)
+    container = await per_call_us(get_signup_service, request, calls)
+    print(f"dependency   legacy:    {legacy:7.2f} us")
+    print(f"dependency   container: {container:7.2f} us  ({legacy / container:.1f}x)")
+
+    # The legacy dependency is sync, so FastAPI runs it on its thread pool
+    legacy = await per_request_us(app, "/legacy", calls)
+    container = await per_request_us(app, "/container", calls)
+    print(f"request      legacy:    {legacy:7.1f} us")
+    print(f"request      container: {container:7.1f} us  ({legacy / container:.2f}x)")
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--calls", type=int, default=50_000)
+    args = parser.parse_args()
+    asyncio.run(run(args.calls))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,189 @@
+"""
+Benchmark: POST /api/v1/auth/login.
+
+Boots the account app in-process (real lifespan, middleware and routes)
+against Redis at --redis-url (or fakeredis) and a fresh SQLite file with
+--users users, then runs concurrent logins of three kinds:
+    ok        registered mobile, right password
+    wrong     registered mobile, wrong password
+    unknown   unregistered mobile (checked against the dummy hash)
+Reports req/s and p50/p99 latency per kind (wrong and unknown should take
+as long as each other) and the Redis commands per login from the
+service's own metrics. Then checks the lockout and the transparent rehash
+of a hash made with --rounds - 2.
+
+bcrypt dominates every login, so the numbers scale with --rounds and the
+hashing pool size (HASHING_WORKERS); --rounds defaults to 10 to keep the
+run short.
+
+Usage (from backend/services/account):
+    python -m benchmarks.login [--logins 200] [--concurrency 20] [--rounds 10]
+        [--redis-url redis://localhost:6379/15]
+"""
+import os
+import time
+import asyncio
+import argparse
+import tempfile
+from datetime import date
+
+from benchmarks.signup_e2e import _use_fakeredis, _prepare_database, percentile
+
+PASSWORD = "bench-Passw0rd"
+KINDS = ("ok", "wrong", "unknown")
+
+
+def _mobile(n: int) -> str:
+    return f"0912{n:07d}"
+
+
+async def _seed(url: str, users: int, rounds: int):
+    from sqlalchemy import insert
+    from sqlalchemy.ext.asyncio import create_async_engine
+    from app.models.db.user import User
+    from app.utils.hashing import hash_password
+
+    # One hash shared by every user; the last user gets an outdated cost
+    current, outdated = hash_password(PASSWORD, rounds), hash_password(PASSWORD, rounds - 2)
+    rows = [
+        {
+            "mobile": _mobile(n)[1:],
+            "national_code": f"{n:010d}",
+            "birthday_date": date(1990, 1, 1),
+            "password_hash": outdated if n == users else current,
+            "first_name": "Bench",
+            "last_name": str(n),
+        }
+        for n in range(1, users + 1)
+    ]
+    engine = create_async_engine(url)
+    try:
+        async with engine.begin() as conn:
+            await conn.execute(insert(User), rows)
+    finally:
+        await engine.dispose()
+
+
+def redis_commands() -> dict[str, float]:
+    from app.utils.metrics import REGISTRY
+
+    counts = {}
+    for family in REGISTRY.collect():
+        if family.name != "account_redis_command_duration_seconds":
+            continue
+        for sample in family.samples:
+            if sample.name.endswith("_count"):
+                command = sample.labels["command"]
+                counts[command] = counts.get(command, 0) + sample.value
+    return counts
+
+
+async def login(client, mobile: str, password: str):
+    return await client.post("/api/v1/auth/login", json={"mobile": mobile, "password": password})
+
+
+async def drive(client, kind: str, logins: int, concurrency: int, users: int) -> tuple[list[float], dict, float]:
+    numbers = iter(range(logins))
+    latencies, statuses = [], {}
+
+    async def worker():
+        for n in numbers:
+            # Spread over the users so no one account reaches the lockout
+            mobile = _mobile(n % (users - 1) + 1) if kind != "unknown" else _mobile(users + 1 + n)
+            password = PASSWORD if kind == "ok" else "not-the-password"
+            started = time.perf_counter()
+            response = await login(client, mobile, password)
+            latencies.append(time.perf_counter() - started)
+            statuses[response.status_code] = statuses.get(response.status_code, 0) + 1
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    latencies.sort()
+    return latencies, statuses, time.perf_counter() - started
+
+
+async def benchmark(args):
+    import httpx
+    from app.main import app
+    from app.utils.hashing import needs_rehash
+
+    async with app.router.lifespan_context(app):
+        transport = httpx.ASGITransport(app=app, raise_app_exceptions=False)
+        async with httpx.AsyncClient(transport=transport, base_url="http://account", timeout=None) as client:
+            # Warm the user cache and the connection pools
+            await drive(client, "ok", args.users, args.concurrency, args.users)
+
+            print(f"{args.logins} logins per kind, concurrency {args.concurrency}, bcrypt cost {args.rounds}")
+            print(f"{'kind':<8} {'req/s':>8} {'p50 ms':>8} {'p99 ms':>8}  statuses       redis commands per login")
+            for kind in KINDS:
+                before = redis_commands()
+                latencies, statuses, wall = await drive(client, kind, args.logins, args.concurrency, args.users)
+                after = redis_commands()
+                commands = {
+                    command: round((after[command] - before.get(command, 0)) / args.logins, 2)
+                    for command in after if after[command] > before.get(command, 0)
+                }
+                print(
+                    f"{kind:<8} {len(latencies) / wall:>8.1f} {percentile(latencies, 0.50) * 1000:>8.1f} "
+                    f"{percentile(latencies, 0.99) * 1000:>8.1f}  {str(statuses):<14} {commands}"
+                )
+
+            # Lockout: max_failed_attempts wrong passwords, then even the right one is refused
+            mobile = _mobile(args.users - 1)
+            limit = app.state.services.login.settings.max_failed_attempts
+            for _ in range(limit):
+                await login(client, mobile, "not-the-password")
+            response = await login(client, mobile, PASSWORD)
+            print(
+                f"after {limit} failures: {response.status_code} "
+                f"(Retry-After {response.headers.get('retry-after')}s)"
+            )
+
+            # Transparent rehash of the outdated hash
+            mobile = _mobile(args.users)[1:]
+            users = app.state.services.users
+            outdated = (await users.get_credentials_by_mobile(mobile)).password_hash
+            response = await login(client, _mobile(args.users), PASSWORD)
+            upgraded = (await users.get_credentials_by_mobile(mobile)).password_hash
+            print(
+                f"outdated hash login: {response.status_code}, cost {outdated.split('$')[2]} -> "
+                f"{upgraded.split('$')[2]}, still outdated: {needs_rehash(upgraded, args.rounds)}"
+            )
+            response = await login(client, _mobile(args.users), PASSWORD)
+            print(f"login with the upgraded hash: {response.status_code}")
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--logins", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument("--users", type=int, default=50)
+    parser.add_argument("--rounds", type=int, default=10)
+    parser.add_argument("--redis-url", help="default: fakeredis")
+    args = parser.parse_args()
+
+    database_url = f"sqlite+aiosqlite:///{tempfile.mkdtemp(prefix='login-')}/account.db"
+
+    # Configuration the app reads in its lifespan
+    os.environ.update({
+        "DATABASE_URL": database_url,
+        "REDIS_URL": args.redis_url or "redis://fakeredis",
+        "HASHING_ROUNDS": str(args.rounds),
+        "RATE_LIMIT_ENABLED": "false",   # every login comes from one client
+        "OUTBOX_RELAY_ENABLED": "false",
+        "TRACING_ENABLED": "false",
+        "LOG_LEVEL": "WARNING",
+    })
+    os.environ.setdefault("JWT_SECRET", "benchmark-secret")
+    os.environ.setdefault("API_IR_API_KEY", "benchmark-key")
+
+    if not args.redis_url:
+        _use_fakeredis()
+
+    asyncio.run(_prepare_database(database_url))
+    asyncio.run(_seed(database_url, args.users, args.rounds))
+    asyncio.run(benchmark(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+"""
+Micro-benchmark: mobile normalization, fast path vs. phonenumbers.
+
+Reports per-call cost, batch cost and the resident memory of a fresh
+interpreter after the first normalization (i.e. what every worker pays).
+Also cross-checks the fast path against phonenumbers on random input.
+
+Usage (from backend/services/account):
+    python -m benchmarks.normalizer [--calls 200000]
+"""
+import sys
+import time
+import random
+import argparse
+import subprocess
+
+from app.utils.normalizer import normalize_mobile, normalize_many, _phonenumbers_normalize
+
+SAMPLES = ("09121234567", "+989351234567", "9191234567", "0098 990 123 4567")
+
+# Run in a fresh interpreter so earlier imports don't skew the numbers
+RSS_PROBE = """
+import time
+started = time.perf_counter()
+{setup}
+elapsed = time.perf_counter() - started
+rss = 0
+with open("/proc/self/status") as f:
+    for line in f:
+        if line.startswith("VmRSS:"):
+            rss = int(line.split()[1])
+print(rss, elapsed)
+"""
+
+LEGACY_SETUP = """
+import phonenumbers
+parsed = phonenumbers.parse("09121234567", "IR")
+phonenumbers.is_valid_number(parsed)
+"""
+
+FAST_SETUP = """
+from app.utils.normalizer import normalize_mobile
+normalize_mobile("09121234567")
+"""
+
+BASELINE_SETUP = "pass"
+
+
+def legacy_normalize(mobile: str) -> str:
+    digits = ''.join(filter(str.isdigit, mobile))
+    return _phonenumbers_normalize(digits)
+
+
+def per_call_us(fn, calls: int) -> float:
+    started = time.perf_counter()
+    for i in range(calls):
+        fn(SAMPLES[i & 3])
+    return (time.perf_counter() - started) / calls * 1e6
+
+
+def probe(setup: str) -> tuple[int, float]:
+    out = subprocess.run(
+        [sys.executable, "-c", RSS_PROBE.format(setup=setup)],
+        capture_output=True, text=True, check=True
+    ).stdout.split()
+    return int(out[0]), float(out[1])
+
+
+def cross_check(count: int) -> int:
+    def result(fn, value):
+        try:
+            return fn(value)
+        except ValueError as e:
+            return f"error: {e}"
+
+    rng = random.Random(0)
+    mismatches = 0
+    for _ in range(count):
+        national = f"9{rng.randrange(10 ** 9):09d}"
+        for value in (national, "0" + national, "+98" + national, "0" + national[:-1]):
+            if result(normalize_mobile, value) != result(legacy_normalize, value):
+                mismatches += 1
+    return mismatches
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--calls", type=int, default=200_000)
+    args = parser.parse_args()
+
+    mismatches = cross_check(20_000)
+    print(f"cross-check vs phonenumbers: {mismatches} mismatches in 80000 inputs")
+
+    legacy = per_call_us(legacy_normalize, args.calls)
+    fast = per_call_us(normalize_mobile, args.calls)
+
+    batch = [SAMPLES[i & 3] for i in range(args.calls)]
+    started = time.perf_counter()
+    normalize_many(batch)
+    many = (time.perf_counter() - started) / args.calls * 1e6
+
+    print(f"per call   phonenumbers: {legacy:7.2f} us")
+    print(f"per call   fast path:    {fast:7.2f} us  ({legacy / fast:.1f}x)")
+    print(f"per item   normalize_many: {many:5.2f} us")
+
+    base_rss, _ = probe(BASELINE_SETUP)
+    legacy_rss, legacy_import = probe(LEGACY_SETUP)
+    fast_rss, fast_import = probe(FAST_SETUP)
+    print(f"worker RSS phonenumbers: {legacy_rss / 1024:6.1f} MiB (+{(legacy_rss - base_rss) / 1024:.1f}), first call {legacy_import * 1000:.0f} ms")
+    print(f"worker RSS fast path:    {fast_rss / 1024:6.1f} MiB (+{(fast_rss - base_rss) / 1024:.1f}), first call {fast_import * 1000:.0f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,138 @@
+"""
+Benchmark: read routing in DatabaseResource.
+
+Runs user lookups through get_read_session() against a primary and
+--replicas replica databases (separate SQLite files with the same rows,
+so the replicas never see later writes: infinite lag), optionally plus
+one unreachable replica. Reports:
+    - per-lookup cost on the read path vs. the write path (routing overhead)
+    - how the reads were spread over the databases, from the service's
+      own db_pool_checkout metric
+    - read-your-writes through UserService: a user created on the primary
+      only, and a password changed on the primary only, read back right away
+
+Usage (from backend/services/account):
+    python -m benchmarks.read_replicas [--reads 5000] [--replicas 2] [--broken-replica]
+"""
+import time
+import asyncio
+import argparse
+import tempfile
+from datetime import date
+
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app.config.database import DatabaseConfig
+from app.config.user_cache import UserCacheConfig
+from app.crud.user import UserCRUD
+from app.models.db.user import User
+from app.resources.database import DatabaseResource
+from app.services.user_cache import UserCache
+from app.services.users import UserService
+from app.utils.metrics import REGISTRY
+from benchmarks.signup_e2e import _prepare_database
+
+USERS = 100
+
+
+def _user(index: int) -> dict:
+    return {
+        "mobile": f"0912{index:07d}",
+        "national_code": f"{index:010d}",
+        "birthday_date": date(1990, 1, 1),
+        "password_hash": "old-hash",
+        "first_name": "Bench",
+        "last_name": str(index),
+    }
+
+
+async def _seed(url: str):
+    await _prepare_database(url)
+    engine = create_async_engine(url)
+    try:
+        async with engine.begin() as conn:
+            await conn.execute(insert(User), [_user(index) for index in range(USERS)])
+    finally:
+        await engine.dispose()
+
+
+def checkouts_by_database() -> dict[str, float]:
+    counts = {}
+    for family in REGISTRY.collect():
+        if family.name != "account_db_pool_checkout_duration_seconds":
+            continue
+        for sample in family.samples:
+            if sample.name.endswith("_count"):
+                database = sample.labels["database"]
+                counts[database] = counts.get(database, 0) + sample.value
+    return counts
+
+
+async def per_lookup_us(session_context, reads: int) -> float:
+    started = time.perf_counter()
+    for index in range(reads):
+        async with session_context() as session:
+            await UserCRUD.get_by_id(session, index % USERS + 1)
+    return (time.perf_counter() - started) / reads * 1e6
+
+
+async def run(args):
+    directory = tempfile.mkdtemp(prefix="read-replicas-")
+    names = ["primary"] + [f"replica{index}" for index in range(args.replicas)]
+    urls = [f"sqlite+aiosqlite:///{directory}/{name}.db" for name in names]
+    for url in urls:
+        await _seed(url)
+
+    replica_urls = urls[1:]
+    if args.broken_replica:
+        replica_urls.append(f"sqlite+aiosqlite:///{directory}/missing/replica.db")
+
+    db = DatabaseResource(DatabaseConfig(url=urls[0], replica_urls=replica_urls))
+    await db.initialize()
+    try:
+        # Warm every engine (first connects, statement caches)
+        await per_lookup_us(db.get_read_session, (len(replica_urls) + 1) * 10)
+        await per_lookup_us(db.get_write_session, 10)
+
+        before = checkouts_by_database()
+        read = await per_lookup_us(db.get_read_session, args.reads)
+        after = checkouts_by_database()
+        write = await per_lookup_us(db.get_write_session, args.reads)
+
+        print(f"{len(replica_urls)} replicas{' (one unreachable)' if args.broken_replica else ''}, {args.reads} lookups")
+        print(f"lookup  write session: {write:8.1f} us")
+        print(f"lookup  read session:  {read:8.1f} us  ({read - write:+.1f} us routing)")
+        print("reads per database:")
+        for database in sorted(after):
+            print(f"  {database:<10} {after[database] - before.get(database, 0):8.0f}")
+        for replica in db.stats()["replicas"]:
+            if not replica["healthy"]:
+                print(f"  {replica['name']} marked down after {replica['failures']} failed connect(s)")
+
+        # Read-your-writes: the replicas never get these changes
+        users = UserService(db, UserCache(None, UserCacheConfig(enabled=False), changed_ttl=5))
+        async with db.get_write_session() as session:
+            created = await UserCRUD.create(session, **_user(USERS))
+        found = await users.get_user_by_id(created.id)
+        print(f"user created on the primary, read back:     {'found' if found else 'MISSING'}")
+
+        user = await users.get_user_by_id(1)
+        await users.update_password(user, "new-hash")
+        reread = await users.get_user_by_id(1)
+        print(f"password changed on the primary, read back: {reread.password_hash}")
+    finally:
+        await db.close()
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--reads", type=int, default=5000)
+    parser.add_argument("--replicas", type=int, default=2)
+    parser.add_argument("--broken-replica", action="store_true", help="add a replica that cannot be connected to")
+    args = parser.parse_args()
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
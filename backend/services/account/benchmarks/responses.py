@@ -0,0 +1,119 @@
+"""
+Micro-benchmark: signup verify response, ORM dict + jsonable_encoder
+(the previous route) vs. response model + orjson (the current one).
+
+Both routes run through FastAPI's full request/response path, called
+directly over ASGI, so routing and dependency overhead are included and
+identical. Reports per-request cost and the response size.
+
+Usage (from backend/services/account):
+    python -m benchmarks.responses [--calls 20000]
+"""
+import time
+import asyncio
+import argparse
+from datetime import date, datetime
+
+from fastapi import FastAPI
+from fastapi.responses import JSONResponse, ORJSONResponse
+
+from app.models.db.user import User
+from app.models.response.signup import SignupVerifyResponse
+
+
+def sample_payload() -> dict:
+    user = User(
+        id=1042,
+        mobile="9121234567",
+        national_code="0012345678",
+        birthday_date=date(1991, 3, 21),
+        first_name="Ali",
+        last_name="Rezaei",
+        password_hash="$2b$12$" + "x" * 53,
+        is_active=True,
+        created_at=datetime(2025, 1, 1, 12, 0, 0),
+        updated_at=datetime(2025, 1, 1, 12, 0, 0),
+    )
+    return {
+        "user": user,
+        # Typical HS256 token lengths
+        "access_token": "a" * 180,
+        "refresh_token": "r" * 180,
+    }
+
+
+def build_app() -> FastAPI:
+    app = FastAPI()
+    payload = sample_payload()
+
+    @app.post("/legacy", response_class=JSONResponse)
+    async def legacy():
+        return payload
+
+    @app.post("/current", response_model=SignupVerifyResponse, response_class=ORJSONResponse)
+    async def current():
+        return payload
+
+    return app
+
+
+async def call(app, path: str) -> bytes:
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "POST",
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "root_path": "",
+        "query_string": b"",
+        "headers": [],
+        "server": ("bench", 80),
+        "client": ("127.0.0.1", 1),
+    }
+    body = []
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        if message["type"] == "http.response.body":
+            body.append(message.get("body", b""))
+
+    await app(scope, receive, send)
+    return b"".join(body)
+
+
+async def per_request_us(app, path: str, calls: int) -> float:
+    for _ in range(calls // 10):
+        await call(app, path)
+    started = time.perf_counter()
+    for _ in range(calls):
+        await call(app, path)
+    return (time.perf_counter() - started) / calls * 1e6
+
+
+async def run(calls: int):
+    app = build_app()
+
+    legacy_body = await call(app, "/legacy")
+    current_body = await call(app, "/current")
+    print(f"password_hash in body  legacy: {b'password_hash' in legacy_body}, current: {b'password_hash' in current_body}")
+
+    legacy = await per_request_us(app, "/legacy", calls)
+    current = await per_request_us(app, "/current", calls)
+
+    print(f"per request  jsonable_encoder + json: {legacy:7.1f} us, {len(legacy_body)} bytes")
+    print(f"per request  response model + orjson: {current:7.1f} us, {len(current_body)} bytes  ({legacy / current:.2f}x)")
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--calls", type=int, default=20_000)
+    args = parser.parse_args()
+    asyncio.run(run(args.calls))
+
+
+if __name__ == "__main__":
+    main()
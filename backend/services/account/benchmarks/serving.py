@@ -0,0 +1,216 @@
+"""
+Benchmark: throughput of python -m app.serve, single process vs. pre-forked.
+
+Starts the real server once per worker count, against Redis at --redis-url
+(or a fakeredis TCP server) and a fresh SQLite file, and drives it with
+keep-alive HTTP/1.1 clients spread over several processes. Reports req/s
+and p50/p99 latency per route and worker count.
+
+Routes:
+    health  GET /health (framework and middleware only)
+    verify  POST /api/v1/signup/verify with an unknown key (body
+            validation, one Redis script call and a 400 response)
+
+Numbers are only meaningful with as many free cores as workers plus
+client processes. Without --redis-url only the health route runs: the
+fakeredis TCP server drops connections under concurrent script calls.
+
+Usage (from backend/services/account):
+    python -m benchmarks.serving [--workers 1 4] [--seconds 10]
+        [--connections 64] [--clients 4] [--redis-url redis://localhost:6379/15]
+"""
+import os
+import sys
+import time
+import asyncio
+import argparse
+import tempfile
+import threading
+import subprocess
+import multiprocessing
+
+from benchmarks.signup_e2e import _free_port, _wait_for_port, _prepare_database, percentile
+
+ROUTES = {
+    "health": ("GET", "/health", b""),
+    "verify": ("POST", "/api/v1/signup/verify", b'{"key": "0000000000000000", "code": "000000"}'),
+}
+
+
+# -------------------------------------------------------------
+# Load generator (one per client process)
+# -------------------------------------------------------------
+async def _connection(port: int, request: bytes, deadline: float, latencies: list, errors: list):
+    while time.perf_counter() < deadline:
+        try:
+            reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        except OSError as e:
+            errors.append(repr(e))
+            await asyncio.sleep(0.1)
+            continue
+        try:
+            while time.perf_counter() < deadline:
+                started = time.perf_counter()
+                writer.write(request)
+                head = await reader.readuntil(b"\r\n\r\n")
+                length = 0
+                for line in head.split(b"\r\n"):
+                    if line[:15].lower() == b"content-length:":
+                        length = int(line[15:])
+                await reader.readexactly(length)
+                latencies.append(time.perf_counter() - started)
+                if not head.startswith((b"HTTP/1.1 200", b"HTTP/1.1 400")):
+                    errors.append(head.split(b"\r\n", 1)[0].decode())
+        except (OSError, asyncio.IncompleteReadError) as e:
+            # Server closed the connection (e.g. after a 500); reconnect
+            errors.append(repr(e))
+        finally:
+            writer.close()
+
+
+def _client(port: int, route: str, connections: int, seconds: float, results):
+    method, path, body = ROUTES[route]
+    request = (
+        f"{method} {path} HTTP/1.1\r\nHost: bench\r\nContent-Type: application/json\r\n"
+        f"Content-Length: {len(body)}\r\n\r\n"
+    ).encode() + body
+
+    latencies, errors = [], []
+
+    async def run():
+        deadline = time.perf_counter() + seconds
+        await asyncio.gather(*(
+            _connection(port, request, deadline, latencies, errors) for _ in range(connections)
+        ))
+
+    asyncio.run(run())
+    results.put((latencies, errors[:5], len(errors)))
+
+
+def drive(port: int, route: str, clients: int, connections: int, seconds: float) -> dict:
+    context = multiprocessing.get_context("spawn")
+    results = context.Queue()
+    processes = [
+        context.Process(target=_client, args=(port, route, max(1, connections // clients), seconds, results))
+        for _ in range(clients)
+    ]
+    for p in processes:
+        p.start()
+
+    latencies, samples, errors = [], [], 0
+    for _ in processes:
+        client_latencies, client_samples, client_errors = results.get()
+        latencies += client_latencies
+        samples += client_samples
+        errors += client_errors
+    for p in processes:
+        p.join()
+
+    latencies.sort()
+    return {
+        "requests_per_second": round(len(latencies) / seconds, 1),
+        "p50_ms": round(percentile(latencies, 0.50) * 1000, 2),
+        "p99_ms": round(percentile(latencies, 0.99) * 1000, 2),
+        "errors": errors,
+        "error_samples": samples,
+    }
+
+
+# -------------------------------------------------------------
+# Server under test
+# -------------------------------------------------------------
+def start_server(workers: int, port: int, env: dict) -> subprocess.Popen:
+    server = subprocess.Popen(
+        [sys.executable, "-m", "app.serve"],
+        env={**env, "SERVER_WORKERS": str(workers), "SERVER_PORT": str(port)},
+    )
+    try:
+        _wait_for_port(port, timeout=60)
+        # Workers accept once their lifespan has finished; let all of them come up
+        time.sleep(1 + workers * 0.2)
+    except RuntimeError:
+        server.kill()
+        raise
+    return server
+
+
+def stop_server(server: subprocess.Popen):
+    server.terminate()
+    try:
+        server.wait(timeout=30)
+    except subprocess.TimeoutExpired:
+        server.kill()
+
+
+def start_fakeredis() -> str:
+    try:
+        from fakeredis import TcpFakeServer
+    except ImportError:
+        sys.exit("fakeredis is not installed: pip install fakeredis lupa, or pass --redis-url")
+
+    port = _free_port()
+    server = TcpFakeServer(("127.0.0.1", port))
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return f"redis://127.0.0.1:{port}"
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, os.cpu_count() or 1])
+    parser.add_argument("--routes", nargs="+", choices=tuple(ROUTES), default=list(ROUTES))
+    parser.add_argument("--seconds", type=float, default=10)
+    parser.add_argument("--connections", type=int, default=64)
+    parser.add_argument("--clients", type=int, default=4, help="load generator processes")
+    parser.add_argument("--redis-url", help="default: a fakeredis TCP server")
+    args = parser.parse_args()
+
+    routes = args.routes
+    if not args.redis_url and "verify" in routes:
+        print("verify needs --redis-url, running health only")
+        routes = [route for route in routes if route != "verify"]
+
+    database_url = f"sqlite+aiosqlite:///{tempfile.mkdtemp(prefix='serving-')}/account.db"
+    asyncio.run(_prepare_database(database_url))
+
+    env = {
+        **os.environ,
+        "DATABASE_URL": database_url,
+        "REDIS_URL": args.redis_url or start_fakeredis(),
+        "SERVER_HOST": "127.0.0.1",
+        "SERVER_STARTUP_JITTER_SECONDS": "0",
+        "SERVER_ACCESS_LOG": "false",
+        "RATE_LIMIT_ENABLED": "false",
+        "OUTBOX_RELAY_ENABLED": "false",
+        "TRACING_ENABLED": "false",
+        "LOG_LEVEL": "WARNING",
+    }
+    env.setdefault("JWT_SECRET", "benchmark-secret")
+    env.setdefault("API_IR_API_KEY", "benchmark-key")
+
+    print(f"{os.cpu_count()} CPUs, {args.clients} client processes, {args.connections} connections, {args.seconds:g}s per run")
+    print(f"{'route':<8} {'workers':>7} {'req/s':>10} {'p50 ms':>8} {'p99 ms':>8} {'errors':>7}")
+
+    baseline = {}
+    for workers in args.workers:
+        port = _free_port()
+        server = start_server(workers, port, env)
+        try:
+            for route in routes:
+                result = drive(port, route, args.clients, args.connections, args.seconds)
+                speedup = ""
+                if route in baseline:
+                    speedup = f"  ({result['requests_per_second'] / baseline[route]:.2f}x)"
+                else:
+                    baseline[route] = result["requests_per_second"]
+                print(
+                    f"{route:<8} {workers:>7} {result['requests_per_second']:>10.1f} "
+                    f"{result['p50_ms']:>8.2f} {result['p99_ms']:>8.2f} {result['errors']:>7}{speedup}"
+                )
+                if result["error_samples"]:
+                    print(f"         e.g. {result['error_samples'][0]}")
+        finally:
+            stop_server(server)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,177 @@
+"""
+Tests for app.utils.circuit_breaker and its use by ApiIrResource.
+
+Run from backend/services/account:
+    python -m pytest tests
+"""
+import time
+import asyncio
+from datetime import date
+
+import httpx
+import pytest
+
+from app.config.api_ir import ApiIrConfig
+from app.resources.api_ir import ApiIrResource
+from app.services.identity_validator.api_ir import ApiIrIdentityValidator
+from app.utils.circuit_breaker import CircuitBreaker, CircuitOpenError
+
+RESET_SECONDS = 0.05
+
+
+def _open(breaker: CircuitBreaker):
+    for _ in range(breaker.failure_threshold):
+        breaker.record_failure()
+
+
+def _wait_for_half_open():
+    time.sleep(RESET_SECONDS * 2)
+
+
+# -------------------------------------------------------------
+# CircuitBreaker
+# -------------------------------------------------------------
+def test_lifecycle_with_two_concurrent_calls():
+    async def run():
+        breaker = CircuitBreaker("test", failure_threshold=2, reset_timeout=RESET_SECONDS)
+        assert await breaker.before_call() is False
+
+        breaker.record_failure()
+        assert breaker.state == CircuitBreaker.CLOSED
+        breaker.record_failure()
+        assert breaker.state == CircuitBreaker.OPEN
+        with pytest.raises(CircuitOpenError):
+            await breaker.before_call()
+
+        _wait_for_half_open()
+        assert breaker.state == CircuitBreaker.HALF_OPEN
+
+        # The first call probes; the second waits for its verdict instead of failing
+        assert await breaker.before_call() is True
+        waiting = asyncio.create_task(breaker.before_call())
+        await asyncio.sleep(0)
+        assert not waiting.done()
+
+        breaker.record_success()
+        assert await waiting is False
+        assert breaker.state == CircuitBreaker.CLOSED
+        assert breaker.snapshot()["consecutive_failures"] == 0
+
+    asyncio.run(run())
+
+
+def test_failed_probe_reopens_and_rejects_waiting_calls():
+    async def run():
+        breaker = CircuitBreaker("test", failure_threshold=1, reset_timeout=RESET_SECONDS)
+        _open(breaker)
+        _wait_for_half_open()
+
+        assert await breaker.before_call() is True
+        waiting = asyncio.create_task(breaker.before_call())
+        await asyncio.sleep(0)
+
+        breaker.record_failure()
+        with pytest.raises(CircuitOpenError):
+            await waiting
+        assert breaker.state == CircuitBreaker.OPEN
+        assert breaker.snapshot()["rejected_calls"] == 1
+
+    asyncio.run(run())
+
+
+def test_released_probe_hands_over_to_a_waiting_call():
+    async def run():
+        breaker = CircuitBreaker("test", failure_threshold=1, reset_timeout=RESET_SECONDS)
+        _open(breaker)
+        _wait_for_half_open()
+
+        assert await breaker.before_call() is True
+        waiting = asyncio.create_task(breaker.before_call())
+        await asyncio.sleep(0)
+
+        breaker.release()
+        assert await waiting is True
+        assert breaker.state == CircuitBreaker.HALF_OPEN
+
+        breaker.record_success()
+        assert breaker.state == CircuitBreaker.CLOSED
+
+    asyncio.run(run())
+
+
+# -------------------------------------------------------------
+# ApiIrResource
+# -------------------------------------------------------------
+def _resource(handler) -> ApiIrResource:
+    resource = ApiIrResource(ApiIrConfig(
+        api_key="test",
+        max_retries=0,
+        breaker_failure_threshold=1,
+        breaker_reset_seconds=RESET_SECONDS,
+    ))
+    resource.client = httpx.AsyncClient(base_url="https://api.test", transport=httpx.MockTransport(handler))
+    return resource
+
+
+def _identity_handler(outage: list[bool]):
+    async def handler(request: httpx.Request) -> httpx.Response:
+        # Keeps both checks in flight at once, as against the real upstream
+        await asyncio.sleep(0.01)
+        if outage and outage.pop():
+            return httpx.Response(503)
+        if request.url.path.endswith("ShahkarLite"):
+            return httpx.Response(200, json={"success": True})
+        return httpx.Response(200, json={
+            "success": True,
+            "data": {"alive": True, "firstName": "Ali", "lastName": "Rezaei", "gender": 1},
+        })
+    return handler
+
+
+def test_identity_validation_closes_the_circuit_after_an_outage():
+    async def run():
+        resource = _resource(_identity_handler([True, True]))
+        validator = ApiIrIdentityValidator(resource)
+        try:
+            with pytest.raises(ValueError):
+                await validator.validate_identity("0012345678", date(1990, 1, 1), "9121234567")
+            assert resource.breaker.state == CircuitBreaker.OPEN
+
+            _wait_for_half_open()
+            # Both checks run concurrently; the one not probing must not cancel the probe
+            identity = await validator.validate_identity("0012345678", date(1990, 1, 1), "9121234567")
+            assert identity.first_name == "Ali"
+            assert resource.breaker.state == CircuitBreaker.CLOSED
+        finally:
+            await resource.client.aclose()
+
+    asyncio.run(run())
+
+
+def test_unexpected_error_does_not_keep_the_probe():
+    async def run():
+        calls = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            calls.append(request)
+            if len(calls) == 2:
+                raise RuntimeError("bug in a transport")
+            return httpx.Response(503 if len(calls) == 1 else 200, json={})
+
+        resource = _resource(handler)
+        try:
+            with pytest.raises(httpx.HTTPStatusError):
+                await resource.get("/ping")
+            _wait_for_half_open()
+
+            with pytest.raises(RuntimeError):
+                await resource.get("/ping")
+            assert resource.breaker.state == CircuitBreaker.HALF_OPEN
+
+            # The failed probe was released, so the next call may probe
+            assert await resource.get("/ping") == {}
+            assert resource.breaker.state == CircuitBreaker.CLOSED
+        finally:
+            await resource.client.aclose()
+
+    asyncio.run(run())
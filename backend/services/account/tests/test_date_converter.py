@@ -0,0 +1,166 @@
+"""
+Tests for app.utils.date_converter, checked day by day against jdatetime
+over the whole supported range (Jalali years MIN_YEAR..MAX_YEAR).
+
+Run from backend/services/account:
+    python -m pytest tests
+"""
+from datetime import date
+
+import jdatetime
+import numpy as np
+import pytest
+
+from app.utils.date_converter import (
+    MAX_YEAR,
+    MIN_YEAR,
+    gregorian_to_jalali,
+    gregorian_to_jalali_many,
+    is_jalali_leap,
+    jalali_to_gregorian,
+    jalali_to_gregorian_many,
+)
+
+
+def _month_length(jy: int, jm: int) -> int:
+    return 31 if jm <= 6 else 30 if jm <= 11 else 30 if jdatetime.date(jy, 1, 1).isleap() else 29
+
+
+@pytest.fixture(scope="module")
+def calendar():
+    """Every Jalali day in range, with the Gregorian date jdatetime gives for it."""
+    years, months, days, gregorian = [], [], [], []
+    for jy in range(MIN_YEAR, MAX_YEAR + 1):
+        for jm in range(1, 13):
+            for jd in range(1, _month_length(jy, jm) + 1):
+                years.append(jy)
+                months.append(jm)
+                days.append(jd)
+                gregorian.append(jdatetime.date(jy, jm, jd).togregorian())
+    return years, months, days, gregorian
+
+
+# -------------------------------------------------------------
+# Scalar API
+# -------------------------------------------------------------
+def test_leap_years_match_jdatetime():
+    mismatches = [
+        jy for jy in range(MIN_YEAR, MAX_YEAR + 1)
+        if is_jalali_leap(jy) != jdatetime.date(jy, 1, 1).isleap()
+    ]
+    assert mismatches == []
+
+
+def test_jalali_to_gregorian_every_day(calendar):
+    years, months, days, gregorian = calendar
+    mismatches = [
+        (jy, jm, jd) for jy, jm, jd, g in zip(years, months, days, gregorian)
+        if jalali_to_gregorian(f"{jy}/{jm}/{jd}") != g
+    ]
+    assert mismatches == []
+
+
+def test_gregorian_to_jalali_every_day(calendar):
+    years, months, days, gregorian = calendar
+    mismatches = [
+        g for jy, jm, jd, g in zip(years, months, days, gregorian)
+        if gregorian_to_jalali(g) != f"{jy}/{jm}/{jd}"
+    ]
+    assert mismatches == []
+
+
+def test_jalali_to_gregorian_accepts_both_separators():
+    assert jalali_to_gregorian("1403-01-01") == jalali_to_gregorian("1403/1/1") == date(2024, 3, 20)
+
+
+@pytest.mark.parametrize("value", ["1403/01", "1403/1/1/1", "", "1403/aa/01"])
+def test_jalali_to_gregorian_rejects_malformed_strings(value):
+    with pytest.raises(ValueError):
+        jalali_to_gregorian(value)
+
+
+@pytest.mark.parametrize("value", [
+    f"{MIN_YEAR - 1}/1/1",
+    f"{MAX_YEAR + 1}/1/1",
+    "1403/0/1",
+    "1403/13/1",
+    "1403/1/0",
+    "1403/1/32",
+    "1403/7/31",
+])
+def test_jalali_to_gregorian_rejects_invalid_dates(value):
+    with pytest.raises(ValueError):
+        jalali_to_gregorian(value)
+
+
+def test_esfand_30_only_in_leap_years():
+    for jy in range(MIN_YEAR, MAX_YEAR + 1):
+        if jdatetime.date(jy, 1, 1).isleap():
+            assert jalali_to_gregorian(f"{jy}/12/30") == jdatetime.date(jy, 12, 30).togregorian()
+        else:
+            with pytest.raises(ValueError):
+                jalali_to_gregorian(f"{jy}/12/30")
+
+
+@pytest.mark.parametrize("value", [
+    jdatetime.date(MIN_YEAR, 1, 1).togregorian().toordinal() - 1,
+    jdatetime.date(MAX_YEAR, 12, 29).togregorian().toordinal() + 2,
+])
+def test_gregorian_to_jalali_rejects_dates_out_of_range(value):
+    with pytest.raises(ValueError):
+        gregorian_to_jalali(date.fromordinal(value))
+
+
+# -------------------------------------------------------------
+# Vectorized API
+# -------------------------------------------------------------
+def test_jalali_to_gregorian_many_every_day(calendar):
+    years, months, days, gregorian = calendar
+    converted = jalali_to_gregorian_many(years, months, days)
+    assert converted.dtype == np.dtype("datetime64[D]")
+    np.testing.assert_array_equal(converted, np.array(gregorian, dtype="datetime64[D]"))
+
+
+def test_gregorian_to_jalali_many_every_day(calendar):
+    years, months, days, gregorian = calendar
+    jy, jm, jd = gregorian_to_jalali_many(np.array(gregorian, dtype="datetime64[D]"))
+    np.testing.assert_array_equal(jy, years)
+    np.testing.assert_array_equal(jm, months)
+    np.testing.assert_array_equal(jd, days)
+
+
+def test_jalali_to_gregorian_many_invalid_dates_are_nat():
+    years = [1403, 1402, 1402, MIN_YEAR - 1, MAX_YEAR + 1, 1403, 1403, 1403, 1403]
+    months = [12, 12, 1, 1, 1, 0, 13, 7, 1]
+    days = [30, 30, 1, 1, 1, 1, 1, 31, 0]
+    converted = jalali_to_gregorian_many(years, months, days)
+    expected = np.array(
+        ["2025-03-20", "NaT", "2023-03-21", "NaT", "NaT", "NaT", "NaT", "NaT", "NaT"],
+        dtype="datetime64[D]"
+    )
+    np.testing.assert_array_equal(converted, expected)
+
+
+def test_jalali_to_gregorian_many_empty():
+    converted = jalali_to_gregorian_many([], [], [])
+    assert converted.shape == (0,)
+    assert converted.dtype == np.dtype("datetime64[D]")
+
+
+def test_gregorian_to_jalali_many_accepts_dates():
+    jy, jm, jd = gregorian_to_jalali_many([date(2024, 3, 20), date(2025, 3, 20)])
+    assert (jy.tolist(), jm.tolist(), jd.tolist()) == ([1403, 1403], [1, 12], [1, 30])
+
+
+def test_gregorian_to_jalali_many_rejects_nat():
+    with pytest.raises(ValueError, match="NaT"):
+        gregorian_to_jalali_many(np.array(["2024-03-20", "NaT"], dtype="datetime64[D]"))
+
+
+@pytest.mark.parametrize("value", [
+    jdatetime.date(MIN_YEAR, 1, 1).togregorian().toordinal() - 1,
+    jdatetime.date(MAX_YEAR, 12, 29).togregorian().toordinal() + 2,
+])
+def test_gregorian_to_jalali_many_rejects_dates_out_of_range(value):
+    with pytest.raises(ValueError, match="out of range"):
+        gregorian_to_jalali_many([date(2024, 3, 20), date.fromordinal(value)])
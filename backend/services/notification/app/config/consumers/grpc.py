@@ -6,9 +6,10 @@ class GRPCConfig(ForbidExtraModel):
     host: str = "0.0.0.0"
     port: int = 50052
 
-    def to_settings(self, loop):
+    def to_settings(self, loop, reuse_port: bool = False):
         return GrpcConsumerSettings(
             host=self.host,
             port=self.port,
+            reuse_port=reuse_port,
             loop=loop
         )
\ No newline at end of file
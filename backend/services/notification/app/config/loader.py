@@ -5,6 +5,8 @@ from pydantic import BaseModel, ValidationError
 
 from .consumers.main import ConsumersConfig
 from .providers.main import ProvidersConfig
+from .tracing import TracingConfig
+from .server import ServerConfig
 
 
 # ============================================================
@@ -71,8 +73,10 @@ def _env_interpolate(value: any) -> any:
 
 class ServiceConfig(BaseModel):
     service: dict
+    server: ServerConfig
     consumers: ConsumersConfig
     providers: ProvidersConfig
+    tracing: TracingConfig
     logging: dict
 
     class Config:
@@ -0,0 +1,21 @@
+import os
+from ..models.base import ForbidExtraModel
+from pydantic import Field
+
+class ServerConfig(ForbidExtraModel):
+    host: str = "0.0.0.0"
+    port: int = 8000
+
+    # Worker processes behind one HTTP socket; 0 = one per CPU core.
+    # With more than one, every worker binds the gRPC port with SO_REUSEPORT
+    workers: int = Field(default=1, ge=0)
+    # Each pre-forked worker waits a random 0..N seconds before connecting
+    # to RabbitMQ, so they don't all connect at once
+    startup_jitter_seconds: float = Field(default=2, ge=0)
+
+    backlog: int = Field(default=2048, gt=0)
+    timeout_keep_alive_seconds: int = Field(default=5, gt=0)
+    access_log: bool = False
+
+    def worker_count(self) -> int:
+        return self.workers or os.cpu_count() or 1
@@ -0,0 +1,10 @@
+from ..models.base import ForbidExtraModel
+from pydantic import Field
+
+class TracingConfig(ForbidExtraModel):
+    enabled: bool = False
+    # otlp (gRPC collector) or memory (kept in-process, for tests)
+    exporter: str = Field(default="otlp", pattern="^(otlp|memory)$")
+    otlp_endpoint: str = "http://localhost:4317"
+    # Fraction of new traces recorded; incoming traces keep the producer's decision
+    sample_ratio: float = Field(default=0.1, ge=0, le=1)
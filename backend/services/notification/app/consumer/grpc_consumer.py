@@ -1,12 +1,17 @@
+import os
 import json
+import uuid
 import grpc
+from opentelemetry.trace import SpanKind, StatusCode
 from typing import Callable, Awaitable, Optional
 
 from .base import BaseConsumer
 from ..models.consumers.grpc import GrpcConsumerSettings
-from ..models.notification_message.union import NotificationMessage
+from ..models.notification_message.union import NotificationMessage, NotificationMessageAdapter
 from ..proto import notification_pb2_grpc, notification_pb2
-from ..utils.log import Log
+from ..utils.log import Log, log_context
+from ..utils.metrics import CONSUMER_MESSAGES
+from ..utils.tracing import tracer, extract_context, current_trace_id
 
 class GrpcConsumer(BaseConsumer[GrpcConsumerSettings]):
     """
@@ -25,7 +30,10 @@ class GrpcConsumer(BaseConsumer[GrpcConsumerSettings]):
     async def start(self) -> None:
         """Start gRPC server and listen for incoming notifications."""
 
-        self.__server = grpc.aio.server()
+        # gRPC enables SO_REUSEPORT by default; only pre-forked workers want it
+        self.__server = grpc.aio.server(
+            options=[("grpc.so_reuseport", 1 if self.settings.reuse_port else 0)]
+        )
 
         # Register service
         notification_pb2_grpc.add_NotificationServiceServicer_to_server(
@@ -34,9 +42,10 @@ class GrpcConsumer(BaseConsumer[GrpcConsumerSettings]):
         )
 
         listen_addr: str = f"{self.settings.host}:{self.settings.port}"
-        self.__server.add_insecure_port(listen_addr)
+        if not self.__server.add_insecure_port(listen_addr):
+            raise RuntimeError(f"Could not bind gRPC port {listen_addr}")
 
-        Log.info(f"[GrpcConsumer] gRPC listening on {listen_addr}")
+        Log.info(f"[GrpcConsumer] gRPC listening on {listen_addr} (pid {os.getpid()})")
 
         await self.__server.start()
 
@@ -59,6 +68,7 @@ class GrpcConsumer(BaseConsumer[GrpcConsumerSettings]):
             callback: Callable[[NotificationMessage], Awaitable[None]]
         ) -> None:
             self.__callback = callback
+            self.__metrics = CONSUMER_MESSAGES.labels("grpc")
 
         async def SendNotification(
             self,
@@ -66,19 +76,35 @@ class GrpcConsumer(BaseConsumer[GrpcConsumerSettings]):
             context: grpc.aio.ServicerContext
         ) -> notification_pb2.Ack:
 
-            try:
-                # Convert JSON → dict
-                raw_dict = json.loads(request.payload_json)
-
-                # Validate + cast dict → NotificationMessage
-                notif_message: NotificationMessage = NotificationMessage.model_validate(raw_dict)
-
-                # Call notification dispatcher / handler
-                await self.__callback(notif_message)
-
-                success = True
-            except Exception as e:
-                Log.info(f"[GrpcConsumer] Error processing gRPC notification: {e}")
-                success = False
+            metadata = dict(context.invocation_metadata() or ())
+            message_id = metadata.get("x-request-id") or uuid.uuid4().hex
+
+            with (
+                # Continues the caller's trace from the traceparent metadata
+                tracer.start_as_current_span(
+                    "NotificationService/SendNotification",
+                    context=extract_context(metadata),
+                    kind=SpanKind.SERVER,
+                    attributes={"rpc.system": "grpc", "rpc.service": "NotificationService"},
+                ) as span,
+                log_context(message_id=message_id, trace_id=current_trace_id()),
+            ):
+                try:
+                    with self.__metrics.track():
+                        # Convert JSON → dict
+                        raw_dict = json.loads(request.payload_json)
+
+                        # Validate + cast dict → NotificationMessage
+                        notif_message: NotificationMessage = NotificationMessageAdapter.validate_python(raw_dict)
+
+                        # Call notification dispatcher / handler
+                        await self.__callback(notif_message)
+
+                    success = True
+                except Exception as e:
+                    Log.error(f"[GrpcConsumer] Error processing gRPC notification: {e}")
+                    span.record_exception(e)
+                    span.set_status(StatusCode.ERROR, str(e))
+                    success = False
 
             return notification_pb2.Ack(success=success)
\ No newline at end of file
@@ -1,11 +1,16 @@
 import json
+import uuid
 import aio_pika
+from datetime import datetime, timezone
+from opentelemetry.trace import SpanKind, StatusCode
 from typing import Callable, Awaitable
 
 from .base import BaseConsumer
 from ..models.consumers.rabbit import RabbitConsumerSettings
-from ..models.notification_message.union import NotificationMessage
-from ..utils.log import Log
+from ..models.notification_message.union import NotificationMessage, NotificationMessageAdapter
+from ..utils.log import Log, log_context
+from ..utils.metrics import CONSUMER_MESSAGES
+from ..utils.tracing import tracer, extract_context, current_trace_id
 
 class RabbitConsumer(BaseConsumer[RabbitConsumerSettings]):
     """
@@ -20,6 +25,7 @@ class RabbitConsumer(BaseConsumer[RabbitConsumerSettings]):
         self._connection: aio_pika.RobustConnection | None = None
         self._channel: aio_pika.RobustChannel | None = None
         self._queue: aio_pika.RobustQueue | None = None
+        self._metrics = CONSUMER_MESSAGES.labels("rabbitmq")
 
     async def start(self):
         """Establish connection and start listening."""
@@ -48,18 +54,47 @@ class RabbitConsumer(BaseConsumer[RabbitConsumerSettings]):
         )
 
     async def _on_message(self, message: aio_pika.IncomingMessage):
+        message_id = message.message_id or uuid.uuid4().hex
+
+        attributes = {
+            "messaging.system": "rabbitmq",
+            "messaging.destination.name": self.settings.queue_name,
+            "messaging.message.id": message_id,
+        }
+        if message.timestamp is not None:
+            # Time the message spent queued (producer clock, second resolution)
+            sent_at = message.timestamp
+            if sent_at.tzinfo is None:
+                sent_at = sent_at.replace(tzinfo=timezone.utc)
+            attributes["messaging.queue_wait_ms"] = max(
+                0, int((datetime.now(timezone.utc) - sent_at).total_seconds() * 1000)
+            )
+
         async with message.process(requeue=False):
-            try:
-                raw_body = message.body.decode()
-                data = json.loads(raw_body)
+            with (
+                # Continues the producer's trace from the AMQP headers
+                tracer.start_as_current_span(
+                    f"{self.settings.queue_name} process",
+                    context=extract_context(message.headers),
+                    kind=SpanKind.CONSUMER,
+                    attributes=attributes,
+                ) as span,
+                log_context(message_id=message_id, trace_id=current_trace_id()),
+            ):
+                try:
+                    with self._metrics.track():
+                        raw_body = message.body.decode()
+                        data = json.loads(raw_body)
 
-                notif_message: NotificationMessage  = NotificationMessage.model_validate(data)
+                        notif_message: NotificationMessage  = NotificationMessageAdapter.validate_python(data)
 
-                # Forward to dispatcher/handler logic
-                await self.callback(notif_message)
+                        # Forward to dispatcher/handler logic
+                        await self.callback(notif_message)
 
-            except Exception as e:
-                Log.error(f"[RabbitConsumer] Error processing message: {e}")
+                except Exception as e:
+                    Log.error(f"[RabbitConsumer] Error processing message: {e}")
+                    span.record_exception(e)
+                    span.set_status(StatusCode.ERROR, str(e))
                 # message will not be requeued because of requeue=False
                 # you may add a dead-letter exchange in Rabbit settings
 
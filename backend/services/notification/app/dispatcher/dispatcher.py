@@ -1,5 +1,7 @@
 from typing import Dict, Type
 from ..utils.log import Log
+from ..utils.metrics import DISPATCHES
+from ..utils.tracing import tracer
 from ..models.notification_message.message_base import BaseNotificationMessage
 from .handlers.base import HandlerInterface
 
@@ -48,15 +50,18 @@ class NotificationDispatcher:
 
         msg_type = type(message)
         handler = self._registry.get(msg_type)
+        metrics = DISPATCHES.labels(msg_type.__name__)
 
         if handler is None:
+            metrics.observe(0.0, "unhandled")
             Log.error(
                 f"❌ No handler registered for message type: {msg_type.__name__}"
             )
             return
 
         try:
-            await handler.handle(message)
+            with metrics.track(), tracer.start_as_current_span(f"dispatch {msg_type.__name__}"):
+                await handler.handle(message)
         except Exception as e:
             Log.error(
                 f"❌ Handler failure for {msg_type.__name__}: {e}"
@@ -1,9 +1,12 @@
 from typing import Sequence, Generic, TypeVar
+from opentelemetry.trace import SpanKind
 from abc import ABC, abstractmethod
 
 from ..providers.base import ProviderInterface
 from ...models.notification_message.message_base import BaseNotificationMessage
 from ...utils.log import Log
+from ...utils.metrics import PROVIDER_SENDS
+from ...utils.tracing import tracer
 
 M = TypeVar("M", bound=BaseNotificationMessage)
 P = TypeVar("P", bound=ProviderInterface[M])
@@ -38,8 +41,13 @@ class HandlerInterface(ABC, Generic[P, M]):
 
         for provider in self.providers:
             try:
-                await provider.send(message)
-                Log.success(
+                provider_name = provider.__class__.__name__
+                with (
+                    PROVIDER_SENDS.labels(provider_name).track(),
+                    tracer.start_as_current_span(f"send {provider_name}", kind=SpanKind.CLIENT),
+                ):
+                    await provider.send(message)
+                Log.debug(
                     f"[{self.__class__.__name__}] "
                     f"{provider.__class__.__name__} succeeded"
                 )
@@ -39,7 +39,7 @@ class SMTPProvider(EmailProvider):
         email["Subject"] = message.data.subject
         email.set_content(message.data.body)
 
-        Log.info(
+        Log.debug(
             f"[SMTPProvider] Sending email → {message.data.to} "
             f"(subject='{message.data.subject}')"
         )
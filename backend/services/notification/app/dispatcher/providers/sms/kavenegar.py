@@ -40,7 +40,7 @@ class KavenegarProvider(ProviderInterface[SMSNotificationMessage]):
             "message": body,
         }
 
-        Log.info(f"[KavenegarProvider] Sending SMS → {phone}")
+        Log.debug(f"[KavenegarProvider] Sending SMS → {phone}")
 
         try:
             async with httpx.AsyncClient(timeout=self.timeout) as client:
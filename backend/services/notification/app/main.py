@@ -1,8 +1,10 @@
 import os
+import random
 import asyncio
 from pathlib import Path
 from contextlib import asynccontextmanager
 from fastapi import FastAPI
+from fastapi.responses import Response
 from dotenv import load_dotenv
 
 from .dispatcher.registry import create_handler_registry
@@ -12,7 +14,9 @@ from .consumer.rabbit_consumer import RabbitConsumer
 from .consumer.grpc_consumer import GrpcConsumer
 
 from .config.loader import load_service_config
-from .utils.log import Log
+from .utils.log import Log, configure_logging, shutdown_logging
+from .utils import metrics
+from .utils.tracing import configure_tracing, shutdown_tracing
 
 # Load environment variables from .env file
 env_path = Path(__file__).resolve().parent.parent.parent / ".env"
@@ -33,6 +37,17 @@ async def lifespan(app: FastAPI):
     # -------------------------------
     config = load_service_config()
 
+    configure_logging(
+        level=config.logging.get("level", "INFO"),
+        fmt=config.logging.get("format", "json")
+    )
+    configure_tracing(config.tracing, service_version=str(config.service.get("version", "1.0.0")))
+
+    # Pre-forked workers boot together; spread out their connection attempts
+    workers = config.server.worker_count()
+    if workers > 1 and config.server.startup_jitter_seconds:
+        await asyncio.sleep(random.uniform(0, config.server.startup_jitter_seconds))
+
     loop = asyncio.get_event_loop()
     dispatcher = NotificationDispatcher()
 
@@ -52,7 +67,8 @@ async def lifespan(app: FastAPI):
     if config.consumers.grpc.enabled:
         grpc_settings = config.consumers.grpc
         grpc_consumer = GrpcConsumer(
-            settings=grpc_settings.to_settings(loop),
+            # Every worker serves the same gRPC port; the kernel spreads connections
+            settings=grpc_settings.to_settings(loop, reuse_port=workers > 1),
             callback=dispatcher.dispatch
         )
         consumers.append(grpc_consumer)
@@ -111,7 +127,10 @@ async def lifespan(app: FastAPI):
 
     await asyncio.gather(*[c.close() for c in consumers])
 
+    shutdown_tracing()
+    metrics.mark_worker_stopped()
     Log.success("👋 Notification service shutdown complete.")
+    shutdown_logging()
 
 
 # ---------------------------------------------------------
@@ -132,3 +151,8 @@ async def health():
         "status": "ok",
         "service": "notification",
     }
+
+@app.get("/metrics", tags=["health"], include_in_schema=False)
+async def prometheus_metrics():
+    body, content_type = metrics.render()
+    return Response(content=body, media_type=content_type)
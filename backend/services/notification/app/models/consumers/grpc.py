@@ -3,3 +3,6 @@ from .base import BaseConsumerSettings
 class GrpcConsumerSettings(BaseConsumerSettings):
     host: str = "0.0.0.0"
     port: int = 50052
+    # Share the port with the other workers (SO_REUSEPORT); when off, a
+    # port already in use fails startup instead of being silently shared
+    reuse_port: bool = False
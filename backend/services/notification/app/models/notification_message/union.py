@@ -1,5 +1,5 @@
 from typing import Annotated, Union
-from pydantic import Field
+from pydantic import Field, TypeAdapter
 
 from .email.message import EmailNotificationMessage
 from .sms.message import SMSNotificationMessage
@@ -8,3 +8,6 @@ NotificationMessage = Annotated[
     Union[EmailNotificationMessage, SMSNotificationMessage],
     Field(discriminator="type")
 ]
+
+# NotificationMessage is a plain annotated union (no model_validate); validate through this
+NotificationMessageAdapter = TypeAdapter(NotificationMessage)
@@ -0,0 +1,76 @@
+"""
+Production entrypoint for the notification service.
+
+Runs the app under uvicorn with uvloop and httptools when they are
+installed (they come with uvicorn[standard]). With server.workers > 1 the
+master binds the port once and pre-forks that many workers sharing the
+socket. It restarts any worker that dies. Each worker runs its own
+lifespan, after a random startup delay (server.startup_jitter_seconds).
+The gRPC port is bound by every worker with SO_REUSEPORT, so the kernel
+spreads gRPC connections over them as well.
+
+Usage (from backend/services/notification):
+    SERVER_WORKERS=4 python -m app.serve
+"""
+import os
+import glob
+import tempfile
+import importlib.util
+from pathlib import Path
+
+import uvicorn
+from dotenv import load_dotenv
+
+from .config.loader import load_service_config
+
+# Load environment variables the same way the service does
+env_path = Path(__file__).resolve().parent.parent / ".env"
+if env_path.exists():
+    load_dotenv(env_path)
+else:
+    root_env = Path(__file__).resolve().parent.parent.parent.parent.parent / ".env"
+    if root_env.exists():
+        load_dotenv(root_env)
+
+
+def _installed(module: str) -> bool:
+    return importlib.util.find_spec(module) is not None
+
+
+def prepare_multiprocess_metrics():
+    """
+    Points prometheus_client at a shared directory, so GET /metrics on any
+    worker reports the sum over all of them. Must run before the workers
+    import prometheus_client; the directory is emptied of earlier runs.
+    """
+    directory = os.environ.get("PROMETHEUS_MULTIPROC_DIR")
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+        for path in glob.glob(os.path.join(directory, "*.db")):
+            os.remove(path)
+    else:
+        os.environ["PROMETHEUS_MULTIPROC_DIR"] = tempfile.mkdtemp(prefix="notification-metrics-")
+
+
+def main():
+    settings = load_service_config().server
+    workers = settings.worker_count()
+
+    if workers > 1:
+        prepare_multiprocess_metrics()
+
+    uvicorn.run(
+        "app.main:app",
+        host=settings.host,
+        port=settings.port,
+        workers=workers,
+        loop="uvloop" if _installed("uvloop") else "asyncio",
+        http="httptools" if _installed("httptools") else "h11",
+        backlog=settings.backlog,
+        timeout_keep_alive=settings.timeout_keep_alive_seconds,
+        access_log=settings.access_log,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,162 @@
+import os
+import time
+from prometheus_client import (
+    CollectorRegistry,
+    Gauge,
+    Histogram,
+    generate_latest,
+    multiprocess,
+    CONTENT_TYPE_LATEST,
+)
+
+# -------------------------------------------------------------
+# Prometheus metrics for the notification service
+#
+# Every metric lives in a service-local registry rendered by GET /metrics.
+# Hot paths record through pre-bound children (see Operation), so a
+# recording is an inc/observe without any label lookup.
+#
+# Under python -m app.serve with several workers, PROMETHEUS_MULTIPROC_DIR
+# is set: every worker writes its values there and /metrics reports the
+# sum over all live workers, whichever worker serves the scrape.
+# -------------------------------------------------------------
+NAMESPACE = "notification"
+
+REGISTRY = CollectorRegistry()
+
+# 0.5 ms .. 10 s: covers in-process dispatch up to slow SMTP / SMS providers
+LATENCY_BUCKETS = (
+    0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05,
+    0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0,
+)
+
+
+class _Tracked:
+    __slots__ = ("_operation", "_started")
+
+    def __init__(self, operation: "Operation"):
+        self._operation = operation
+
+    def __enter__(self):
+        self._operation.in_flight.inc()
+        self._started = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        operation = self._operation
+        operation.in_flight.dec()
+        operation.observe(time.perf_counter() - self._started, "ok" if exc_type is None else "error")
+        return False
+
+
+class Operation:
+    """
+    One labelled series of an OperationMetrics: its in-flight gauge and
+    one latency histogram child per outcome, resolved once and reused.
+    """
+
+    __slots__ = ("_metrics", "_values", "_outcomes", "in_flight")
+
+    def __init__(self, metrics: "OperationMetrics", values: tuple):
+        self._metrics = metrics
+        self._values = values
+        self._outcomes = {}
+        in_flight = metrics.in_flight
+        self.in_flight = in_flight.labels(*values) if values and in_flight is not None else in_flight
+
+    def observe(self, seconds: float, outcome: str = "ok"):
+        child = self._outcomes.get(outcome)
+        if child is None:
+            child = self._outcomes[outcome] = self._metrics.latency.labels(*self._values, outcome)
+        child.observe(seconds)
+
+    def track(self) -> _Tracked:
+        """
+        Context manager timing the block: counts it in flight while it
+        runs, then records ok, or error when it raises.
+        """
+        return _Tracked(self)
+
+
+class OperationMetrics:
+    """
+    Request rate, error count, latency and in-flight gauge of one kind of
+    operation, as two Prometheus metrics:
+
+        <name>_duration_seconds{<labels>, <outcome_label>}  histogram
+        <name>_in_flight{<labels>}                          gauge
+
+    Rates and error counts come from the histogram's _count series. Pass
+    in_flight=False where the labels are only known once the operation
+    ends; Operation.track() needs the gauge.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: tuple[str, ...] = (),
+        outcome_label: str = "outcome",
+        buckets: tuple[float, ...] = LATENCY_BUCKETS,
+        in_flight: bool = True
+    ):
+        self.latency = Histogram(
+            f"{name}_duration_seconds",
+            documentation,
+            (*labelnames, outcome_label),
+            namespace=NAMESPACE,
+            buckets=buckets,
+            registry=REGISTRY,
+        )
+        self.in_flight = Gauge(
+            f"{name}_in_flight",
+            f"{documentation} (currently running)",
+            labelnames,
+            namespace=NAMESPACE,
+            registry=REGISTRY,
+            multiprocess_mode="livesum",
+        ) if in_flight else None
+        self._operations: dict[tuple, Operation] = {}
+
+    def labels(self, *values: str) -> Operation:
+        operation = self._operations.get(values)
+        if operation is None:
+            operation = self._operations[values] = Operation(self, values)
+        return operation
+
+
+# -------------------------------------------------------------
+# Metrics
+# -------------------------------------------------------------
+CONSUMER_MESSAGES = OperationMetrics(
+    "consumer_message",
+    "Messages received and processed by a consumer",
+    ("consumer",),
+)
+
+DISPATCHES = OperationMetrics(
+    "dispatch",
+    "Notifications dispatched to a handler",
+    ("message_type",),
+)
+
+PROVIDER_SENDS = OperationMetrics(
+    "provider_send",
+    "Send attempts through a provider (fallbacks included)",
+    ("provider",),
+)
+
+
+def render() -> tuple[bytes, str]:
+    """Returns the Prometheus text exposition and its content type."""
+    if "PROMETHEUS_MULTIPROC_DIR" in os.environ:
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+        return generate_latest(registry), CONTENT_TYPE_LATEST
+    return generate_latest(REGISTRY), CONTENT_TYPE_LATEST
+
+
+def mark_worker_stopped():
+    """Drops this worker's in-flight gauges from the multi-process totals."""
+    if "PROMETHEUS_MULTIPROC_DIR" in os.environ:
+        multiprocess.mark_process_dead(os.getpid())